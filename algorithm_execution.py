@@ -4,12 +4,38 @@ Handles running algorithms and playing back events
 """
 
 import time
+from functools import wraps
 from tkinter import messagebox
-from typing import Callable, List
-from core_algorithms import AlgorithmEvent
+from typing import Callable, List, Dict, Iterator, Tuple, Optional
+from core_algorithms import (AlgorithmEvent, EventTrace, BareTimer, EmissionPolicy,
+                             OperationCounters, AlgorithmCore, SearchCore, TraceCache,
+                             PersistentTraceCache)
 from ui_rendering import AnimationPlayer
 from ui_rendering import AnimationPlayer, THEME
 
+
+def exclusive_run(method):
+    """
+    Make a handler method the only run in progress (AlgorithmExecutor
+    run_in_progress) from start to the end of its bookkeeping
+    
+    Playback keeps the Tk event loop live, so another run started while
+    one plays is ignored instead of nesting inside it, and closing the
+    window waits for the flag rather than for the animation.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        executor = self.app.executor
+        if executor.run_in_progress:
+            return None
+        executor.run_in_progress = True
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            executor.run_in_progress = False
+    return wrapper
+
+
 class AlgorithmExecutor:
     """Handles algorithm execution with timing and history"""
     
@@ -19,14 +45,80 @@ class AlgorithmExecutor:
             app_ref: Reference to main AlgorithmVisualizer instance
         """
         self.app = app_ref
+        self.trace_cache = TraceCache(store=PersistentTraceCache())
+        self.run_in_progress = False  # set by exclusive_run methods
+    
+    def stop_animation(self):
+        """Stop the animation that is playing, if any"""
+        player = self.app.current_player
+        if player is not None and player.is_running():
+            player.stop()
+    
+    @staticmethod
+    def _timed(events: Iterator[AlgorithmEvent], timing: Dict[str, float]):
+        """Pass events through, adding time spent generating them to timing['elapsed']"""
+        iterator = iter(events)
+        while True:
+            start_time = time.perf_counter()
+            event = next(iterator, None)
+            timing["elapsed"] += time.perf_counter() - start_time
+            if event is None:
+                return
+            yield event
+    
+    def _play(self, player: AnimationPlayer, events, initial: List[int],
+              speed: float, setup_time: float,
+              policy: Optional[EmissionPolicy] = None,
+              counters: Optional[OperationCounters] = None
+              ) -> Optional[Tuple[EventTrace, float]]:
+        """
+        Play a trace or a live event generator
+        
+        Returns:
+            (complete EventTrace, time spent generating events), or None
+            if playback was stopped (the run is discarded, and a generator
+            is not run to completion)
+        """
+        if isinstance(events, EventTrace):
+            player.play_events(events, speed)
+            return None if player.stopped else (events, setup_time)
+        
+        if isinstance(events, list):
+            trace = EventTrace.from_events(initial, events, policy=policy,
+                                           counters=counters)
+            player.play_events(trace, speed)
+            return None if player.stopped else (trace, setup_time)
+        
+        # Generator: drawing starts with the first event, not the last
+        trace = EventTrace(initial, policy=policy, counters=counters)
+        timing = {"elapsed": setup_time}
+        stream = self._timed(events, timing)
+        player.play_stream(stream, initial, speed, trace=trace)
+        if player.stopped:
+            stream.close()
+            return None
+        
+        return trace, timing["elapsed"]
+    
+    @staticmethod
+    def _time_bare(algorithm_func: Callable, *args, **options) -> Optional[float]:
+        """Time the algorithm's event-free path (None if it has none)"""
+        bare_func = BareTimer.find_bare(algorithm_func)
+        if bare_func is None:
+            return None
+        return BareTimer.time_bare(bare_func, *args, **options)
     
-    def run_sorting_algorithm(self, name: str, algorithm_func: Callable):
+    @exclusive_run
+    def run_sorting_algorithm(self, name: str, algorithm_func: Callable, **options):
         """
         Run a sorting algorithm with event playback
         
         Args:
             name: Algorithm name
-            algorithm_func: Function that returns list of AlgorithmEvent
+            algorithm_func: Function returning an event generator,
+                an EventTrace or a list of AlgorithmEvent
+            **options: algorithm options (e.g. pivot for quick sort),
+                passed to both the traced and the bare path
         """
         if not self.app.data:
             messagebox.showwarning("No Data", "Please generate data first.")
@@ -37,45 +129,79 @@ class AlgorithmExecutor:
         self.app.sort_message.config(text="Starting...")
         self.app.root.update()
         
-        # Generate events
-        start_time = time.time()
-        events = algorithm_func(self.app.data.copy())
-        end_time = time.time()
+        input_data = self.app.data.copy()
         
-        execution_time = end_time - start_time
+        # Emission policy is applied inside the algorithm, so filtered
+        # events are never built; operation counts are gathered either way
+        policy = self.app.get_emission_policy()
+        counters = OperationCounters()
         
-        # Update execution times
-        self.app.execution_times[name] = execution_time
+        # Generate events, or replay the trace of an identical earlier run
+        cache_key = TraceCache.key(name, input_data, policy, **options)
+        cached = self.trace_cache.get(cache_key)
+        start_time = time.time()
+        if cached is None:
+            events = algorithm_func(self.app.data.copy(), policy=policy,
+                                    counters=counters, **options)
+        else:
+            events = cached[0]
+        end_time = time.time()
         
         # Create animation player
         def update_callback(event, index, total):
+            step = f"{index+1}/{total}" if total else f"{index+1}"
             self.app.sort_message.config(text=event.message)
             self.app.sort_status.config(
-                text=f"{name.upper()} - Step {index+1}/{total}"
+                text=f"{name.upper()} - Step {step}"
             )
-            try:
-                self.app.root.update_idletasks()
-                self.app.root.update()
-            except:
-                pass
         
         player = AnimationPlayer(
             self.app.sort_visualizer, 
-            update_callback
+            update_callback,
+            self.app.root
         )
         
         # Play animation
         self.app.current_player = player
-        player.play_events(events, self.app.sort_speed.get())
+        played = self._play(
+            player, events, self.app.data,
+            self.app.sort_speed.get(), end_time - start_time, policy, counters
+        )
+        if played is None:
+            self.app.sort_status.config(text=f"{name.upper()} STOPPED")
+            self.app.sort_message.config(text="Stopped - run discarded")
+            return
+        events, trace_time = played
+        if cached is None:
+            self.trace_cache.put(cache_key, events, trace_time)
+        else:
+            trace_time = cached[1]
+        
+        # Time the sort itself, without event allocation
+        self.app.sort_status.config(text=f"TIMING {name.upper()}...")
+        self.app.root.update()
+        bare_time = self._time_bare(algorithm_func, input_data, **options)
+        execution_time = bare_time if bare_time is not None else trace_time
+        
+        # Update execution times
+        self.app.execution_times[name] = execution_time
+        self.app.trace_times[name] = trace_time
+        counters = events.counters or counters
+        self.app.operation_counts[name] = counters.to_dict()
         
-        # Update final data
-        if events and events[-1].data_snapshot:
-            self.app.data = events[-1].data_snapshot.copy()
+        self.app.last_trace = (name, events)
+        
+        # Update final data (kept by the trace, no replay needed)
+        if len(events):
+            self.app.data = events.final_data
             self.app.update_array_display(self.app.data)
         
         # Update status
+        policy = events.policy or EmissionPolicy()
         self.app.sort_status.config(
-            text=f"{name.upper()} COMPLETED IN {execution_time:.4f}S"
+            text=f"{name.upper()} COMPLETED IN {execution_time:.2e}S "
+                 f"(TRACE {trace_time:.4f}S{' CACHED' if cached else ''}, "
+                 f"{policy.describe()}) | {self.trace_cache.describe()}"
         )
         self.app.sort_message.config(text="✓ Complete")
         
@@ -84,16 +210,23 @@ class AlgorithmExecutor:
             algorithm=name,
             data=self.app.data.copy(),
             execution_time=execution_time,
-            size=len(self.app.data)
+            trace_time=trace_time,
+            size=len(self.app.data),
+            policy=policy.to_dict(),
+            counters=counters.to_dict(),
+            options=options
         )
     
-    def run_search_algorithm(self, name: str, algorithm_func: Callable):
+    @exclusive_run
+    def run_search_algorithm(self, name: str, algorithm_func: Callable, **options):
         """
         Run a search algorithm with event playback
         
         Args:
             name: Algorithm name
-            algorithm_func: Function that returns list of AlgorithmEvent
+            algorithm_func: Function returning an event generator,
+                an EventTrace or a list of AlgorithmEvent
+            **options: Passed to the search, e.g. mode="range"
         """
         if not self.app.search_array:
             messagebox.showwarning("No Data", "Please generate search data first.")
@@ -110,54 +243,108 @@ class AlgorithmExecutor:
             messagebox.showerror("Invalid Target", "Please enter a valid integer.")
             return
         
+        # Bound modes answer a different question, so they are kept apart
+        # from plain searches in the history and comparison chart
+        mode = options.get("mode", "first")
+        if mode != "first":
+            name = f"{name} [{mode}]"
+        
         # Update status
         self.app.search_status.config(text=f"RUNNING {name.upper()}...")
         self.app.search_message.config(text="Starting search...")
         self.app.root.update()
         
-        # Generate events
+        # Layout searches build their layout once: its cost goes into the
+        # counters and build_time, and the query timing reuses it
+        counters = OperationCounters()
+        run_options = dict(options)
+        build_time = None
+        builder = SearchCore.find_layout_builder(algorithm_func)
+        if builder is not None:
+            run_options["layout"] = builder(self.app.search_array, counters)
+            build_time = BareTimer.time_bare(builder, self.app.search_array)
+        
+        # Auto search picks its strategy from a sample of the array; the
+        # same (deterministic) choice is shown in the status
+        strategy = ""
+        if algorithm_func is SearchCore.iter_auto_search:
+            method, score = SearchCore.choose_search(self.app.search_array)
+            strategy = f" VIA {method.replace('_', ' ').upper()} (UNIFORMITY {score:.2f})"
+        
+        # Generate events, or replay the trace of an identical earlier run
+        cache_key = TraceCache.key(name, self.app.search_array, target=target, **options)
+        cached = self.trace_cache.get(cache_key)
         start_time = time.time()
-        events = algorithm_func(self.app.search_array, target)
+        if cached is None:
+            events = algorithm_func(self.app.search_array, target, counters=counters,
+                                    **run_options)
+        else:
+            events = cached[0]
         end_time = time.time()
         
-        execution_time = end_time - start_time
-        
         # Create animation player
         def update_callback(event, index, total):
+            step = f"{index+1}/{total}" if total else f"{index+1}"
             self.app.search_message.config(text=event.message)
             self.app.search_status.config(
-                text=f"{name.upper()} - Step {index+1}/{total}"
+                text=f"{name.upper()} - Step {step}"
             )
-            try:
-                self.app.root.update_idletasks()
-                self.app.root.update()
-            except:
-                pass
         
         player = AnimationPlayer(
             self.app.search_visualizer,
-            update_callback
+            update_callback,
+            self.app.root
         )
         
         # Play animation
         self.app.current_player = player
-        player.play_events(events, 0.5)
+        played = self._play(
+            player, events, self.app.search_array, 0.5, end_time - start_time,
+            counters=counters
+        )
+        if played is None:
+            self.app.search_status.config(text=f"{name.upper()} STOPPED")
+            self.app.search_message.config(text="Stopped - run discarded")
+            return
+        events, trace_time = played
+        if cached is None:
+            self.trace_cache.put(cache_key, events, trace_time)
+        else:
+            trace_time = cached[1]
+        counters = events.counters or counters
         
-        # Determine result
-        result_index = -1
+        # Time the search itself, without event allocation
+        bare_time = self._time_bare(algorithm_func, self.app.search_array, target,
+                                    **run_options)
+        execution_time = bare_time if bare_time is not None else trace_time
+        
+        # Determine result (a range search finds every index of the target)
+        result_index, count = -1, 0
         if events:
             last_event = events[-1]
             if last_event.indices and last_event.event_type.value == "found":
                 result_index = last_event.indices[0]
+                count = len(last_event.indices)
         
         # Update status
-        if result_index != -1:
+        cache_note = " CACHED" if cached else ""
+        if mode == "range" and count:
+            self.app.search_status.config(
+                text=f"FOUND {target} x{count} AT [{result_index}:{result_index + count}] "
+                     f"IN {execution_time:.2e}S{strategy} (TRACE {trace_time:.4f}S{cache_note})"
+                     f" | {self.trace_cache.describe()}"
+            )
+        elif result_index != -1:
             self.app.search_status.config(
-                text=f"FOUND {target} AT INDEX {result_index} IN {execution_time:.4f}S"
+                text=f"FOUND {target} AT INDEX {result_index} IN {execution_time:.2e}S"
+                     f"{strategy} (TRACE {trace_time:.4f}S{cache_note})"
+                     f" | {self.trace_cache.describe()}"
             )
         else:
             self.app.search_status.config(
-                text=f"{target} NOT FOUND IN {execution_time:.4f}S"
+                text=f"{target} NOT FOUND IN {execution_time:.2e}S"
+                     f"{strategy} (TRACE {trace_time:.4f}S{cache_note})"
+                     f" | {self.trace_cache.describe()}"
             )
         
         # Save to history
@@ -165,9 +352,119 @@ class AlgorithmExecutor:
             algorithm=name,
             data=self.app.search_array.copy(),
             execution_time=execution_time,
+            trace_time=trace_time,
             target=target,
             result=result_index,
-            size=len(self.app.search_array)
+            size=len(self.app.search_array),
+            counters=counters.to_dict(),
+            build_time=build_time,
+            count=count,
+            **options
+        )
+
+    
+    # Generated query log size when no targets are listed
+    BATCH_QUERIES = 5000
+    
+    @exclusive_run
+    def run_batch_search(self, method: str):
+        """
+        Answer a batch of targets with a vectorized search and animate a
+        sample of them
+        
+        Targets are the comma-separated values in the target entry, or a
+        generated query log of BATCH_QUERIES when the entry holds a single
+        value or nothing.
+        
+        Args:
+            method: one of SearchCore.BATCH_METHODS
+        """
+        import numpy as np
+        
+        if not self.app.search_array:
+            messagebox.showwarning("No Data", "Please generate search data first.")
+            return
+        
+        target_str = self.app.search_target_entry.get().strip()
+        if "," in target_str:
+            try:
+                targets = np.array([int(t) for t in target_str.split(",")], dtype=np.int64)
+            except ValueError:
+                messagebox.showerror("Invalid Targets",
+                                   "Please enter integers separated by commas.")
+                return
+        else:
+            targets = SearchCore.query_log(self.app.search_array, self.BATCH_QUERIES)
+        
+        name = f"{method.title()} Search (Batch)"
+        self.app.search_status.config(text=f"RUNNING {name.upper()}...")
+        self.app.search_message.config(text=f"{len(targets)} queries...")
+        self.app.root.update()
+        
+        # All queries are answered by the kernel; only a sample is animated
+        counters = OperationCounters()
+        start_time = time.time()
+        events = SearchCore.iter_batch(self.app.search_array, targets,
+                                       counters=counters, method=method)
+        end_time = time.time()
+        
+        def update_callback(event, index, total):
+            step = f"{index+1}/{total}" if total else f"{index+1}"
+            self.app.search_message.config(text=event.message)
+            self.app.search_status.config(
+                text=f"{name.upper()} - Step {step}"
+            )
+        
+        player = AnimationPlayer(
+            self.app.search_visualizer,
+            update_callback,
+            self.app.root
+        )
+        
+        # Sampled queries play faster than a single search
+        self.app.current_player = player
+        played = self._play(
+            player, events, self.app.search_array, 0.1, end_time - start_time,
+            counters=counters
+        )
+        if played is None:
+            self.app.search_status.config(text=f"{name.upper()} STOPPED")
+            self.app.search_message.config(text="Stopped - run discarded")
+            return
+        events, trace_time = played
+        counters = events.counters or counters
+        
+        # Kernel time against a loop of the scalar bare search
+        self.app.search_status.config(text=f"TIMING {name.upper()}...")
+        self.app.root.update()
+        result, probes = SearchCore.batch_search(self.app.search_array, targets, method)
+        batch_time = BareTimer.time_bare(SearchCore.batch_search, self.app.search_array,
+                                         targets, method=method)
+        bare_func = getattr(SearchCore, f"bare_{method}_search")
+        queries = targets.tolist()
+        loop_time = BareTimer.time_bare(
+            lambda arr: [bare_func(arr, t) for t in queries], self.app.search_array
+        )
+        
+        found = int((result >= 0).sum())
+        self.app.search_status.config(
+            text=f"{name.upper()}: {found}/{len(targets)} FOUND, "
+                 f"{probes.mean():.1f} PROBES/QUERY IN {batch_time:.2e}S "
+                 f"({loop_time / batch_time:.1f}X VS LOOP)"
+        )
+        
+        # Per-query time and counts, comparable with single-target runs
+        per_query = {key: value / len(targets) for key, value in counters.to_dict().items()}
+        self.app.search_history.add_entry(
+            algorithm=name,
+            data=self.app.search_array.copy(),
+            execution_time=batch_time / len(targets),
+            trace_time=trace_time,
+            target=f"{len(targets)} targets",
+            result=found,
+            queries=len(targets),
+            size=len(self.app.search_array),
+            counters=per_query
         )
 
 
@@ -367,6 +664,76 @@ class DataIOHandler:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load data: {str(e)}")
     
+    TRACE_FILETYPES = [("Trace files", "*.avtrace"), ("All files", "*.*")]
+    
+    def export_trace(self):
+        """Save the last sorting trace as a compressed binary trace file"""
+        if self.app.last_trace is None:
+            messagebox.showwarning("No Trace", "Run a sorting algorithm first.")
+            return
+        
+        from tkinter import filedialog
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".avtrace",
+            filetypes=self.TRACE_FILETYPES
+        )
+        
+        if not filename:
+            return
+        
+        name, trace = self.app.last_trace
+        try:
+            trace.save(filename, compress=True, algorithm=name)
+            messagebox.showinfo("Success", 
+                              f"Exported {len(trace)} events of {name} to {filename}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export trace: {str(e)}")
+    
+    @exclusive_run
+    def import_trace(self):
+        """Load a binary trace file and play it without recomputation"""
+        from tkinter import filedialog
+        filename = filedialog.askopenfilename(filetypes=self.TRACE_FILETYPES)
+        
+        if not filename:
+            return
+        
+        try:
+            trace, meta = EventTrace.load(filename)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to import trace: {str(e)}")
+            return
+        
+        name = meta.get("algorithm", "Imported Trace")
+        initial = trace.frame(0) if len(trace) else trace.final_data
+        self.app.sort_status.config(text=f"PLAYING IMPORTED {name.upper()}...")
+        self.app.root.update()
+        
+        def update_callback(event, index, total):
+            self.app.sort_message.config(text=event.message)
+            self.app.sort_status.config(
+                text=f"{name.upper()} (IMPORTED) - Step {index+1}/{total}"
+            )
+        
+        self.app.sort_visualizer.draw_state(initial)
+        player = AnimationPlayer(self.app.sort_visualizer, update_callback, self.app.root)
+        self.app.current_player = player
+        player.play_events(trace, self.app.sort_speed.get())
+        if player.stopped:
+            self.app.sort_status.config(text=f"{name.upper()} (IMPORTED) STOPPED")
+            self.app.sort_message.config(text="Stopped")
+            return
+        
+        self.app.last_trace = (name, trace)
+        self.app.data = trace.final_data
+        self.app.update_array_display(self.app.data)
+        policy = trace.policy or EmissionPolicy()
+        self.app.sort_status.config(
+            text=f"PLAYED IMPORTED {name.upper()}: {len(trace)} EVENTS, "
+                 f"{len(self.app.data)} ELEMENTS ({policy.describe()})"
+        )
+        self.app.sort_message.config(text="✓ Complete")
+    
     def reset_sort_visualization(self):
         """Reset sorting visualization"""
         confirm = messagebox.askyesno("Confirm Reset", 
@@ -377,6 +744,8 @@ class DataIOHandler:
         # Clear data
         self.app.data = []
         self.app.execution_times = {}
+        self.app.trace_times = {}
+        self.app.operation_counts = {}
         self.app.sort_entry.delete(0, 'end')
         
         # Clear array display
@@ -401,6 +770,127 @@ class AnalysisHandler:
         """
         self.app = app_ref
     
+    def _draw_time_bars(self, algorithms: List[str], bare_times: List[float],
+                        trace_times: List[float], color: str,
+                        labels: Tuple[str, str] = ("BARE", "WITH TRACE"),
+                        build_times: Optional[List[float]] = None):
+        """
+        Grouped bars on the time axis: bare algorithm time next to
+        trace generation time (log scale, they differ by orders of magnitude),
+        plus one-off layout build time when given
+        """
+        import numpy as np
+        from ui_rendering import THEME
+        
+        ax = self.app.time_ax
+        x = np.arange(len(algorithms))
+        width = 0.27 if build_times else 0.38
+        
+        if build_times:
+            ax.bar(
+                x + width, build_times, width,
+                color=THEME["found"],
+                edgecolor=THEME["border"],
+                linewidth=2,
+                alpha=0.7,
+                hatch="..",
+                label="LAYOUT BUILD"
+            )
+        
+        bars = ax.bar(
+            x - width / 2 if not build_times else x - width, bare_times, width,
+            color=color,
+            edgecolor=THEME["border"],
+            linewidth=2,
+            alpha=0.7,
+            label=labels[0]
+        )
+        ax.bar(
+            x + width / 2 if not build_times else x, trace_times, width,
+            color=THEME["sorted"],
+            edgecolor=THEME["border"],
+            linewidth=2,
+            alpha=0.7,
+            hatch="//",
+            label=labels[1]
+        )
+        
+        if any(t > 0 for t in bare_times + trace_times + (build_times or [])):
+            ax.set_yscale('log')
+        ax.set_xticks(x)
+        ax.set_xticklabels(algorithms)
+        ax.tick_params(
+            colors=THEME["fg"],
+            rotation=45,
+            labelsize=8
+        )
+        ax.legend(prop={'family': 'Courier', 'size': 8})
+        
+        # Add value labels on bare bars
+        for bar, time_val in zip(bars, bare_times):
+            ax.text(
+                bar.get_x() + bar.get_width()/2.,
+                bar.get_height(),
+                f'{time_val:.2e}',
+                ha='center',
+                va='bottom',
+                color=THEME["fg"],
+                family='Courier',
+                fontsize=8
+            )
+    
+    # Operation counters shown next to wall time (one bar per counter)
+    COUNT_BARS = [
+        ("comparisons", "CMP", "highlight", ""),
+        ("swaps", "SWP", "sorted", "//"),
+        ("writes", "WRT", "found", ".."),
+        ("allocations", "AUX", "bg", "xx")
+    ]
+    
+    def _draw_count_bars(self, algorithms: List[str], counts: List[Dict]):
+        """
+        Grouped operation counter bars on the space axis, max recursion
+        depth in the tick labels (log scale, counts span orders of magnitude)
+        """
+        import numpy as np
+        from ui_rendering import THEME
+        
+        ax = self.app.space_ax
+        x = np.arange(len(algorithms))
+        width = 0.8 / len(self.COUNT_BARS)
+        
+        for k, (key, label, color, hatch) in enumerate(self.COUNT_BARS):
+            ax.bar(
+                x + (k - (len(self.COUNT_BARS) - 1) / 2) * width,
+                [c.get(key, 0) for c in counts], width,
+                color=THEME[color],
+                edgecolor=THEME["border"],
+                linewidth=1,
+                alpha=0.7,
+                hatch=hatch,
+                label=label
+            )
+        
+        if any(c.get(key, 0) > 0 for c in counts for key, *_ in self.COUNT_BARS):
+            ax.set_yscale('log')
+        ax.set_xticks(x)
+        ax.set_xticklabels([
+            f"{algo}\nDEPTH {c.get('max_depth', 0):g}" if c.get('max_depth') else algo
+            for algo, c in zip(algorithms, counts)
+        ])
+        ax.tick_params(
+            colors=THEME["fg"],
+            rotation=45,
+            labelsize=8
+        )
+        ax.legend(prop={'family': 'Courier', 'size': 8}, ncol=2)
+        ax.set_ylabel(
+            "OPERATIONS (LOG)",
+            color=THEME["fg"],
+            family='Courier',
+            fontsize=9
+        )
+    
     def compare_sorting_algorithms(self):
         """Compare sorting algorithm performance"""
         if not self.app.execution_times:
@@ -418,17 +908,12 @@ class AnalysisHandler:
         GraphPaperBackground.apply_to_axis(self.app.time_ax)
         GraphPaperBackground.apply_to_axis(self.app.space_ax)
         
-        # Time comparison
+        # Time comparison: bare algorithm time vs trace generation time
         algorithms = list(self.app.execution_times.keys())
         times = list(self.app.execution_times.values())
+        trace_times = [self.app.trace_times.get(algo, 0.0) for algo in algorithms]
         
-        bars = self.app.time_ax.bar(
-            algorithms, times,
-            color=THEME["highlight"],
-            edgecolor=THEME["border"],
-            linewidth=2,
-            alpha=0.7
-        )
+        self._draw_time_bars(algorithms, times, trace_times, THEME["highlight"])
         
         self.app.time_ax.set_title(
             "SORTING ALGORITHM TIME COMPARISON",
@@ -438,44 +923,188 @@ class AnalysisHandler:
             fontsize=11
         )
         self.app.time_ax.set_ylabel(
-            "TIME (SECONDS)",
+            "TIME (SECONDS, LOG)",
             color=THEME["fg"],
             family='Courier',
             fontsize=9
         )
-        self.app.time_ax.tick_params(
-            colors=THEME["fg"],
-            rotation=45,
-            labelsize=8
+        
+        # Operation counters for the same runs
+        counts = [self.app.operation_counts.get(algo, {}) for algo in algorithms]
+        self._draw_count_bars(algorithms, counts)
+        self.app.space_ax.set_title(
+            "SORTING OPERATION COUNTS",
+            color=THEME["fg"],
+            fontweight='bold',
+            family='Courier',
+            fontsize=11
+        )
+        
+        self.app.analysis_fig.tight_layout()
+        self.app.analysis_canvas.draw()
+    
+    # Sorts run by the benchmark, on fixed inputs of BENCHMARK_SIZE
+    BENCHMARK_SORTS = [
+        ("Insertion Sort", AlgorithmCore.iter_insertion_sort),
+        ("Binary Insertion Sort", AlgorithmCore.iter_binary_insertion_sort),
+        ("Shell Sort", AlgorithmCore.iter_shell_sort),
+        ("Merge Sort", AlgorithmCore.iter_merge_sort),
+        ("Tim Sort", AlgorithmCore.iter_tim_sort),
+        ("Quick Sort", AlgorithmCore.iter_quick_sort),
+        ("Heap Sort", AlgorithmCore.iter_heap_sort),
+        ("Radix Sort", AlgorithmCore.iter_radix_sort),
+        ("Bitonic Sort", AlgorithmCore.iter_bitonic_sort),
+        ("Odd-Even Sort", AlgorithmCore.iter_odd_even_sort)
+    ]
+    BENCHMARK_SIZE = 1000
+    
+    @staticmethod
+    def _benchmark_inputs(n: int) -> Tuple[List[int], List[int]]:
+        """Random input and a nearly sorted one (about 2% of keys displaced)"""
+        import random
+        
+        rng = random.Random(n)
+        random_data = [rng.randint(1, 10 * n) for _ in range(n)]
+        nearly_sorted = sorted(random_data)
+        for _ in range(max(1, n // 50)):
+            i, j = rng.randrange(n), rng.randrange(n)
+            nearly_sorted[i], nearly_sorted[j] = nearly_sorted[j], nearly_sorted[i]
+        return random_data, nearly_sorted
+    
+    def benchmark_sorting_algorithms(self):
+        """
+        Time the bare path of every benchmark sort on random and nearly
+        sorted input, and chart operation counts for the random input
+        """
+        from ui_rendering import GraphPaperBackground
+        
+        random_data, nearly_sorted = self._benchmark_inputs(self.BENCHMARK_SIZE)
+        
+        algorithms, random_times, sorted_times, counts = [], [], [], []
+        for name, algorithm_func in self.BENCHMARK_SORTS:
+            bare_func = BareTimer.find_bare(algorithm_func)
+            algorithms.append(name.replace(" Sort", ""))
+            random_times.append(BareTimer.time_bare(bare_func, random_data, repeats=3))
+            sorted_times.append(BareTimer.time_bare(bare_func, nearly_sorted, repeats=3))
+            counts.append(OperationCounters.measure(algorithm_func, random_data).to_dict())
+        
+        # Clear axes
+        self.app.time_ax.clear()
+        self.app.space_ax.clear()
+        
+        # Apply graph paper background
+        GraphPaperBackground.apply_to_axis(self.app.time_ax)
+        GraphPaperBackground.apply_to_axis(self.app.space_ax)
+        
+        self._draw_time_bars(algorithms, random_times, sorted_times, THEME["highlight"],
+                             labels=("RANDOM", "NEARLY SORTED"))
+        self.app.time_ax.set_title(
+            f"SORT BENCHMARK (N={self.BENCHMARK_SIZE}, BARE)",
+            color=THEME["fg"],
+            fontweight='bold',
+            family='Courier',
+            fontsize=11
         )
+        self.app.time_ax.set_ylabel(
+            "TIME (SECONDS, LOG)",
+            color=THEME["fg"],
+            family='Courier',
+            fontsize=9
+        )
+        
+        self._draw_count_bars(algorithms, counts)
+        self.app.space_ax.set_title(
+            "BENCHMARK OPERATION COUNTS (RANDOM)",
+            color=THEME["fg"],
+            fontweight='bold',
+            family='Courier',
+            fontsize=11
+        )
+        
+        self.app.analysis_fig.tight_layout()
+        self.app.analysis_canvas.draw()
+    
+    # Input size for the speedup chart (large enough to amortize IPC)
+    SPEEDUP_SIZE = 100000
+    
+    def show_parallel_speedup(self):
+        """
+        Time the bare parallel merge sort for each worker count and chart
+        speedup over one worker next to the ideal linear speedup
+        """
+        import os
+        import random
+        from ui_rendering import GraphPaperBackground
+        
+        rng = random.Random(self.SPEEDUP_SIZE)
+        data = [rng.randint(1, 10 * self.SPEEDUP_SIZE) for _ in range(self.SPEEDUP_SIZE)]
+        workers = list(AlgorithmCore.WORKER_COUNTS)
+        times = [
+            BareTimer.time_bare(AlgorithmCore.bare_parallel_merge_sort, data,
+                                repeats=3, workers=count)
+            for count in workers
+        ]
+        speedups = [times[0] / t for t in times]
+        
+        # Clear axes
+        self.app.time_ax.clear()
+        self.app.space_ax.clear()
+        
+        # Apply graph paper background
+        GraphPaperBackground.apply_to_axis(self.app.time_ax)
+        GraphPaperBackground.apply_to_axis(self.app.space_ax)
         
-        # Add value labels on bars
+        ax = self.app.time_ax
+        ax.plot(workers, workers, color=THEME["grid"], linestyle="--",
+                linewidth=2, label="IDEAL")
+        ax.plot(workers, speedups, color=THEME["highlight"], marker="o",
+                linewidth=2, label="MEASURED")
+        for count, speedup in zip(workers, speedups):
+            ax.annotate(f"{speedup:.2f}x", (count, speedup), textcoords="offset points",
+                        xytext=(0, 6), ha='center', color=THEME["fg"],
+                        family='Courier', fontsize=8)
+        ax.set_xscale('log', base=2)
+        ax.set_xticks(workers)
+        ax.set_xticklabels([str(count) for count in workers])
+        ax.tick_params(colors=THEME["fg"], labelsize=8)
+        ax.legend(prop={'family': 'Courier', 'size': 8})
+        ax.set_title(
+            f"PARALLEL MERGE SORT SPEEDUP ({os.cpu_count()} CPUS)",
+            color=THEME["fg"],
+            fontweight='bold',
+            family='Courier',
+            fontsize=11
+        )
+        ax.set_xlabel("WORKERS", color=THEME["fg"], family='Courier', fontsize=9)
+        ax.set_ylabel("SPEEDUP VS 1 WORKER", color=THEME["fg"], family='Courier', fontsize=9)
+        
+        ax = self.app.space_ax
+        bars = ax.bar(range(len(workers)), times,
+                      color=THEME["highlight"], edgecolor=THEME["border"],
+                      linewidth=2, alpha=0.7)
+        ax.set_xticks(range(len(workers)))
+        ax.set_xticklabels([str(count) for count in workers])
         for bar, time_val in zip(bars, times):
-            height = bar.get_height()
-            self.app.time_ax.text(
+            ax.text(
                 bar.get_x() + bar.get_width()/2.,
-                height,
-                f'{time_val:.4f}',
+                bar.get_height(),
+                f'{time_val:.2e}',
                 ha='center',
                 va='bottom',
                 color=THEME["fg"],
                 family='Courier',
                 fontsize=8
             )
-        
-        # Space complexity info
-        self.app.space_ax.text(
-            0.5, 0.5,
-            "SPACE COMPLEXITY\nVARIES BY ALGORITHM\n\n"
-            "See BIG O for details",
-            ha='center',
-            va='center',
-            transform=self.app.space_ax.transAxes,
+        ax.tick_params(colors=THEME["fg"], labelsize=8)
+        ax.set_title(
+            f"BARE TIME (N={self.SPEEDUP_SIZE})",
             color=THEME["fg"],
-            fontsize=10,
+            fontweight='bold',
             family='Courier',
-            fontweight='bold'
+            fontsize=11
         )
+        ax.set_xlabel("WORKERS", color=THEME["fg"], family='Courier', fontsize=9)
+        ax.set_ylabel("TIME (SECONDS)", color=THEME["fg"], family='Courier', fontsize=9)
         
         self.app.analysis_fig.tight_layout()
         self.app.analysis_canvas.draw()
@@ -493,16 +1122,31 @@ class AnalysisHandler:
         
         # Calculate average times per algorithm
         algo_times = {}
+        algo_trace_times = {}
+        algo_build_times = {}
+        algo_counts = {}
         for entry in search_history:
             algo = entry['algorithm']
             if algo not in algo_times:
                 algo_times[algo] = []
-            algo_times[algo].append(entry['execution_time'])
+                algo_trace_times[algo] = []
+                algo_build_times[algo] = []
+                algo_counts[algo] = []
+            algo_times[algo].append(entry.get('time', 0.0))
+            algo_trace_times[algo].append(entry.get('trace_time', 0.0))
+            if entry.get('build_time') is not None:
+                algo_build_times[algo].append(entry['build_time'])
+            if entry.get('counters'):
+                algo_counts[algo].append(entry['counters'])
         
         avg_times = {
             algo: sum(times) / len(times)
             for algo, times in algo_times.items()
         }
+        avg_trace_times = {
+            algo: sum(times) / len(times)
+            for algo, times in algo_trace_times.items()
+        }
         
         # Clear axes
         self.app.time_ax.clear()
@@ -512,17 +1156,18 @@ class AnalysisHandler:
         GraphPaperBackground.apply_to_axis(self.app.time_ax)
         GraphPaperBackground.apply_to_axis(self.app.space_ax)
         
-        # Time comparison
+        # Time comparison: bare search time vs trace generation time
         algorithms = list(avg_times.keys())
         times = list(avg_times.values())
+        trace_times = [avg_trace_times[algo] for algo in algorithms]
+        build_times = [
+            sum(algo_build_times[algo]) / len(algo_build_times[algo])
+            if algo_build_times[algo] else 0.0
+            for algo in algorithms
+        ]
         
-        bars = self.app.time_ax.bar(
-            algorithms, times,
-            color=THEME["searching"],
-            edgecolor=THEME["border"],
-            linewidth=2,
-            alpha=0.7
-        )
+        self._draw_time_bars(algorithms, times, trace_times, THEME["searching"],
+                             build_times=build_times if any(build_times) else None)
         
         self.app.time_ax.set_title(
             "SEARCH ALGORITHM AVG TIME",
@@ -532,43 +1177,27 @@ class AnalysisHandler:
             fontsize=11
         )
         self.app.time_ax.set_ylabel(
-            "AVG TIME (SECONDS)",
+            "AVG TIME (SECONDS, LOG)",
             color=THEME["fg"],
             family='Courier',
             fontsize=9
         )
-        self.app.time_ax.tick_params(
-            colors=THEME["fg"],
-            rotation=45,
-            labelsize=8
-        )
         
-        # Add value labels
-        for bar, time_val in zip(bars, times):
-            height = bar.get_height()
-            self.app.time_ax.text(
-                bar.get_x() + bar.get_width()/2.,
-                height,
-                f'{time_val:.6f}',
-                ha='center',
-                va='bottom',
-                color=THEME["fg"],
-                family='Courier',
-                fontsize=8
-            )
-        
-        # Space complexity
-        self.app.space_ax.text(
-            0.5, 0.5,
-            "SEARCH ALGORITHMS\nUSE O(1) SPACE\n\n"
-            "(No extra space needed)",
-            ha='center',
-            va='center',
-            transform=self.app.space_ax.transAxes,
+        # Average operation counters per search
+        avg_counts = []
+        for algo in algorithms:
+            entries = algo_counts[algo]
+            avg_counts.append({
+                key: sum(c.get(key, 0) for c in entries) / len(entries)
+                for key in ("comparisons", "swaps", "writes", "allocations", "max_depth")
+            } if entries else {})
+        self._draw_count_bars(algorithms, avg_counts)
+        self.app.space_ax.set_title(
+            "SEARCH AVG OPERATION COUNTS",
             color=THEME["fg"],
-            fontsize=10,
+            fontweight='bold',
             family='Courier',
-            fontweight='bold'
+            fontsize=11
         )
         
         self.app.analysis_fig.tight_layout()
@@ -627,7 +1256,8 @@ class AnalysisHandler:
                 self.app.sorting_history,
                 self.app.search_history,
                 self.app.execution_times,
-                filename
+                filename,
+                trace_times=self.app.trace_times
             )
             
             messagebox.showinfo("Success", 
@@ -687,9 +1317,9 @@ class HistoryViewHandler:
         
         # Define columns based on data type
         if data_type == "search":
-            columns = ("Algorithm", "Target", "Result", "Time", "Timestamp")
+            columns = ("Algorithm", "Target", "Result", "Time", "Trace Time", "Timestamp")
         else:
-            columns = ("Algorithm", "Size", "Time", "Timestamp")
+            columns = ("Algorithm", "Size", "Time", "Trace Time", "Events", "Timestamp")
         
         tree = ttk.Treeview(
             tree_frame,
@@ -716,18 +1346,27 @@ class HistoryViewHandler:
                 values = (
                     entry["algorithm"],
                     entry.get("size", "N/A"),
-                    f"{entry['execution_time']:.4f}s",
+                    f"{entry.get('time', 0.0):.2e}s",
+                    f"{entry.get('trace_time', 0.0):.4f}s",
+                    EmissionPolicy.from_dict(entry.get("policy") or {}).describe(),
                     entry["timestamp"]
                 )
             else:
-                result_text = (f"Index {entry['result']}" 
-                             if entry['result'] != -1 
-                             else "Not found")
+                if "queries" in entry:
+                    result_text = f"{entry['result']}/{entry['queries']} found"
+                elif entry.get("mode") == "range" and entry.get("count"):
+                    result_text = (f"Indices {entry['result']}:"
+                                   f"{entry['result'] + entry['count']}")
+                else:
+                    result_text = (f"Index {entry['result']}" 
+                                 if entry['result'] != -1 
+                                 else "Not found")
                 values = (
                     entry["algorithm"],
                     entry["target"],
                     result_text,
-                    f"{entry['execution_time']:.4f}s",
+                    f"{entry.get('time', 0.0):.2e}s",
+                    f"{entry.get('trace_time', 0.0):.4f}s",
                     entry["timestamp"]
                 )
             
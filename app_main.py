@@ -39,9 +39,13 @@ class IntegratedAlgorithmVisualizer(AlgorithmVisualizer):
     
     # ===== Sorting Tab Methods =====
     
-    def run_sorting(self, name, algorithm_func):
+    def run_sorting(self, name, algorithm_func, **options):
         """Run sorting algorithm (delegated to executor)"""
-        self.executor.run_sorting_algorithm(name, algorithm_func)
+        self.executor.run_sorting_algorithm(name, algorithm_func, **options)
+    
+    def stop_animation(self):
+        """Stop the playing animation (delegated to executor)"""
+        self.executor.stop_animation()
     
     def save_sorted_data(self):
         """Save sorted data (delegated to data IO handler)"""
@@ -51,6 +55,14 @@ class IntegratedAlgorithmVisualizer(AlgorithmVisualizer):
         """Load data from file (delegated to data IO handler)"""
         self.data_io_handler.load_data_from_file()
     
+    def export_trace(self):
+        """Export the last trace (delegated to data IO handler)"""
+        self.data_io_handler.export_trace()
+    
+    def import_trace(self):
+        """Import and play a trace (delegated to data IO handler)"""
+        self.data_io_handler.import_trace()
+    
     def reset_sort_visualization(self):
         """Reset visualization (delegated to data IO handler)"""
         self.data_io_handler.reset_sort_visualization()
@@ -58,8 +70,13 @@ class IntegratedAlgorithmVisualizer(AlgorithmVisualizer):
     # ===== Search Tab Methods =====
     
     def run_search(self, name, algorithm_func):
-        """Run search algorithm (delegated to executor)"""
-        self.executor.run_search_algorithm(name, algorithm_func)
+        """Run search algorithm in the selected mode (delegated to executor)"""
+        self.executor.run_search_algorithm(name, algorithm_func,
+                                           mode=self.search_mode.get())
+    
+    def run_batch_search(self, method):
+        """Run batch search (delegated to executor)"""
+        self.executor.run_batch_search(method)
     
     # ===== Tree Tab Methods =====
     
@@ -109,6 +126,14 @@ class IntegratedAlgorithmVisualizer(AlgorithmVisualizer):
         """Compare sorting algorithms (delegated to analysis handler)"""
         self.analysis_handler.compare_sorting_algorithms()
     
+    def benchmark_sorting_algorithms(self):
+        """Benchmark sorting algorithms (delegated to analysis handler)"""
+        self.analysis_handler.benchmark_sorting_algorithms()
+    
+    def show_parallel_speedup(self):
+        """Chart parallel speedup (delegated to analysis handler)"""
+        self.analysis_handler.show_parallel_speedup()
+    
     def compare_search_algorithms(self):
         """Compare search algorithms (delegated to analysis handler)"""
         self.analysis_handler.compare_search_algorithms()
@@ -190,6 +215,12 @@ class ApplicationLauncher:
     def setup_close_handler(root, app):
         """Setup proper cleanup on window close"""
         def on_closing():
+            # A run in progress is stopped and wraps up before the window goes
+            if app.executor.run_in_progress:
+                app.stop_animation()
+                root.after(50, on_closing)
+                return
+            
             # Save history
             try:
                 app.sorting_history.save()
@@ -216,6 +247,7 @@ Quick Start:
 
 Tips:
 • Use the speed slider to control animation speed
+• STOP ends a playing animation early
 • All animations use GREEN highlights consistently
 • Graph paper background provides clear visual reference
 • History is automatically saved between sessions
@@ -302,6 +334,15 @@ class DevTools:
             status = "✓ PASS" if sorted_data == expected else "✗ FAIL"
             print(f"  {name}: {status}")
         
+        # Event budgets hold for the parallel sort too (max_events + final)
+        from core_algorithms import EmissionPolicy
+        for max_events in (0, 1, 2):
+            trace = AlgorithmCore.parallel_merge_sort(
+                test_data.copy(), EmissionPolicy(max_events=max_events), workers=3)
+            passed = len(trace) <= max_events + 1 and trace.final_data == sorted(test_data)
+            status = "✓ PASS" if passed else "✗ FAIL"
+            print(f"  Parallel Merge Sort (max {max_events} events): {status}")
+        
         # Test search algorithms
         print("\nTesting search algorithms...")
         sorted_data = sorted(test_data)
@@ -316,6 +357,65 @@ class DevTools:
             status = "✓ PASS" if found else "✗ FAIL"
             print(f"  {name}: {status}")
         
+        # Batch search on duplicate-heavy arrays (runs of equal keys, lo < hi)
+        # must report the same index as the scalar search
+        print("\nTesting batch search...")
+        duplicates = [0, 0, 1, 3, 5, 5, 5, 5, 6, 6, 7, 9, 9, 11, 11, 13, 15, 15, 15, 17,
+                      17, 19, 20, 22, 22, 24, 24, 26, 27, 27, 27, 29, 32, 32, 33, 34, 34,
+                      35, 36, 37, 38, 38, 39, 39, 41, 41, 42, 43, 48, 48, 48, 50, 52, 52,
+                      53, 53, 55, 55, 56, 56]
+        for arr in ([1, 1], [3] * 10, [1, 2, 2, 2, 2, 5, 5, 9], duplicates):
+            targets = list(range(-1, arr[-1] + 2))
+            for method in SearchCore.BATCH_METHODS:
+                scalar = getattr(SearchCore, f"bare_{method}_search")
+                try:
+                    result, _ = SearchCore.batch_search(arr, targets, method)
+                    list(SearchCore.iter_batch(arr, targets, method=method))
+                    passed = result.tolist() == [scalar(arr, t) for t in targets]
+                except IndexError:
+                    passed = False
+                status = "✓ PASS" if passed else "✗ FAIL"
+                print(f"  {method.title()} Batch ({len(arr)} keys): {status}")
+        
+        # Trace cache: truncated files are misses, file names survive restarts
+        print("\nTesting trace cache...")
+        import subprocess
+        import tempfile
+        from core_algorithms import (EmissionPolicy, EventType, PersistentTraceCache,
+                                     TraceCache)
+        policy = EmissionPolicy(event_types=frozenset(
+            t for t in EventType if t is not EventType.COMPARE))
+        key = TraceCache.key("Bubble Sort", test_data, policy)
+        trace = AlgorithmCore.bubble_sort(test_data.copy())
+        with tempfile.TemporaryDirectory() as directory:
+            store = PersistentTraceCache(directory)
+            path = store.path(key)
+            for cut in (3, 8, "half"):
+                store.put(key, trace, 0.0)
+                size = os.path.getsize(path)
+                with open(path, "r+b") as f:
+                    f.truncate(size // 2 if cut == "half" else size - cut)
+                try:
+                    passed = store.get(key) is None and not os.path.exists(path)
+                except Exception:
+                    passed = False
+                status = "✓ PASS" if passed else "✗ FAIL"
+                print(f"  Truncated Trace File ({cut}): {status}")
+            
+            # The same key must name the same file under any hash seed
+            script = ("from core_algorithms import *; "
+                      "policy = EmissionPolicy(event_types=frozenset("
+                      "t for t in EventType if t is not EventType.COMPARE)); "
+                      f"print(PersistentTraceCache({directory!r}).path(TraceCache.key("
+                      f"'Bubble Sort', {test_data!r}, policy)))")
+            paths = {subprocess.run([sys.executable, "-c", script], capture_output=True,
+                                    text=True, env=dict(os.environ, PYTHONHASHSEED=seed),
+                                    cwd=os.path.dirname(os.path.abspath(__file__))
+                                    ).stdout.strip()
+                     for seed in ("1", "2", "3")}
+            status = "✓ PASS" if paths == {path} else "✗ FAIL"
+            print(f"  Cache Path Across Hash Seeds: {status}")
+        
         # Test tree operations
         print("\nTesting tree operations...")
         tree = TreeOperations()
@@ -1,7 +1,24 @@
-from typing import List, Dict, Any, Callable, Optional
-from dataclasses import dataclass
+from typing import (List, Dict, Any, Callable, Optional, Tuple, Iterator, Iterable,
+                    Sequence, FrozenSet)
+from dataclasses import dataclass, replace
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import zip_longest
+from functools import partial
+from array import array
 from enum import Enum
 import math
+import random
+import bisect
+import heapq
+import atexit
+import hashlib
+import io
+import json
+import mmap
+import os
+import zlib
+import numpy as np
 
 
 class EventType(Enum):
@@ -16,16 +33,857 @@ class EventType(Enum):
     DIVIDE = "divide"
     MERGE = "merge"
     PIVOT = "pivot"
+    BUILD = "build"      # heap construction phase
+    EXTRACT = "extract"  # heap extraction phase
 
 
 @dataclass
 class AlgorithmEvent:
     """Event emitted during algorithm execution"""
     event_type: EventType
-    indices: List[int]
+    indices: Sequence[int]
     values: Optional[List[int]] = None
     message: str = ""
     data_snapshot: Optional[List[int]] = None
+    writes: Optional[List[Tuple[int, int]]] = None  # (index, value) since previous event
+    template: str = ""  # str.format template for message, filled from args
+    args: Tuple[int, ...] = ()
+    lane: Optional[int] = None  # worker that produced the event (parallel sorts)
+    
+    def __post_init__(self):
+        if self.template and not self.message:
+            self.message = self.template.format(*self.args)
+
+
+class TrackedArray(list):
+    """
+    List that logs (index, value) writes between events
+    Algorithms mutate it like a plain list and drain the log into each event
+    """
+    
+    def __init__(self, data: Iterable[int]):
+        super().__init__(data)
+        self._writes: List[Tuple[int, int]] = []
+        self.write_count = 0
+    
+    def __setitem__(self, index: int, value: int):
+        if isinstance(index, slice):
+            # Block copy: same-length slice assignment only, the array never resizes
+            self.assign(range(*index.indices(len(self))), list(value))
+            return
+        
+        super().__setitem__(index, value)
+        self._writes.append((index, value))
+        self.write_count += 1
+        
+        # Writes pile up while events are filtered out; once the log is
+        # longer than the array keep only the last value per index
+        if len(self._writes) > 2 * len(self) + 64:
+            self._writes = list(dict(self._writes).items())
+    
+    def assign(self, indices: Sequence[int], values: Sequence[int]):
+        """Write many positions at once (e.g. a vectorized pass), logged like single writes"""
+        if len(indices) != len(values):
+            raise ValueError("TrackedArray cannot change size")
+        pairs = list(zip(indices, values))
+        for index, value in pairs:
+            super().__setitem__(index, value)
+        self._writes.extend(pairs)
+        self.write_count += len(pairs)
+        
+        if len(self._writes) > 2 * len(self) + 64:
+            self._writes = list(dict(self._writes).items())
+    
+    def has_writes(self) -> bool:
+        """True if the array changed since the last drain"""
+        return bool(self._writes)
+    
+    def drain_writes(self) -> Optional[List[Tuple[int, int]]]:
+        """Return writes since the last drain (None if nothing changed)"""
+        if not self._writes:
+            return None
+        writes, self._writes = self._writes, []
+        return writes
+
+
+@dataclass(frozen=True)
+class EmissionPolicy:
+    """
+    Source-side event filter passed into the algorithms
+    Events rejected by the policy are never built; writes they would have
+    carried roll over into the next emitted event. The closing event of a
+    run (sorting complete / found / not found) is always emitted.
+    """
+    event_types: Optional[FrozenSet[EventType]] = None  # None = all types
+    stride: int = 1                     # keep one event in every `stride`
+    max_events: Optional[int] = None    # budget for non-closing events
+    state_changes_only: bool = False    # only events that change the array
+    
+    def is_default(self) -> bool:
+        """True if the policy lets every event through"""
+        return (self.event_types is None and self.stride <= 1
+                and self.max_events is None and not self.state_changes_only)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form, stored in history for reproducibility"""
+        return {
+            "event_types": (sorted(t.value for t in self.event_types)
+                            if self.event_types is not None else None),
+            "stride": self.stride,
+            "max_events": self.max_events,
+            "state_changes_only": self.state_changes_only
+        }
+    
+    @classmethod
+    def from_dict(cls, values: Dict[str, Any]) -> 'EmissionPolicy':
+        """Rebuild a policy saved with to_dict"""
+        event_types = values.get("event_types")
+        return cls(
+            event_types=(frozenset(EventType(v) for v in event_types)
+                         if event_types is not None else None),
+            stride=values.get("stride", 1),
+            max_events=values.get("max_events"),
+            state_changes_only=values.get("state_changes_only", False)
+        )
+    
+    def describe(self) -> str:
+        """Short label for status bars and history"""
+        if self.is_default():
+            return "ALL EVENTS"
+        parts = []
+        if self.event_types is not None:
+            parts.append("+".join(sorted(t.name for t in self.event_types)))
+        if self.state_changes_only:
+            parts.append("STATE CHANGES")
+        if self.stride > 1:
+            parts.append(f"1/{self.stride}")
+        if self.max_events is not None:
+            parts.append(f"MAX {self.max_events}")
+        return ", ".join(parts)
+
+
+class EmissionGate:
+    """Per-run state for an EmissionPolicy (stride and budget counters)"""
+    
+    def __init__(self, policy: Optional[EmissionPolicy] = None,
+                 array: Optional[TrackedArray] = None):
+        """
+        Args:
+            policy: policy to apply (None lets everything through)
+            array: tracked array, used to detect state-changing events
+        """
+        self.policy = policy
+        self.array = array
+        self.pass_all = policy is None or policy.is_default()
+        self.candidates = 0
+        self.emitted = 0
+    
+    def allows(self, event_type: EventType) -> bool:
+        """Decide, before it is built, whether an event should be emitted"""
+        if self.pass_all:
+            return True
+        
+        policy = self.policy
+        if policy.event_types is not None and event_type not in policy.event_types:
+            return False
+        if policy.state_changes_only and not (
+                self.array is not None and self.array.has_writes()):
+            return False
+        
+        self.candidates += 1
+        if (self.candidates - 1) % policy.stride:
+            return False
+        if policy.max_events is not None and self.emitted >= policy.max_events:
+            return False
+        
+        self.emitted += 1
+        return True
+
+
+@dataclass
+class OperationCounters:
+    """
+    Exact operation counts for one algorithm run
+    Gathered by the event generators whether or not events are emitted,
+    so `measure` gets them without building a trace
+    """
+    comparisons: int = 0
+    swaps: int = 0
+    writes: int = 0         # element writes into the array
+    allocations: int = 0    # auxiliary elements allocated (buffers, copies)
+    max_depth: int = 0      # deepest recursion level reached
+    
+    # Relative cost of each operation for the cost model
+    COST_WEIGHTS = {
+        "comparisons": 1.0,
+        "swaps": 0.0,        # a swap is already counted as two writes
+        "writes": 1.0,
+        "allocations": 0.5,
+        "max_depth": 0.0
+    }
+    
+    def observe_depth(self, depth: int):
+        """Record that recursion reached `depth`"""
+        if depth > self.max_depth:
+            self.max_depth = depth
+    
+    def cost(self, weights: Optional[Dict[str, float]] = None) -> float:
+        """Weighted operation count used to compare algorithms"""
+        weights = weights or self.COST_WEIGHTS
+        return sum(getattr(self, name) * weight for name, weight in weights.items())
+    
+    def to_dict(self) -> Dict[str, float]:
+        """JSON-friendly counts (plus cost) for history entries"""
+        return {
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "writes": self.writes,
+            "allocations": self.allocations,
+            "max_depth": self.max_depth,
+            "cost": self.cost()
+        }
+    
+    @staticmethod
+    def measure(iter_func: Callable, *args, **options) -> 'OperationCounters':
+        """
+        Count operations of an iter_* algorithm without building a trace
+        (only the closing event is emitted)
+        """
+        counters = OperationCounters()
+        for _ in iter_func(*args, policy=EmissionPolicy(max_events=0),
+                           counters=counters, **options):
+            pass
+        return counters
+
+
+# Event type codes for the compact uint8 column; high bits are per-event flags
+_EVENT_TYPES = list(EventType)
+_TYPE_CODES = {event_type: code for code, event_type in enumerate(_EVENT_TYPES)}
+_TYPE_MASK = 0x0F
+_HAS_VALUES = 0x80      # values is a list (possibly empty), not None
+_INDEX_RANGE = 0x40     # indices stored as [start, stop] of a range
+_FORMATTED = 0x20       # message is template.format(*args)
+_ARGS_ARE_VALUES = 0x10  # args identical to values, not stored twice
+
+
+class TraceEvent:
+    """
+    Lightweight read-only view of one event stored in an EventTrace
+    Exposes the same attributes as AlgorithmEvent, decoded on access
+    """
+    
+    __slots__ = ("_trace", "_index", "data_snapshot")
+    
+    def __init__(self, trace: 'EventTrace', index: int,
+                 data_snapshot: Optional[List[int]] = None):
+        self._trace = trace
+        self._index = index
+        self.data_snapshot = data_snapshot
+    
+    @property
+    def event_type(self) -> EventType:
+        return _EVENT_TYPES[self._trace._types[self._index] & _TYPE_MASK]
+    
+    @property
+    def indices(self) -> Sequence[int]:
+        trace, i = self._trace, self._index
+        items = trace._index_data[trace._index_offsets[i]:trace._index_offsets[i + 1]]
+        if trace._types[i] & _INDEX_RANGE:
+            return range(items[0], items[1])
+        return items.tolist()
+    
+    @property
+    def values(self) -> Optional[List[int]]:
+        trace, i = self._trace, self._index
+        if not trace._types[i] & _HAS_VALUES:
+            return None
+        return trace._value_data[trace._value_offsets[i]:trace._value_offsets[i + 1]].tolist()
+    
+    @property
+    def message(self) -> str:
+        trace, i = self._trace, self._index
+        flags = trace._types[i]
+        template = trace._templates[trace._template_ids[i]]
+        if not flags & _FORMATTED:
+            return template
+        if flags & _ARGS_ARE_VALUES:
+            return template.format(*self.values)
+        return template.format(
+            *trace._arg_data[trace._arg_offsets[i]:trace._arg_offsets[i + 1]]
+        )
+    
+    @property
+    def lane(self) -> Optional[int]:
+        lane = self._trace._lanes[self._index]
+        return None if lane < 0 else lane
+    
+    @property
+    def writes(self) -> Optional[List[Tuple[int, int]]]:
+        trace, i = self._trace, self._index
+        start, stop = trace._write_offsets[i], trace._write_offsets[i + 1]
+        if start == stop:
+            return None
+        flat = trace._write_data[2 * start:2 * stop]
+        return list(zip(flat[0::2], flat[1::2]))
+    
+    def __repr__(self) -> str:
+        return (f"TraceEvent({self.event_type.name}, indices={self.indices!r}, "
+                f"message={self.message!r})")
+
+
+class _MappedKeyframes:
+    """Keyframes of a mapped trace: each one copied out of the file on access"""
+    
+    def __init__(self, blocks: memoryview, slots: memoryview, size: int):
+        self._blocks = blocks
+        self._slots = slots
+        self._size = size
+        self.nbytes = blocks.nbytes
+    
+    def __len__(self) -> int:
+        return len(self._slots)
+    
+    def __getitem__(self, index: int) -> List[int]:
+        start = self._slots[index] * self._size
+        return self._blocks[start:start + self._size].tolist()
+    
+    def __iter__(self) -> Iterator[List[int]]:
+        return (self[i] for i in range(len(self)))
+
+
+class EventTrace:
+    """
+    Compact event sequence: struct-of-arrays columns plus keyframes
+    
+    Event types live in a uint8 column; indices, values, writes and
+    message arguments live in flat int arrays addressed by offsets, and
+    messages are stored as interned template ids. A full copy of the
+    array is kept every `keyframe_interval` events, so any frame is
+    rebuilt from the nearest keyframe in O(n + K). Indexing and
+    iteration return TraceEvent views.
+    """
+    
+    MIN_KEYFRAME_INTERVAL = 64
+    
+    def __init__(self, initial: List[int], keyframe_interval: Optional[int] = None,
+                 policy: Optional[EmissionPolicy] = None,
+                 counters: Optional[OperationCounters] = None):
+        """
+        Args:
+            initial: array state before the first event
+            keyframe_interval: events between keyframes (default: max(64, n),
+                which keeps keyframe storage at about one int per event)
+            policy: emission policy the events were generated with
+            counters: operation counts of the run that produced the events
+        """
+        self.policy = policy
+        self.counters = counters
+        self.keyframe_interval = keyframe_interval or max(
+            self.MIN_KEYFRAME_INTERVAL, len(initial)
+        )
+        self._types = array('B')
+        self._lanes = array('b')  # worker lane per event, -1 for none
+        self._index_data = array('i')
+        self._index_offsets = array('I', [0])
+        self._value_data = array('q')
+        self._value_offsets = array('I', [0])
+        self._write_data = array('q')  # interleaved index, value pairs
+        self._write_offsets = array('I', [0])
+        self._template_ids = array('I')
+        self._templates: List[str] = []
+        self._template_lookup: Dict[str, int] = {}
+        self._arg_data = array('q')
+        self._arg_offsets = array('I', [0])
+        self._keyframes: List[List[int]] = []
+        self._current = list(initial)
+        self._dirty = True
+    
+    @classmethod
+    def from_events(cls, initial: List[int], events: Iterable[AlgorithmEvent],
+                    keyframe_interval: Optional[int] = None,
+                    policy: Optional[EmissionPolicy] = None,
+                    counters: Optional[OperationCounters] = None) -> 'EventTrace':
+        """Build a trace from any event iterable (legacy snapshot events included)"""
+        trace = cls(initial, keyframe_interval, policy, counters)
+        for event in events:
+            trace.append(event)
+        return trace
+    
+    def _intern(self, template: str) -> int:
+        template_id = self._template_lookup.get(template)
+        if template_id is None:
+            template_id = len(self._templates)
+            self._templates.append(template)
+            self._template_lookup[template] = template_id
+        return template_id
+    
+    def append(self, event: AlgorithmEvent):
+        """Record an event into the columns (snapshots are reduced to writes)"""
+        if len(self._types) % self.keyframe_interval == 0:
+            # Unchanged state shares the previous keyframe instead of copying
+            if self._dirty or not self._keyframes:
+                self._keyframes.append(self._current.copy())
+                self._dirty = False
+            else:
+                self._keyframes.append(self._keyframes[-1])
+        
+        flags = _TYPE_CODES[event.event_type]
+        
+        indices = event.indices
+        if isinstance(indices, range) and indices.step == 1:
+            flags |= _INDEX_RANGE
+            self._index_data.append(indices.start)
+            self._index_data.append(indices.stop)
+        else:
+            self._index_data.extend(indices)
+        self._index_offsets.append(len(self._index_data))
+        
+        values = event.values
+        if values is not None:
+            flags |= _HAS_VALUES
+            self._value_data.extend(values)
+        self._value_offsets.append(len(self._value_data))
+        
+        template = getattr(event, "template", "")
+        if template:
+            flags |= _FORMATTED
+            args = event.args
+            if values is not None and len(args) == len(values) and tuple(values) == args:
+                flags |= _ARGS_ARE_VALUES
+            else:
+                self._arg_data.extend(args)
+            self._template_ids.append(self._intern(template))
+        else:
+            self._template_ids.append(self._intern(event.message))
+        self._arg_offsets.append(len(self._arg_data))
+        
+        writes = event.writes
+        if writes is None and event.data_snapshot is not None:
+            writes = [
+                (i, value) for i, value in enumerate(event.data_snapshot)
+                if self._current[i] != value
+            ]
+        if writes:
+            current = self._current
+            write_data = self._write_data
+            for index, value in writes:
+                current[index] = value
+                write_data.append(index)
+                write_data.append(value)
+            self._dirty = True
+        self._write_offsets.append(len(self._write_data) // 2)
+        
+        lane = getattr(event, "lane", None)
+        self._lanes.append(-1 if lane is None else lane)
+        self._types.append(flags)
+    
+    def _apply_writes(self, state: List[int], start: int, stop: int):
+        """Apply the writes of events [start, stop) to state in place"""
+        flat = self._write_data[2 * self._write_offsets[start]:2 * self._write_offsets[stop]]
+        for k in range(0, len(flat), 2):
+            state[flat[k]] = flat[k + 1]
+    
+    def frame(self, index: int) -> List[int]:
+        """Reconstruct the array state right after event `index`"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("trace index out of range")
+        
+        start = index - index % self.keyframe_interval
+        state = self._keyframes[start // self.keyframe_interval].copy()
+        self._apply_writes(state, start, index + 1)
+        return state
+    
+    @property
+    def final_data(self) -> List[int]:
+        """Array state after the last event (no replay needed)"""
+        return self._current.copy()
+    
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns and keyframes"""
+        columns = (self._types, self._lanes, self._index_data, self._index_offsets,
+                   self._value_data, self._value_offsets, self._write_data,
+                   self._write_offsets, self._template_ids, self._arg_data,
+                   self._arg_offsets)
+        total = sum(column.itemsize * len(column) for column in columns)
+        if isinstance(self._keyframes, _MappedKeyframes):
+            return total + self._keyframes.nbytes
+        unique_keyframes = {id(keyframe): keyframe for keyframe in self._keyframes}
+        total += sum(8 * len(keyframe) for keyframe in unique_keyframes.values())
+        return total
+    
+    # Binary file format: magic, JSON header length and header, then each
+    # column's raw bytes at an 8-byte aligned offset. Columns are mapped
+    # back with mmap, so replay reads only the pages it touches. Exported
+    # files are the same bytes in a zlib stream after their own magic.
+    # The header also lists the event types and flag bits, so the
+    # standalone trace_loader module can decode events on its own.
+    
+    FILE_MAGIC = b"AVTRACE\x00"
+    COMPRESSED_MAGIC = b"AVTRACEZ"
+    FILE_FORMAT = 1
+    _COLUMNS = ("_types", "_lanes", "_index_data", "_index_offsets", "_value_data",
+                "_value_offsets", "_write_data", "_write_offsets", "_template_ids",
+                "_arg_data", "_arg_offsets")
+    
+    def save(self, path: str, compress: bool = False, **meta):
+        """
+        Write the trace to a binary file (meta: extra JSON-able header fields)
+        Shared keyframes are stored once; compressed files are smaller but
+        are decompressed into memory on load instead of mapped.
+        """
+        if compress:
+            buffer = io.BytesIO()
+            self._write(buffer, meta)
+            with open(path, "wb") as f:
+                f.write(self.COMPRESSED_MAGIC)
+                f.write(zlib.compress(buffer.getbuffer(), 6))
+        else:
+            with open(path, "wb") as f:
+                self._write(f, meta)
+    
+    def _write(self, f, meta: Dict[str, Any]):
+        """Write the uncompressed file layout to a fresh binary file object"""
+        slots, blocks, seen = array('I'), array('q'), {}
+        for keyframe in self._keyframes:
+            slot = seen.get(id(keyframe))
+            if slot is None:
+                slot = seen[id(keyframe)] = len(blocks) // max(1, len(self._current))
+                blocks.extend(keyframe)
+            slots.append(slot)
+        columns = [(name, getattr(self, name)) for name in self._COLUMNS]
+        columns += [("keyframe_slots", slots), ("keyframe_blocks", blocks),
+                    ("final", array('q', self._current))]
+        
+        # Lay the columns out after the header, each 8-byte aligned
+        header = {
+            "format": self.FILE_FORMAT,
+            "event_types": [event_type.value for event_type in _EVENT_TYPES],
+            "flags": {"type_mask": _TYPE_MASK, "has_values": _HAS_VALUES,
+                      "index_range": _INDEX_RANGE, "formatted": _FORMATTED,
+                      "args_are_values": _ARGS_ARE_VALUES},
+            "keyframe_interval": self.keyframe_interval,
+            "templates": self._templates,
+            "policy": self.policy.to_dict() if self.policy else None,
+            "counters": self.counters.to_dict() if self.counters else None,
+            "meta": meta,
+            "columns": [],
+        }
+        offset = 0
+        for name, column in columns:
+            header["columns"].append((name, column.typecode, column.itemsize,
+                                      offset, len(column)))
+            offset += -(-column.itemsize * len(column) // 8) * 8
+        encoded = json.dumps(header).encode()
+        start = -(-(len(self.FILE_MAGIC) + 4 + len(encoded)) // 8) * 8
+        
+        f.write(self.FILE_MAGIC)
+        f.write(len(encoded).to_bytes(4, "little"))
+        f.write(encoded)
+        for (name, column), (*_, column_offset, _) in zip(columns, header["columns"]):
+            f.seek(start + column_offset)
+            f.write(column)
+        f.truncate(start + offset)
+    
+    @classmethod
+    def load(cls, path: str) -> Tuple['EventTrace', Dict[str, Any]]:
+        """
+        Map a trace file written by save() (columns stay on disk; pages are
+        read as playback touches them); compressed files are decompressed
+        
+        Returns:
+            (read-only trace, header meta)
+        Raises:
+            ValueError: not a trace file, truncated, or another format version
+        """
+        with open(path, "rb") as f:
+            if f.read(len(cls.COMPRESSED_MAGIC)) == cls.COMPRESSED_MAGIC:
+                try:
+                    buffer = zlib.decompress(f.read())
+                except zlib.error as e:
+                    raise ValueError(f"Corrupt trace file: {path}") from e
+            else:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(buffer)
+        magic = len(cls.FILE_MAGIC)
+        if view[:magic] != cls.FILE_MAGIC:
+            raise ValueError(f"Not a trace file: {path}")
+        length = int.from_bytes(view[magic:magic + 4], "little")
+        header = json.loads(bytes(view[magic + 4:magic + 4 + length]))
+        if header.get("format") != cls.FILE_FORMAT:
+            raise ValueError(f"Unsupported trace format: {header.get('format')}")
+        start = -(-(magic + 4 + length) // 8) * 8
+        
+        columns = {}
+        for name, typecode, itemsize, offset, count in header["columns"]:
+            if array(typecode).itemsize != itemsize:
+                raise ValueError(f"Trace written with {itemsize}-byte '{typecode}' items")
+            begin = start + offset
+            if begin + itemsize * count > len(view):
+                raise ValueError(f"Truncated trace file: {path}")
+            columns[name] = view[begin:begin + itemsize * count].cast(typecode)
+        
+        counters = header["counters"]
+        if counters is not None:
+            counters = OperationCounters(**{name: count for name, count in counters.items()
+                                            if name != "cost"})
+        policy = header["policy"]
+        trace = cls([], header["keyframe_interval"],
+                    EmissionPolicy.from_dict(policy) if policy is not None else None,
+                    counters)
+        for name in cls._COLUMNS:
+            setattr(trace, name, columns[name])
+        trace._templates = header["templates"]
+        trace._keyframes = _MappedKeyframes(columns["keyframe_blocks"],
+                                            columns["keyframe_slots"],
+                                            len(columns["final"]))
+        trace._current = columns["final"].tolist()
+        trace._buffer = buffer
+        return trace, header["meta"]
+    
+    def __len__(self) -> int:
+        return len(self._types)
+    
+    def __getitem__(self, index: int) -> TraceEvent:
+        if index < 0:
+            index += len(self)
+        return TraceEvent(self, index, self.frame(index))
+    
+    def __iter__(self) -> Iterator[TraceEvent]:
+        """Yield event views with snapshots, replaying deltas incrementally"""
+        state = self._keyframes[0].copy() if self._keyframes else []
+        for i in range(len(self)):
+            self._apply_writes(state, i, i + 1)
+            yield TraceEvent(self, i, state.copy())
+
+
+class TraceCache:
+    """
+    LRU cache of finished event traces, bounded by their total size
+    
+    Keys are content addressed: algorithm name, emission policy, a digest
+    of the input array and the run options, so re-running an algorithm on
+    unchanged data replays its trace instead of regenerating it. The
+    least recently used traces are evicted once the traces held exceed
+    max_bytes (as reported by EventTrace.nbytes). With a store, misses
+    fall through to it and new traces are written to it as well.
+    """
+    
+    DEFAULT_MAX_BYTES = 64 * 2**20
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES,
+                 store: Optional['PersistentTraceCache'] = None):
+        self.max_bytes = max_bytes
+        self.store = store
+        self._entries: OrderedDict = OrderedDict()  # key -> (trace, trace_time, nbytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def digest(data: Sequence[int]) -> str:
+        """Content hash of an int array"""
+        try:
+            raw = array('q', data).tobytes()
+        except OverflowError:
+            raw = repr(list(data)).encode()
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+    
+    @staticmethod
+    def key(name: str, data: Sequence[int], policy: Optional[EmissionPolicy] = None,
+            **options) -> Tuple:
+        """Cache key of a run (options e.g. pivot, target, mode)"""
+        return (name, policy or EmissionPolicy(), TraceCache.digest(data),
+                tuple(sorted((option, repr(value)) for option, value in options.items())))
+    
+    def get(self, key: Tuple) -> Optional[Tuple[EventTrace, float]]:
+        """(trace, seconds it took to generate) for key, or None"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0], entry[1]
+        
+        stored = self.store.get(key) if self.store is not None else None
+        if stored is None:
+            self.misses += 1
+            return None
+        self._insert(key, *stored)
+        self.hits += 1
+        return stored
+    
+    def put(self, key: Tuple, trace: EventTrace, trace_time: float):
+        """Store a finished trace (and write it to the store, if any)"""
+        self._insert(key, trace, trace_time)
+        if self.store is not None:
+            self.store.put(key, trace, trace_time)
+    
+    def _insert(self, key: Tuple, trace: EventTrace, trace_time: float):
+        """Keep a trace in memory, evicting least recently used ones to fit"""
+        size = trace.nbytes()
+        if size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= old[2]
+        self._entries[key] = (trace, trace_time, size)
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+            self.evictions += 1
+    
+    def clear(self):
+        """Drop every trace (statistics are kept)"""
+        self._entries.clear()
+        self.nbytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def describe(self) -> str:
+        """Short summary for the status bar"""
+        text = (f"CACHE {self.hits} HIT/{self.misses} MISS, {self.evictions} EVICTED, "
+                f"{len(self)} TRACES {self.nbytes / 2**20:.1f}/{self.max_bytes / 2**20:.0f}MB")
+        if self.store is not None:
+            text += (f", DISK {self.store.hits} HIT/{self.store.stale} STALE/"
+                     f"{self.store.evictions} EVICTED")
+        return text
+
+
+class PersistentTraceCache:
+    """
+    On-disk trace store behind TraceCache, one binary file per run
+    
+    Files are named by a digest of the cache key and replayed through
+    mmap, so a trace from an earlier session starts playing without being
+    read in full. Every file is stamped with a digest of this module's
+    source: after any change to the algorithms, old traces no longer match
+    and are deleted when met. The oldest files (by last use) are evicted
+    once the directory holds more than max_bytes.
+    """
+    
+    DEFAULT_DIRECTORY = "trace_cache"
+    DEFAULT_MAX_BYTES = 8 * 2**30  # a 50M-event bubble sort trace is about 3.3 GB
+    SUFFIX = ".trace"
+    
+    _stamp: Optional[str] = None
+    
+    def __init__(self, directory: str = DEFAULT_DIRECTORY,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.stale = 0
+    
+    @staticmethod
+    def implementation_stamp() -> str:
+        """Digest of the core_algorithms source the traces were generated by"""
+        if PersistentTraceCache._stamp is None:
+            with open(__file__, "rb") as f:
+                PersistentTraceCache._stamp = hashlib.blake2b(
+                    f.read(), digest_size=16).hexdigest()
+        return PersistentTraceCache._stamp
+    
+    @staticmethod
+    def canonical(key: Tuple) -> str:
+        """
+        Session-independent text form of a TraceCache key
+        (repr of the policy's frozenset varies with PYTHONHASHSEED)
+        """
+        name, policy, digest, options = key
+        return json.dumps([name, policy.to_dict(), digest, [list(o) for o in options]],
+                          sort_keys=True)
+    
+    def path(self, key: Tuple) -> str:
+        name = hashlib.blake2b(self.canonical(key).encode(), digest_size=16).hexdigest()
+        return os.path.join(self.directory, name + self.SUFFIX)
+    
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+    
+    def get(self, key: Tuple) -> Optional[Tuple[EventTrace, float]]:
+        """(mapped trace, seconds it took to generate) for key, or None"""
+        path = self.path(key)
+        try:
+            trace, meta = EventTrace.load(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, truncated or from another format version
+            if os.path.exists(path) and self._remove(path):
+                self.stale += 1
+            self.misses += 1
+            return None
+        
+        if meta.get("stamp") != self.implementation_stamp() or meta.get("key") != self.canonical(key):
+            del trace
+            if self._remove(path):
+                self.stale += 1
+            self.misses += 1
+            return None
+        
+        os.utime(path)  # last use, for eviction order
+        self.hits += 1
+        return trace, meta["trace_time"]
+    
+    def put(self, key: Tuple, trace: EventTrace, trace_time: float):
+        """Write a finished trace, evicting the least recently used files to fit"""
+        path = self.path(key)
+        partial_path = path + ".part"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            trace.save(partial_path, stamp=self.implementation_stamp(),
+                       key=self.canonical(key), trace_time=trace_time)
+            os.replace(partial_path, path)
+        except (OSError, OverflowError):
+            # The cache is an optimization: a failed write only loses the entry
+            self._remove(partial_path)
+            return
+        self.evict()
+    
+    def _files(self) -> List[Tuple[float, int, str]]:
+        """(last use, size, path) of every trace file, oldest first"""
+        files = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return files
+        for name in names:
+            if name.endswith(self.SUFFIX):
+                path = os.path.join(self.directory, name)
+                try:
+                    info = os.stat(path)
+                except OSError:
+                    continue
+                files.append((info.st_mtime, info.st_size, path))
+        return sorted(files)
+    
+    def evict(self):
+        """Delete the oldest files until the directory fits in max_bytes"""
+        files = self._files()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            if self._remove(path):
+                total -= size
+                self.evictions += 1
+    
+    def nbytes(self) -> int:
+        return sum(size for _, size, _ in self._files())
+    
+    def clear(self):
+        """Delete every trace file"""
+        for _, _, path in self._files():
+            self._remove(path)
 
 
 class TreeNode:
@@ -40,638 +898,3946 @@ class AlgorithmCore:
     """Core algorithm implementations - pure functions that emit events"""
     
     @staticmethod
-    def bubble_sort(data: List[int]) -> List[AlgorithmEvent]:
+    def bubble_sort(data: List[int],
+                    policy: Optional[EmissionPolicy] = None,
+                    counters: Optional[OperationCounters] = None) -> EventTrace:
         """Bubble sort - returns event sequence"""
-        events = []
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            data, AlgorithmCore.iter_bubble_sort(data, policy, counters),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_bubble_sort(data: List[int],
+                         policy: Optional[EmissionPolicy] = None,
+                         counters: Optional[OperationCounters] = None) -> Iterator[AlgorithmEvent]:
+        """Bubble sort - yields events lazily"""
         n = len(data)
-        data_copy = data.copy()
+        data_copy = TrackedArray(data)
+        emit = EmissionGate(policy, data_copy)
+        counters = counters or OperationCounters()
         
         for i in range(n):
             for j in range(0, n - i - 1):
                 # Compare event
-                events.append(AlgorithmEvent(
-                    event_type=EventType.COMPARE,
-                    indices=[j, j + 1],
-                    values=[data_copy[j], data_copy[j + 1]],
-                    message=f"Comparing: {data_copy[j]} vs {data_copy[j+1]}",
-                    data_snapshot=data_copy.copy()
-                ))
+                if emit.allows(EventType.COMPARE):
+                    yield AlgorithmEvent(
+                        event_type=EventType.COMPARE,
+                        indices=[j, j + 1],
+                        values=[data_copy[j], data_copy[j + 1]],
+                        template="Comparing: {} vs {}",
+                        args=(data_copy[j], data_copy[j + 1]),
+                        writes=data_copy.drain_writes()
+                    )
                 
+                counters.comparisons += 1
                 if data_copy[j] > data_copy[j + 1]:
                     # Swap
                     data_copy[j], data_copy[j + 1] = data_copy[j + 1], data_copy[j]
-                    events.append(AlgorithmEvent(
-                        event_type=EventType.SWAP,
-                        indices=[j, j + 1],
-                        values=[data_copy[j], data_copy[j + 1]],
-                        message=f"Swapped: {data_copy[j]} ↔ {data_copy[j+1]}",
-                        data_snapshot=data_copy.copy()
-                    ))
+                    counters.swaps += 1
+                    if emit.allows(EventType.SWAP):
+                        yield AlgorithmEvent(
+                            event_type=EventType.SWAP,
+                            indices=[j, j + 1],
+                            values=[data_copy[j], data_copy[j + 1]],
+                            template="Swapped: {} ↔ {}",
+                            args=(data_copy[j], data_copy[j + 1]),
+                            writes=data_copy.drain_writes()
+                        )
             
             # Mark sorted
-            events.append(AlgorithmEvent(
-                event_type=EventType.SORTED,
-                indices=list(range(n - i, n)),
-                message=f"Position {n-i-1} sorted",
-                data_snapshot=data_copy.copy()
-            ))
+            if emit.allows(EventType.SORTED):
+                yield AlgorithmEvent(
+                    event_type=EventType.SORTED,
+                    indices=range(n - i, n),
+                    template="Position {} sorted",
+                    args=(n - i - 1,),
+                    writes=data_copy.drain_writes()
+                )
+        
+        counters.writes += data_copy.write_count
         
         # Final sorted event
-        events.append(AlgorithmEvent(
+        yield AlgorithmEvent(
             event_type=EventType.SORTED,
-            indices=list(range(n)),
+            indices=range(n),
             message="✓ Sorting Complete!",
-            data_snapshot=data_copy.copy()
-        ))
-        
-        return events
+            writes=data_copy.drain_writes()
+        )
 
     @staticmethod
-    def selection_sort(data: List[int]) -> List[AlgorithmEvent]:
+    def selection_sort(data: List[int],
+                       policy: Optional[EmissionPolicy] = None,
+                       counters: Optional[OperationCounters] = None) -> EventTrace:
         """Selection sort - returns event sequence"""
-        events = []
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            data, AlgorithmCore.iter_selection_sort(data, policy, counters),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_selection_sort(data: List[int],
+                            policy: Optional[EmissionPolicy] = None,
+                            counters: Optional[OperationCounters] = None) -> Iterator[AlgorithmEvent]:
+        """Selection sort - yields events lazily"""
         n = len(data)
-        data_copy = data.copy()
+        data_copy = TrackedArray(data)
+        emit = EmissionGate(policy, data_copy)
+        counters = counters or OperationCounters()
         
         for i in range(n):
             min_idx = i
             
             for j in range(i + 1, n):
                 # Compare to find minimum
-                events.append(AlgorithmEvent(
-                    event_type=EventType.COMPARE,
-                    indices=[j, min_idx],
-                    values=[data_copy[j], data_copy[min_idx]],
-                    message=f"Finding min: checking {data_copy[j]}",
-                    data_snapshot=data_copy.copy()
-                ))
+                if emit.allows(EventType.COMPARE):
+                    yield AlgorithmEvent(
+                        event_type=EventType.COMPARE,
+                        indices=[j, min_idx],
+                        values=[data_copy[j], data_copy[min_idx]],
+                        template="Finding min: checking {}",
+                        args=(data_copy[j],),
+                        writes=data_copy.drain_writes()
+                    )
                 
+                counters.comparisons += 1
                 if data_copy[j] < data_copy[min_idx]:
                     min_idx = j
             
             # Swap with minimum
             data_copy[i], data_copy[min_idx] = data_copy[min_idx], data_copy[i]
-            events.append(AlgorithmEvent(
-                event_type=EventType.SWAP,
-                indices=[i, min_idx],
-                values=[data_copy[i], data_copy[min_idx]],
-                message=f"Swapped: {data_copy[i]} to position {i}",
-                data_snapshot=data_copy.copy()
-            ))
+            counters.swaps += 1
+            if emit.allows(EventType.SWAP):
+                yield AlgorithmEvent(
+                    event_type=EventType.SWAP,
+                    indices=[i, min_idx],
+                    values=[data_copy[i], data_copy[min_idx]],
+                    template="Swapped: {} to position {}",
+                    args=(data_copy[i], i),
+                    writes=data_copy.drain_writes()
+                )
             
             # Mark sorted
-            events.append(AlgorithmEvent(
-                event_type=EventType.SORTED,
-                indices=list(range(i + 1)),
-                message=f"First {i+1} elements sorted",
-                data_snapshot=data_copy.copy()
-            ))
+            if emit.allows(EventType.SORTED):
+                yield AlgorithmEvent(
+                    event_type=EventType.SORTED,
+                    indices=range(i + 1),
+                    template="First {} elements sorted",
+                    args=(i + 1,),
+                    writes=data_copy.drain_writes()
+                )
+        
+        counters.writes += data_copy.write_count
         
         # Final sorted event
-        events.append(AlgorithmEvent(
+        yield AlgorithmEvent(
             event_type=EventType.SORTED,
-            indices=list(range(n)),
+            indices=range(n),
             message="✓ Sorting Complete!",
-            data_snapshot=data_copy.copy()
-        ))
-        
-        return events
+            writes=data_copy.drain_writes()
+        )
 
     @staticmethod
-    def insertion_sort(data: List[int]) -> List[AlgorithmEvent]:
+    def insertion_sort(data: List[int],
+                       policy: Optional[EmissionPolicy] = None,
+                       counters: Optional[OperationCounters] = None) -> EventTrace:
         """Insertion sort - returns event sequence"""
-        events = []
-        data_copy = data.copy()
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            data, AlgorithmCore.iter_insertion_sort(data, policy, counters),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_insertion_sort(data: List[int],
+                            policy: Optional[EmissionPolicy] = None,
+                            counters: Optional[OperationCounters] = None) -> Iterator[AlgorithmEvent]:
+        """Insertion sort - yields events lazily"""
+        data_copy = TrackedArray(data)
+        emit = EmissionGate(policy, data_copy)
+        counters = counters or OperationCounters()
         
         for i in range(1, len(data_copy)):
             key = data_copy[i]
             j = i - 1
             
             # Highlight key being inserted
-            events.append(AlgorithmEvent(
-                event_type=EventType.HIGHLIGHT,
-                indices=[i],
-                values=[key],
-                message=f"Inserting: {key}",
-                data_snapshot=data_copy.copy()
-            ))
+            if emit.allows(EventType.HIGHLIGHT):
+                yield AlgorithmEvent(
+                    event_type=EventType.HIGHLIGHT,
+                    indices=[i],
+                    values=[key],
+                    template="Inserting: {}",
+                    args=(key,),
+                    writes=data_copy.drain_writes()
+                )
             
             # Shift elements
             while j >= 0 and data_copy[j] > key:
-                events.append(AlgorithmEvent(
-                    event_type=EventType.COMPARE,
-                    indices=[j, j + 1],
-                    values=[data_copy[j], key],
-                    message=f"Shifting: {data_copy[j]} right",
-                    data_snapshot=data_copy.copy()
-                ))
+                counters.comparisons += 1
+                if emit.allows(EventType.COMPARE):
+                    yield AlgorithmEvent(
+                        event_type=EventType.COMPARE,
+                        indices=[j, j + 1],
+                        values=[data_copy[j], key],
+                        template="Shifting: {} right",
+                        args=(data_copy[j],),
+                        writes=data_copy.drain_writes()
+                    )
                 
                 data_copy[j + 1] = data_copy[j]
                 j -= 1
             
+            # The comparison that stopped the shifting
+            if j >= 0:
+                counters.comparisons += 1
             data_copy[j + 1] = key
             
             # Mark sorted section
-            events.append(AlgorithmEvent(
-                event_type=EventType.SORTED,
-                indices=list(range(i + 1)),
-                message=f"First {i+1} elements sorted",
-                data_snapshot=data_copy.copy()
-            ))
+            if emit.allows(EventType.SORTED):
+                yield AlgorithmEvent(
+                    event_type=EventType.SORTED,
+                    indices=range(i + 1),
+                    template="First {} elements sorted",
+                    args=(i + 1,),
+                    writes=data_copy.drain_writes()
+                )
+        
+        counters.writes += data_copy.write_count
         
         # Final sorted event
-        events.append(AlgorithmEvent(
+        yield AlgorithmEvent(
             event_type=EventType.SORTED,
-            indices=list(range(len(data_copy))),
+            indices=range(len(data_copy)),
             message="✓ Sorting Complete!",
-            data_snapshot=data_copy.copy()
-        ))
-        
-        return events
+            writes=data_copy.drain_writes()
+        )
 
     @staticmethod
-    def merge_sort(data: List[int]) -> List[AlgorithmEvent]:
+    def merge_sort(data: List[int],
+                   policy: Optional[EmissionPolicy] = None,
+                   counters: Optional[OperationCounters] = None) -> EventTrace:
         """Merge sort - returns event sequence"""
-        events = []
-        data_copy = data.copy()
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            data, AlgorithmCore.iter_merge_sort(data, policy, counters),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_merge_sort(data: List[int],
+                        policy: Optional[EmissionPolicy] = None,
+                        counters: Optional[OperationCounters] = None) -> Iterator[AlgorithmEvent]:
+        """
+        Merge sort - yields events lazily
+        Bottom-up: runs of width 1, 2, 4, ... are merged pairwise through a
+        single buffer allocated once; pairs already in order are skipped
+        """
+        data_copy = TrackedArray(data)
+        emit = EmissionGate(policy, data_copy)
+        counters = counters or OperationCounters()
+        n = len(data_copy)
         
-        def merge_sort_helper(arr: List[int], l: int, r: int, depth: int = 0):
-            if l < r:
-                m = (l + r) // 2
-                
-                # Divide event
-                events.append(AlgorithmEvent(
-                    event_type=EventType.DIVIDE,
-                    indices=list(range(l, r + 1)),
-                    message=f"Dividing: [{l}:{r}]",
-                    data_snapshot=arr.copy()
-                ))
-                
-                merge_sort_helper(arr, l, m, depth + 1)
-                merge_sort_helper(arr, m + 1, r, depth + 1)
-                merge(arr, l, m, r)
-                
-                # Merge complete event
-                events.append(AlgorithmEvent(
-                    event_type=EventType.MERGE,
-                    indices=list(range(l, r + 1)),
-                    message=f"Merged: [{l}:{r}]",
-                    data_snapshot=arr.copy()
-                ))
-        
-        def merge(arr: List[int], l: int, m: int, r: int):
-            left = arr[l:m + 1]
-            right = arr[m + 1:r + 1]
-            i = j = 0
-            k = l
-            
-            while i < len(left) and j < len(right):
-                events.append(AlgorithmEvent(
-                    event_type=EventType.COMPARE,
-                    indices=[k],
-                    values=[left[i], right[j]],
-                    message=f"Merging at position {k}",
-                    data_snapshot=arr.copy()
-                ))
+        # Left runs are copied here and merged back, so every write lands
+        # in the displayed array
+        buffer = [0] * (n // 2 + 1)
+        counters.allocations += len(buffer)
+        
+        def merge(arr: List[int], lo: int, mid: int, hi: int):
+            size = mid - lo
+            buffer[:size] = arr[lo:mid]
+            i, j, k = 0, mid, lo
+            
+            while i < size and j < hi:
+                if emit.allows(EventType.COMPARE):
+                    yield AlgorithmEvent(
+                        event_type=EventType.COMPARE,
+                        indices=[k, j],
+                        values=[buffer[i], arr[j]],
+                        template="Merging at position {}",
+                        args=(k,),
+                        writes=arr.drain_writes()
+                    )
                 
-                if left[i] <= right[j]:
-                    arr[k] = left[i]
+                counters.comparisons += 1
+                if buffer[i] <= arr[j]:
+                    arr[k] = buffer[i]
                     i += 1
                 else:
-                    arr[k] = right[j]
+                    arr[k] = arr[j]
                     j += 1
                 k += 1
             
-            while i < len(left):
-                arr[k] = left[i]
+            # Leftover right-run keys are already in place
+            while i < size:
+                arr[k] = buffer[i]
                 i += 1
                 k += 1
+        
+        width = 1
+        while width < n:
+            # Divide event: the runs of this pass
+            if emit.allows(EventType.DIVIDE):
+                yield AlgorithmEvent(
+                    event_type=EventType.DIVIDE,
+                    indices=range(n),
+                    template="Dividing: runs of {}",
+                    args=(width,),
+                    writes=data_copy.drain_writes()
+                )
             
-            while j < len(right):
-                arr[k] = right[j]
-                j += 1
-                k += 1
+            for lo in range(0, n - width, 2 * width):
+                mid = lo + width
+                hi = min(lo + 2 * width, n)
+                
+                counters.comparisons += 1
+                if data_copy[mid - 1] <= data_copy[mid]:
+                    # Runs already in order: nothing to merge
+                    if emit.allows(EventType.MERGE):
+                        yield AlgorithmEvent(
+                            event_type=EventType.MERGE,
+                            indices=range(lo, hi),
+                            template="Already ordered: [{}:{}]",
+                            args=(lo, hi - 1),
+                            writes=data_copy.drain_writes()
+                        )
+                    continue
+                
+                yield from merge(data_copy, lo, mid, hi)
+                
+                # Merge complete event
+                if emit.allows(EventType.MERGE):
+                    yield AlgorithmEvent(
+                        event_type=EventType.MERGE,
+                        indices=range(lo, hi),
+                        template="Merged: [{}:{}]",
+                        args=(lo, hi - 1),
+                        writes=data_copy.drain_writes()
+                    )
+            
+            width *= 2
         
-        merge_sort_helper(data_copy, 0, len(data_copy) - 1)
+        counters.writes += data_copy.write_count
         
         # Final sorted event
-        events.append(AlgorithmEvent(
+        yield AlgorithmEvent(
             event_type=EventType.SORTED,
-            indices=list(range(len(data_copy))),
+            indices=range(len(data_copy)),
             message="✓ Sorting Complete!",
-            data_snapshot=data_copy.copy()
-        ))
-        
-        return events
+            writes=data_copy.drain_writes()
+        )
 
+    # Quick sort pivot selection strategies
+    PIVOT_STRATEGIES = ("median3", "ninther", "random", "last")
+    NINTHER_MIN_SIZE = 40  # below this, ninther falls back to median-of-three
+    
+    @staticmethod
+    def _median_index(arr: List[int], a: int, b: int, c: int) -> int:
+        """Index of the median of arr[a], arr[b], arr[c] (always 3 comparisons)"""
+        ab = arr[a] < arr[b]
+        bc = arr[b] < arr[c]
+        ac = arr[a] < arr[c]
+        if ab == bc:
+            return b
+        return c if ab == ac else a
+    
+    @staticmethod
+    def _pivot_index(arr: List[int], low: int, high: int, strategy: str,
+                     rng: random.Random, counters: OperationCounters) -> int:
+        """
+        Choose a pivot index for arr[low:high + 1]
+        median3 also orders the three samples in place, which keeps sorted
+        and reversed input balanced once the pivot is parked at `low`
+        """
+        if strategy == "last" or high - low < 2:
+            return high
+        if strategy == "random":
+            return rng.randint(low, high)
+        
+        mid = (low + high) // 2
+        if strategy == "ninther" and high - low + 1 >= AlgorithmCore.NINTHER_MIN_SIZE:
+            # Median of the medians of three evenly spread triples
+            step = (high - low + 1) // 8
+            median = AlgorithmCore._median_index
+            counters.comparisons += 12
+            return median(
+                arr,
+                median(arr, low, low + step, low + 2 * step),
+                median(arr, mid - step, mid, mid + step),
+                median(arr, high - 2 * step, high - step, high)
+            )
+        
+        # Median-of-three: sort arr[low], arr[mid], arr[high]
+        counters.comparisons += 2
+        if arr[mid] < arr[low]:
+            arr[low], arr[mid] = arr[mid], arr[low]
+            counters.swaps += 1
+        if arr[high] < arr[mid]:
+            arr[mid], arr[high] = arr[high], arr[mid]
+            counters.swaps += 1
+            counters.comparisons += 1
+            if arr[mid] < arr[low]:
+                arr[low], arr[mid] = arr[mid], arr[low]
+                counters.swaps += 1
+        return mid
+    
     @staticmethod
-    def quick_sort(data: List[int]) -> List[AlgorithmEvent]:
+    def quick_sort(data: List[int],
+                   policy: Optional[EmissionPolicy] = None,
+                   counters: Optional[OperationCounters] = None,
+                   pivot: str = "median3") -> EventTrace:
         """Quick sort - returns event sequence"""
-        events = []
-        data_copy = data.copy()
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            data, AlgorithmCore.iter_quick_sort(data, policy, counters, pivot),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_quick_sort(data: List[int],
+                        policy: Optional[EmissionPolicy] = None,
+                        counters: Optional[OperationCounters] = None,
+                        pivot: str = "median3") -> Iterator[AlgorithmEvent]:
+        """
+        Quick sort - yields events lazily
+        Introsort: explicit stack (smaller side first, so it stays O(log n)),
+        three-way (Bentley-McIlroy) partitioning for duplicates, and heap
+        sort for any range that goes deeper than 2·log2(n)
+        
+        Args:
+            pivot: one of PIVOT_STRATEGIES
+        """
+        if pivot not in AlgorithmCore.PIVOT_STRATEGIES:
+            raise ValueError(f"Unknown pivot strategy: {pivot}")
+        
+        data_copy = TrackedArray(data)
+        emit = EmissionGate(policy, data_copy)
+        counters = counters or OperationCounters()
+        n = len(data_copy)
+        rng = random.Random(n)  # seeded so traces are reproducible
+        depth_limit = 2 * int(math.log2(n)) if n > 1 else 0
+        pivot_template = f"Pivot ({pivot}): {{}}"
+        
+        def swap(arr: List[int], a: int, b: int, template: str = "Swapped: {} ↔ {}"):
+            arr[a], arr[b] = arr[b], arr[a]
+            counters.swaps += 1
+            if emit.allows(EventType.SWAP):
+                yield AlgorithmEvent(
+                    event_type=EventType.SWAP,
+                    indices=[a, b],
+                    values=[arr[a], arr[b]],
+                    template=template,
+                    args=(arr[a], arr[b]),
+                    writes=arr.drain_writes()
+                )
+        
+        def compare(arr: List[int], i: int, low: int):
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=[i, low],
+                    values=[arr[i], arr[low]],
+                    template="Pivot: {}, checking {}",
+                    args=(arr[low], arr[i]),
+                    writes=arr.drain_writes()
+                )
         
-        def partition(arr: List[int], low: int, high: int) -> int:
-            pivot = arr[high]
-            i = low - 1
+        def partition(arr: List[int], low: int, high: int):
+            p = AlgorithmCore._pivot_index(arr, low, high, pivot, rng, counters)
+            v = arr[p]
             
             # Mark pivot
-            events.append(AlgorithmEvent(
-                event_type=EventType.PIVOT,
-                indices=[high],
-                values=[pivot],
-                message=f"Pivot: {pivot}",
-                data_snapshot=arr.copy()
-            ))
+            if emit.allows(EventType.PIVOT):
+                yield AlgorithmEvent(
+                    event_type=EventType.PIVOT,
+                    indices=[p],
+                    values=[v],
+                    template=pivot_template,
+                    args=(v,),
+                    writes=arr.drain_writes()
+                )
             
-            for j in range(low, high):
-                events.append(AlgorithmEvent(
-                    event_type=EventType.COMPARE,
-                    indices=[j, high],
-                    values=[arr[j], pivot],
-                    message=f"Pivot: {pivot}, checking {arr[j]}",
-                    data_snapshot=arr.copy()
-                ))
-                
-                if arr[j] <= pivot:
+            # Park the pivot at `low`; keys equal to it collect at both ends
+            if p != low:
+                yield from swap(arr, low, p, "Pivot {} to front, {} out")
+            
+            i, j = low, high + 1
+            eq_left, eq_right = low, high + 1
+            while True:
+                # Scan right past keys smaller than the pivot
+                i += 1
+                while True:
+                    yield from compare(arr, i, low)
+                    counters.comparisons += 1
+                    if not arr[i] < v or i == high:
+                        break
                     i += 1
-                    arr[i], arr[j] = arr[j], arr[i]
-                    
-                    events.append(AlgorithmEvent(
-                        event_type=EventType.SWAP,
-                        indices=[i, j],
-                        values=[arr[i], arr[j]],
-                        message=f"Swapped: {arr[i]} ↔ {arr[j]}",
-                        data_snapshot=arr.copy()
-                    ))
-            
-            arr[i + 1], arr[high] = arr[high], arr[i + 1]
-            events.append(AlgorithmEvent(
-                event_type=EventType.SWAP,
-                indices=[i + 1, high],
-                values=[arr[i + 1], arr[high]],
-                message=f"Pivot {pivot} in place",
-                data_snapshot=arr.copy()
-            ))
+                
+                # Scan left past keys larger than the pivot
+                j -= 1
+                while True:
+                    yield from compare(arr, j, low)
+                    counters.comparisons += 1
+                    if not v < arr[j] or j == low:
+                        break
+                    j -= 1
+                
+                if i == j:
+                    counters.comparisons += 1
+                    if arr[i] == v:
+                        eq_left += 1
+                        yield from swap(arr, eq_left, i)
+                if i >= j:
+                    break
+                
+                yield from swap(arr, i, j)
+                
+                # Move keys equal to the pivot out to the ends
+                counters.comparisons += 2
+                if arr[i] == v:
+                    eq_left += 1
+                    yield from swap(arr, eq_left, i)
+                if arr[j] == v:
+                    eq_right -= 1
+                    yield from swap(arr, eq_right, j)
+            
+            # Bring the equal keys back to the middle
+            i = j + 1
+            for k in range(low, eq_left + 1):
+                if k != j:
+                    yield from swap(arr, k, j)
+                j -= 1
+            for k in range(high, eq_right - 1, -1):
+                if k != i:
+                    yield from swap(arr, k, i)
+                i += 1
+            
+            if emit.allows(EventType.PIVOT):
+                yield AlgorithmEvent(
+                    event_type=EventType.PIVOT,
+                    indices=range(j + 1, i),
+                    values=[v],
+                    template="Pivot {} in place",
+                    args=(v,),
+                    writes=arr.drain_writes()
+                )
+            
+            # arr[low:j + 1] < v, arr[j + 1:i] == v, arr[i:high + 1] > v
+            return j, i
+        
+        def heap_sort_range(arr: List[int], low: int, high: int):
+            # Fallback for ranges that hit the depth limit
+            if emit.allows(EventType.HIGHLIGHT):
+                yield AlgorithmEvent(
+                    event_type=EventType.HIGHLIGHT,
+                    indices=range(low, high + 1),
+                    template="Depth limit: heap sorting [{}:{}]",
+                    args=(low, high),
+                    writes=arr.drain_writes()
+                )
             
-            return i + 1
+            def sift_down(root: int, end: int):
+                while True:
+                    child = low + 2 * (root - low) + 1
+                    if child > end:
+                        return
+                    if child + 1 <= end:
+                        counters.comparisons += 1
+                        if arr[child] < arr[child + 1]:
+                            child += 1
+                    counters.comparisons += 1
+                    if not arr[root] < arr[child]:
+                        return
+                    yield from swap(arr, root, child, "Heapify: swapping {} ↔ {}")
+                    root = child
+            
+            for start in range(low + (high - low - 1) // 2, low - 1, -1):
+                yield from sift_down(start, high)
+            for end in range(high, low, -1):
+                yield from swap(arr, low, end, "Heap max {} moved past {}")
+                yield from sift_down(low, end - 1)
         
-        def quick_sort_helper(arr: List[int], low: int, high: int):
-            if low < high:
-                pi = partition(arr, low, high)
-                quick_sort_helper(arr, low, pi - 1)
-                quick_sort_helper(arr, pi + 1, high)
+        # Explicit stack of (low, high, depth) ranges
+        stack = [(0, n - 1, 0)]
+        while stack:
+            low, high, depth = stack.pop()
+            if low >= high:
+                continue
+            counters.observe_depth(depth)
+            
+            if depth > depth_limit:
+                yield from heap_sort_range(data_copy, low, high)
+                continue
+            
+            j, i = yield from partition(data_copy, low, high)
+            
+            # Push the larger side first so the smaller one is handled next
+            left, right = (low, j, depth + 1), (i, high, depth + 1)
+            if j - low > high - i:
+                stack.append(left)
+                stack.append(right)
+            else:
+                stack.append(right)
+                stack.append(left)
         
-        quick_sort_helper(data_copy, 0, len(data_copy) - 1)
+        counters.writes += data_copy.write_count
         
         # Final sorted event
-        events.append(AlgorithmEvent(
+        yield AlgorithmEvent(
             event_type=EventType.SORTED,
-            indices=list(range(len(data_copy))),
+            indices=range(len(data_copy)),
             message="✓ Sorting Complete!",
-            data_snapshot=data_copy.copy()
-        ))
-        
-        return events
+            writes=data_copy.drain_writes()
+        )
 
     @staticmethod
-    def heap_sort(data: List[int]) -> List[AlgorithmEvent]:
+    def heap_sort(data: List[int],
+                  policy: Optional[EmissionPolicy] = None,
+                  counters: Optional[OperationCounters] = None) -> EventTrace:
         """Heap sort - returns event sequence"""
-        events = []
-        data_copy = data.copy()
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            data, AlgorithmCore.iter_heap_sort(data, policy, counters),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_heap_sort(data: List[int],
+                       policy: Optional[EmissionPolicy] = None,
+                       counters: Optional[OperationCounters] = None) -> Iterator[AlgorithmEvent]:
+        """
+        Heap sort - yields events lazily
+        Floyd's bottom-up construction, then extraction; every sift-down is
+        iterative and uses the bounce heuristic: follow the larger child to
+        a leaf (one comparison per level), then climb back to where the
+        sifted key belongs, which usually is near the bottom
+        """
+        data_copy = TrackedArray(data)
+        emit = EmissionGate(policy, data_copy)
+        counters = counters or OperationCounters()
+        n = len(data_copy)
         
-        def heapify(arr: List[int], n: int, i: int):
-            largest = i
-            l = 2 * i + 1
-            r = 2 * i + 2
+        def sift_down(arr: List[int], root: int, size: int):
+            x = arr[root]
             
-            if l < n and arr[i] < arr[l]:
-                largest = l
+            # Descend to a leaf along the larger children
+            leaf = root
+            while True:
+                child = 2 * leaf + 1
+                if child >= size:
+                    break
+                if child + 1 < size:
+                    if emit.allows(EventType.COMPARE):
+                        yield AlgorithmEvent(
+                            event_type=EventType.COMPARE,
+                            indices=[child, child + 1],
+                            values=[arr[child], arr[child + 1]],
+                            template="Heap: larger child of {}",
+                            args=(leaf,),
+                            writes=arr.drain_writes()
+                        )
+                    counters.comparisons += 1
+                    if arr[child] < arr[child + 1]:
+                        child += 1
+                leaf = child
             
-            if r < n and arr[largest] < arr[r]:
-                largest = r
+            # Bounce back up to the first key not smaller than x
+            while leaf > root:
+                if emit.allows(EventType.COMPARE):
+                    yield AlgorithmEvent(
+                        event_type=EventType.COMPARE,
+                        indices=[leaf],
+                        values=[arr[leaf], x],
+                        template="Bounce: {} vs {}",
+                        args=(arr[leaf], x),
+                        writes=arr.drain_writes()
+                    )
+                counters.comparisons += 1
+                if not arr[leaf] < x:
+                    break
+                leaf = (leaf - 1) // 2
             
-            if largest != i:
-                arr[i], arr[largest] = arr[largest], arr[i]
-                
-                events.append(AlgorithmEvent(
-                    event_type=EventType.SWAP,
-                    indices=[i, largest],
-                    values=[arr[i], arr[largest]],
-                    message=f"Heapify: swapping {arr[largest]} ↔ {arr[i]}",
-                    data_snapshot=arr.copy()
-                ))
-                
-                heapify(arr, n, largest)
-        
-        n = len(data_copy)
+            if leaf == root:
+                return
+            
+            # Put x there and shift the path above it up one level
+            path = [leaf]
+            carry, arr[leaf] = arr[leaf], x
+            node = leaf
+            while node > root:
+                node = (node - 1) // 2
+                carry, arr[node] = arr[node], carry
+                path.append(node)
+            
+            if emit.allows(EventType.SET):
+                yield AlgorithmEvent(
+                    event_type=EventType.SET,
+                    indices=path,
+                    values=[x],
+                    template="Sift: {} settles at {}",
+                    args=(x, leaf),
+                    writes=arr.drain_writes()
+                )
         
-        # Build max heap
+        # Build phase: heapify subtrees bottom-up
         for i in range(n // 2 - 1, -1, -1):
-            heapify(data_copy, n, i)
+            if emit.allows(EventType.BUILD):
+                yield AlgorithmEvent(
+                    event_type=EventType.BUILD,
+                    indices=[j for j in (i, 2 * i + 1, 2 * i + 2) if j < n],
+                    template="Build: heapifying subtree at {}",
+                    args=(i,),
+                    writes=data_copy.drain_writes()
+                )
+            yield from sift_down(data_copy, i, n)
         
-        # Extract elements one by one
-        for i in range(n - 1, 0, -1):
-            data_copy[i], data_copy[0] = data_copy[0], data_copy[i]
+        # Extract phase: move the max behind the shrinking heap
+        for end in range(n - 1, 0, -1):
+            data_copy[end], data_copy[0] = data_copy[0], data_copy[end]
+            counters.swaps += 1
             
-            events.append(AlgorithmEvent(
-                event_type=EventType.SWAP,
-                indices=[0, i],
-                values=[data_copy[0], data_copy[i]],
-                message=f"Moving {data_copy[i]} to sorted position",
-                data_snapshot=data_copy.copy()
-            ))
+            if emit.allows(EventType.EXTRACT):
+                yield AlgorithmEvent(
+                    event_type=EventType.EXTRACT,
+                    indices=[0, end],
+                    values=[data_copy[0], data_copy[end]],
+                    template="Extract: max {} to position {}",
+                    args=(data_copy[end], end),
+                    writes=data_copy.drain_writes()
+                )
             
-            events.append(AlgorithmEvent(
-                event_type=EventType.SORTED,
-                indices=list(range(i, n)),
-                message=f"Sorted from position {i}",
-                data_snapshot=data_copy.copy()
-            ))
+            if emit.allows(EventType.SORTED):
+                yield AlgorithmEvent(
+                    event_type=EventType.SORTED,
+                    indices=range(end, n),
+                    template="Sorted from position {}",
+                    args=(end,),
+                    writes=data_copy.drain_writes()
+                )
             
-            heapify(data_copy, i, 0)
+            yield from sift_down(data_copy, 0, end)
+        
+        counters.writes += data_copy.write_count
         
         # Final sorted event
-        events.append(AlgorithmEvent(
+        yield AlgorithmEvent(
             event_type=EventType.SORTED,
-            indices=list(range(n)),
+            indices=range(n),
             message="✓ Sorting Complete!",
-            data_snapshot=data_copy.copy()
-        ))
-        
-        return events
+            writes=data_copy.drain_writes()
+        )
 
+    # Radix sort digit bases: 10 reads well in the visualizer, 256 is fastest
+    RADIX_BASES = (10, 256)
+    
     @staticmethod
-    def radix_sort(data: List[int]) -> List[AlgorithmEvent]:
-        """Radix sort - returns event sequence"""
-        events = []
-        data_copy = data.copy()
-        
-        def counting_sort_for_radix(arr: List[int], exp: int):
-            n = len(arr)
-            output = [0] * n
-            count = [0] * 10
-            
-            for i in range(n):
-                index = arr[i] // exp
-                count[index % 10] += 1
-            
-            for i in range(1, 10):
-                count[i] += count[i - 1]
-            
-            i = n - 1
-            while i >= 0:
-                index = arr[i] // exp
-                output[count[index % 10] - 1] = arr[i]
-                count[index % 10] -= 1
-                i -= 1
-            
-            for i in range(n):
-                arr[i] = output[i]
-                events.append(AlgorithmEvent(
-                    event_type=EventType.SET,
-                    indices=[i],
-                    values=[arr[i]],
-                    message=f"Digit sort: processing position {i}",
-                    data_snapshot=arr.copy()
-                ))
+    def _radix_passes(keys: np.ndarray, base: int) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """
+        Vectorized LSD radix sort of non-negative int64 keys
+        Each pass is a counting sort on one digit: bincount gives the bucket
+        sizes and a stable argsort of the small digit type does the scatter
+        (NumPy sorts uint8/uint16 keys with a linear-time radix sort)
         
-        max_val = max(data_copy)
-        exp = 1
+        Yields:
+            (digit place, keys sorted up to this digit, bucket counts)
+        """
+        digit_type = np.uint8 if base <= 256 else np.uint16
+        shift = base.bit_length() - 1 if base & (base - 1) == 0 else None
+        max_key = int(keys.max()) if len(keys) else 0
+        place = 1
+        
+        while max_key // place > 0:
+            if shift is not None:
+                # Power-of-two base: digits are bit fields
+                digits = ((keys >> (place.bit_length() - 1)) & (base - 1)).astype(digit_type)
+            else:
+                digits = ((keys // place) % base).astype(digit_type)
+            counts = np.bincount(digits, minlength=base)
+            keys = keys[np.argsort(digits, kind='stable')]
+            yield place, keys, counts
+            place *= base
+    
+    @staticmethod
+    def _check_radix_base(base: int):
+        if not 2 <= base <= 65536:
+            raise ValueError(f"Radix base must be between 2 and 65536, got {base}")
+    
+    @staticmethod
+    def radix_sort_array(values: np.ndarray, base: int = 256) -> np.ndarray:
+        """
+        Radix sort a NumPy integer array (benchmark engine, no events)
+        Negative values are handled by offsetting keys by the minimum
         
-        while max_val // exp > 0:
-            counting_sort_for_radix(data_copy, exp)
-            exp *= 10
+        Args:
+            values: 1-D integer array (not modified)
+            base: digit base, 2..65536
         
-        # Final sorted event
-        events.append(AlgorithmEvent(
-            event_type=EventType.SORTED,
-            indices=list(range(len(data_copy))),
-            message="✓ Sorting Complete!",
-            data_snapshot=data_copy.copy()
-        ))
+        Returns:
+            sorted int64 array
+        """
+        AlgorithmCore._check_radix_base(base)
+        values = np.asarray(values, dtype=np.int64)
+        if len(values) < 2:
+            return values.copy()
         
-        return events
+        low = values.min()
+        keys = values - low
+        for _, keys, _ in AlgorithmCore._radix_passes(keys, base):
+            pass
+        return keys + low
+    
+    @staticmethod
+    def radix_sort(data: List[int],
+                   policy: Optional[EmissionPolicy] = None,
+                   counters: Optional[OperationCounters] = None,
+                   base: int = 10) -> EventTrace:
+        """Radix sort - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            data, AlgorithmCore.iter_radix_sort(data, policy, counters, base),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_radix_sort(data: List[int],
+                        policy: Optional[EmissionPolicy] = None,
+                        counters: Optional[OperationCounters] = None,
+                        base: int = 10) -> Iterator[AlgorithmEvent]:
+        """
+        Radix sort - yields events lazily
+        Each digit pass runs vectorized and emits one event carrying the
+        positions it changed
+        
+        Args:
+            base: digit base, one of RADIX_BASES or any value 2..65536
+        """
+        AlgorithmCore._check_radix_base(base)
+        data_copy = TrackedArray(data)
+        emit = EmissionGate(policy, data_copy)
+        counters = counters or OperationCounters()
+        n = len(data_copy)
+        
+        if n > 1:
+            values = np.array(data_copy, dtype=np.int64)
+            low = int(values.min())
+            
+            # Offset by the minimum so negative numbers become plain keys
+            if low < 0 and emit.allows(EventType.HIGHLIGHT):
+                yield AlgorithmEvent(
+                    event_type=EventType.HIGHLIGHT,
+                    indices=range(n),
+                    template="Offsetting keys by {} for negatives",
+                    args=(-low,),
+                    writes=data_copy.drain_writes()
+                )
+            
+            passes = AlgorithmCore._radix_passes(values - low, base)
+            for pass_number, (place, keys, counts) in enumerate(passes, 1):
+                # Digits, bucket counts, scatter order and the new keys
+                counters.allocations += 3 * n + base
+                
+                sorted_values = keys + low
+                changed = np.flatnonzero(sorted_values != values)
+                data_copy.assign(changed.tolist(), sorted_values[changed].tolist())
+                values = sorted_values
+                
+                if emit.allows(EventType.SET):
+                    yield AlgorithmEvent(
+                        event_type=EventType.SET,
+                        indices=range(n),
+                        template="Pass {}: sorted by digit place {} (base {})",
+                        args=(pass_number, place, base),
+                        writes=data_copy.drain_writes()
+                    )
+        
+        counters.writes += data_copy.write_count
+        
+        # Final sorted event
+        yield AlgorithmEvent(
+            event_type=EventType.SORTED,
+            indices=range(len(data_copy)),
+            message="✓ Sorting Complete!",
+            writes=data_copy.drain_writes()
+        )
+
+
+    @staticmethod
+    def binary_insertion_sort(data: List[int],
+                              policy: Optional[EmissionPolicy] = None,
+                              counters: Optional[OperationCounters] = None) -> EventTrace:
+        """Binary insertion sort - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            data, AlgorithmCore.iter_binary_insertion_sort(data, policy, counters),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_binary_insertion_sort(data: List[int],
+                                   policy: Optional[EmissionPolicy] = None,
+                                   counters: Optional[OperationCounters] = None) -> Iterator[AlgorithmEvent]:
+        """
+        Binary insertion sort - yields events lazily
+        Insertion sort that finds each slot by binary search, so it makes
+        O(n log n) comparisons (moves stay O(n²), done as block shifts)
+        """
+        data_copy = TrackedArray(data)
+        emit = EmissionGate(policy, data_copy)
+        counters = counters or OperationCounters()
+        n = len(data_copy)
+        
+        for i in range(1, n):
+            key = data_copy[i]
+            
+            # Binary search for the slot after any equal keys (stable)
+            low, high = 0, i
+            while low < high:
+                mid = (low + high) // 2
+                if emit.allows(EventType.COMPARE):
+                    yield AlgorithmEvent(
+                        event_type=EventType.COMPARE,
+                        indices=[mid, i],
+                        values=[data_copy[mid], key],
+                        template="Slot for {}: probing {}",
+                        args=(key, data_copy[mid]),
+                        writes=data_copy.drain_writes()
+                    )
+                counters.comparisons += 1
+                if key < data_copy[mid]:
+                    high = mid
+                else:
+                    low = mid + 1
+            
+            if low < i:
+                data_copy[low + 1:i + 1] = data_copy[low:i]
+                data_copy[low] = key
+                if emit.allows(EventType.SET):
+                    yield AlgorithmEvent(
+                        event_type=EventType.SET,
+                        indices=range(low, i + 1),
+                        values=[key],
+                        template="Inserted {} at {}",
+                        args=(key, low),
+                        writes=data_copy.drain_writes()
+                    )
+            
+            # Mark sorted section
+            if emit.allows(EventType.SORTED):
+                yield AlgorithmEvent(
+                    event_type=EventType.SORTED,
+                    indices=range(i + 1),
+                    template="First {} elements sorted",
+                    args=(i + 1,),
+                    writes=data_copy.drain_writes()
+                )
+        
+        counters.writes += data_copy.write_count
+        
+        # Final sorted event
+        yield AlgorithmEvent(
+            event_type=EventType.SORTED,
+            indices=range(n),
+            message="✓ Sorting Complete!",
+            writes=data_copy.drain_writes()
+        )
+
+    # Ciura's empirically best Shell sort gaps, extended by x2.25
+    CIURA_GAPS = (1, 4, 10, 23, 57, 132, 301, 701, 1750)
+    
+    @staticmethod
+    def _shell_gaps(n: int) -> List[int]:
+        """Gaps smaller than n, largest first"""
+        gaps = list(AlgorithmCore.CIURA_GAPS)
+        while gaps[-1] < n:
+            gaps.append(int(gaps[-1] * 2.25))
+        return [gap for gap in reversed(gaps) if gap < n]
+    
+    @staticmethod
+    def shell_sort(data: List[int],
+                   policy: Optional[EmissionPolicy] = None,
+                   counters: Optional[OperationCounters] = None) -> EventTrace:
+        """Shell sort - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            data, AlgorithmCore.iter_shell_sort(data, policy, counters),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_shell_sort(data: List[int],
+                        policy: Optional[EmissionPolicy] = None,
+                        counters: Optional[OperationCounters] = None) -> Iterator[AlgorithmEvent]:
+        """
+        Shell sort - yields events lazily
+        Gapped insertion sort over Ciura's gap sequence; the final gap of 1
+        is a plain insertion sort over nearly sorted data
+        """
+        data_copy = TrackedArray(data)
+        emit = EmissionGate(policy, data_copy)
+        counters = counters or OperationCounters()
+        n = len(data_copy)
+        
+        for gap in AlgorithmCore._shell_gaps(n):
+            if emit.allows(EventType.DIVIDE):
+                yield AlgorithmEvent(
+                    event_type=EventType.DIVIDE,
+                    indices=range(0, n, gap),
+                    template="Gap {}: sorting interleaved slices",
+                    args=(gap,),
+                    writes=data_copy.drain_writes()
+                )
+            
+            for i in range(gap, n):
+                key = data_copy[i]
+                j = i
+                while j >= gap:
+                    if emit.allows(EventType.COMPARE):
+                        yield AlgorithmEvent(
+                            event_type=EventType.COMPARE,
+                            indices=[j - gap, j],
+                            values=[data_copy[j - gap], key],
+                            template="Gap {}: {} vs {}",
+                            args=(gap, data_copy[j - gap], key),
+                            writes=data_copy.drain_writes()
+                        )
+                    counters.comparisons += 1
+                    if not data_copy[j - gap] > key:
+                        break
+                    data_copy[j] = data_copy[j - gap]
+                    j -= gap
+                
+                if j != i:
+                    data_copy[j] = key
+                    if emit.allows(EventType.SET):
+                        yield AlgorithmEvent(
+                            event_type=EventType.SET,
+                            indices=range(j, i + 1, gap),
+                            values=[key],
+                            template="Gap {}: {} moved to {}",
+                            args=(gap, key, j),
+                            writes=data_copy.drain_writes()
+                        )
+        
+        counters.writes += data_copy.write_count
+        
+        # Final sorted event
+        yield AlgorithmEvent(
+            event_type=EventType.SORTED,
+            indices=range(n),
+            message="✓ Sorting Complete!",
+            writes=data_copy.drain_writes()
+        )
+
+    # TimSort tuning (Java's values; CPython uses 64 for MIN_MERGE)
+    TIM_MIN_MERGE = 32  # below this, one natural run plus binary insertion
+    TIM_MIN_GALLOP = 7  # consecutive wins before merging switches to galloping
+    
+    @staticmethod
+    def _min_run_length(n: int) -> int:
+        """Run length that makes n / minrun a power of two or just below"""
+        r = 0
+        while n >= AlgorithmCore.TIM_MIN_MERGE:
+            r |= n & 1
+            n >>= 1
+        return n + r
+    
+    @staticmethod
+    def tim_sort(data: List[int],
+                 policy: Optional[EmissionPolicy] = None,
+                 counters: Optional[OperationCounters] = None) -> EventTrace:
+        """Tim sort - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            data, AlgorithmCore.iter_tim_sort(data, policy, counters),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_tim_sort(data: List[int],
+                      policy: Optional[EmissionPolicy] = None,
+                      counters: Optional[OperationCounters] = None) -> Iterator[AlgorithmEvent]:
+        """
+        TimSort-style natural merge sort - yields events lazily
+        Finds ascending (or strictly descending, then reversed) runs, pads
+        short ones to minrun with binary insertion, and merges them off a
+        run stack; merges trim keys already in place and gallop through
+        long one-sided stretches
+        """
+        data_copy = TrackedArray(data)
+        emit = EmissionGate(policy, data_copy)
+        counters = counters or OperationCounters()
+        n = len(data_copy)
+        
+        def gallop(key: int, seq: List[int], lo: int, hi: int, right: bool) -> int:
+            # First index in seq[lo:hi] whose key is > key (right) or >= key
+            # (left): exponential probes from lo, then binary search
+            def before(value: int) -> bool:
+                counters.comparisons += 1
+                return value <= key if right else value < key
+            
+            last, ofs = lo, 1
+            while lo + ofs - 1 < hi and before(seq[lo + ofs - 1]):
+                last = lo + ofs
+                ofs *= 2
+            high = min(lo + ofs - 1, hi)
+            while last < high:
+                mid = (last + high) // 2
+                if before(seq[mid]):
+                    last = mid + 1
+                else:
+                    high = mid
+            return last
+        
+        def count_run(arr: List[int], lo: int, hi: int):
+            run_hi = lo + 1
+            if run_hi == hi:
+                return 1
+            
+            counters.comparisons += 1
+            if arr[run_hi] < arr[lo]:
+                # Strictly descending (keeps stability when reversed)
+                run_hi += 1
+                while run_hi < hi:
+                    counters.comparisons += 1
+                    if not arr[run_hi] < arr[run_hi - 1]:
+                        break
+                    run_hi += 1
+                arr[lo:run_hi] = arr[lo:run_hi][::-1]
+                counters.swaps += (run_hi - lo) // 2
+                if emit.allows(EventType.SET):
+                    yield AlgorithmEvent(
+                        event_type=EventType.SET,
+                        indices=range(lo, run_hi),
+                        template="Reversed descending run [{}:{}]",
+                        args=(lo, run_hi - 1),
+                        writes=arr.drain_writes()
+                    )
+            else:
+                run_hi += 1
+                while run_hi < hi:
+                    counters.comparisons += 1
+                    if arr[run_hi] < arr[run_hi - 1]:
+                        break
+                    run_hi += 1
+            
+            if emit.allows(EventType.HIGHLIGHT):
+                yield AlgorithmEvent(
+                    event_type=EventType.HIGHLIGHT,
+                    indices=range(lo, run_hi),
+                    template="Natural run [{}:{}]",
+                    args=(lo, run_hi - 1),
+                    writes=arr.drain_writes()
+                )
+            return run_hi - lo
+        
+        def binary_insertion(arr: List[int], lo: int, hi: int, start: int):
+            for i in range(start, hi):
+                key = arr[i]
+                low, high = lo, i
+                while low < high:
+                    mid = (low + high) // 2
+                    if emit.allows(EventType.COMPARE):
+                        yield AlgorithmEvent(
+                            event_type=EventType.COMPARE,
+                            indices=[mid, i],
+                            values=[arr[mid], key],
+                            template="Slot for {}: probing {}",
+                            args=(key, arr[mid]),
+                            writes=arr.drain_writes()
+                        )
+                    counters.comparisons += 1
+                    if key < arr[mid]:
+                        high = mid
+                    else:
+                        low = mid + 1
+                
+                if low < i:
+                    arr[low + 1:i + 1] = arr[low:i]
+                    arr[low] = key
+                    if emit.allows(EventType.SET):
+                        yield AlgorithmEvent(
+                            event_type=EventType.SET,
+                            indices=range(low, i + 1),
+                            values=[key],
+                            template="Inserted {} at {}",
+                            args=(key, low),
+                            writes=arr.drain_writes()
+                        )
+        
+        def merge_at(arr: List[int], runs: List[Tuple[int, int]], at: int):
+            base1, len1 = runs[at]
+            base2, len2 = runs[at + 1]
+            runs[at] = (base1, len1 + len2)
+            del runs[at + 1]
+            
+            if emit.allows(EventType.DIVIDE):
+                yield AlgorithmEvent(
+                    event_type=EventType.DIVIDE,
+                    indices=range(base1, base2 + len2),
+                    template="Merging runs of {} and {}",
+                    args=(len1, len2),
+                    writes=arr.drain_writes()
+                )
+            
+            # Keys of run 1 not above run 2's first key are already in place,
+            # as are keys of run 2 not below run 1's last key
+            skip = gallop(arr[base2], arr, base1, base1 + len1, right=True) - base1
+            base1 += skip
+            len1 -= skip
+            if len1:
+                len2 = gallop(arr[base1 + len1 - 1], arr, base2, base2 + len2, right=False) - base2
+            
+            if len1 and len2:
+                yield from merge_lo(arr, base1, len1, base2, len2)
+            
+            if emit.allows(EventType.MERGE):
+                yield AlgorithmEvent(
+                    event_type=EventType.MERGE,
+                    indices=range(runs[at][0], runs[at][0] + runs[at][1]),
+                    template="Merged: [{}:{}]",
+                    args=(runs[at][0], runs[at][0] + runs[at][1] - 1),
+                    writes=arr.drain_writes()
+                )
+        
+        def merge_lo(arr: List[int], base1: int, len1: int, base2: int, len2: int):
+            temp = arr[base1:base1 + len1]
+            counters.allocations += len1
+            i, j, k = 0, base2, base1
+            end2 = base2 + len2
+            
+            while i < len1 and j < end2:
+                # One key at a time until one side wins TIM_MIN_GALLOP in a row
+                wins1 = wins2 = 0
+                while i < len1 and j < end2:
+                    if emit.allows(EventType.COMPARE):
+                        yield AlgorithmEvent(
+                            event_type=EventType.COMPARE,
+                            indices=[k, j],
+                            values=[temp[i], arr[j]],
+                            template="Merging at position {}",
+                            args=(k,),
+                            writes=arr.drain_writes()
+                        )
+                    counters.comparisons += 1
+                    if arr[j] < temp[i]:
+                        arr[k] = arr[j]
+                        j += 1
+                        wins1, wins2 = 0, wins2 + 1
+                    else:
+                        arr[k] = temp[i]
+                        i += 1
+                        wins1, wins2 = wins1 + 1, 0
+                    k += 1
+                    if max(wins1, wins2) >= AlgorithmCore.TIM_MIN_GALLOP:
+                        break
+                
+                # Galloping: copy whole stretches found by exponential search
+                while i < len1 and j < end2:
+                    count1 = gallop(arr[j], temp, i, len1, right=True) - i
+                    if count1:
+                        arr[k:k + count1] = temp[i:i + count1]
+                        if emit.allows(EventType.HIGHLIGHT):
+                            yield AlgorithmEvent(
+                                event_type=EventType.HIGHLIGHT,
+                                indices=range(k, k + count1),
+                                template="Gallop: {} keys from the left run",
+                                args=(count1,),
+                                writes=arr.drain_writes()
+                            )
+                        i += count1
+                        k += count1
+                        if i == len1:
+                            break
+                    
+                    count2 = gallop(temp[i], arr, j, end2, right=False) - j
+                    if count2:
+                        arr[k:k + count2] = arr[j:j + count2]
+                        if emit.allows(EventType.HIGHLIGHT):
+                            yield AlgorithmEvent(
+                                event_type=EventType.HIGHLIGHT,
+                                indices=range(k, k + count2),
+                                template="Gallop: {} keys from the right run",
+                                args=(count2,),
+                                writes=arr.drain_writes()
+                            )
+                        j += count2
+                        k += count2
+                    
+                    if (count1 < AlgorithmCore.TIM_MIN_GALLOP
+                            and count2 < AlgorithmCore.TIM_MIN_GALLOP):
+                        break
+            
+            # Leftover right-run keys are already in place
+            if i < len1:
+                arr[k:k + len1 - i] = temp[i:]
+        
+        def merge_collapse(arr: List[int], runs: List[Tuple[int, int]]):
+            # Keep run lengths shrinking faster than Fibonacci up the stack
+            while len(runs) > 1:
+                at = len(runs) - 2
+                if ((at > 0 and runs[at - 1][1] <= runs[at][1] + runs[at + 1][1]) or
+                        (at > 1 and runs[at - 2][1] <= runs[at - 1][1] + runs[at][1])):
+                    if runs[at - 1][1] < runs[at + 1][1]:
+                        at -= 1
+                elif runs[at][1] > runs[at + 1][1]:
+                    break
+                yield from merge_at(arr, runs, at)
+        
+        if n > 1:
+            if n < AlgorithmCore.TIM_MIN_MERGE:
+                run_len = yield from count_run(data_copy, 0, n)
+                yield from binary_insertion(data_copy, 0, n, run_len)
+            else:
+                min_run = AlgorithmCore._min_run_length(n)
+                runs: List[Tuple[int, int]] = []
+                lo = 0
+                while lo < n:
+                    run_len = yield from count_run(data_copy, lo, n)
+                    if run_len < min_run:
+                        # Extend short runs to minrun with binary insertion
+                        forced = min(n - lo, min_run)
+                        yield from binary_insertion(data_copy, lo, lo + forced, lo + run_len)
+                        run_len = forced
+                    runs.append((lo, run_len))
+                    yield from merge_collapse(data_copy, runs)
+                    lo += run_len
+                
+                while len(runs) > 1:
+                    at = len(runs) - 2
+                    if at > 0 and runs[at - 1][1] < runs[at + 1][1]:
+                        at -= 1
+                    yield from merge_at(data_copy, runs, at)
+        
+        counters.writes += data_copy.write_count
+        
+        # Final sorted event
+        yield AlgorithmEvent(
+            event_type=EventType.SORTED,
+            indices=range(n),
+            message="✓ Sorting Complete!",
+            writes=data_copy.drain_writes()
+        )
+
+
+    # Worker counts offered for the parallel sorts
+    WORKER_COUNTS = (1, 2, 4, 8, 16)
+    
+    @staticmethod
+    def _chunk_bounds(n: int, workers: int) -> List[Tuple[int, int]]:
+        """Split range(n) into up to `workers` contiguous, non-empty chunks"""
+        if workers < 1:
+            raise ValueError(f"Worker count must be at least 1, got {workers}")
+        parts = max(1, min(workers, n))
+        return [(n * k // parts, n * (k + 1) // parts) for k in range(parts)]
+    
+    @staticmethod
+    def _lane_event(event: AlgorithmEvent, offset: int, lane: int) -> AlgorithmEvent:
+        """Move a chunk-local event to array positions and tag it with its worker"""
+        indices = event.indices
+        if isinstance(indices, range):
+            indices = range(indices.start + offset, indices.stop + offset, indices.step)
+        else:
+            indices = [index + offset for index in indices]
+        writes = event.writes
+        if writes:
+            writes = [(index + offset, value) for index, value in writes]
+        
+        if event.template:
+            template, message = f"Worker {lane}: " + event.template, ""
+        else:
+            template, message = "", f"Worker {lane}: {event.message}"
+        return AlgorithmEvent(
+            event_type=event.event_type,
+            indices=indices,
+            values=event.values,
+            message=message,
+            template=template,
+            args=event.args,
+            writes=writes,
+            lane=lane
+        )
+    
+    @staticmethod
+    def parallel_merge_sort(data: List[int],
+                            policy: Optional[EmissionPolicy] = None,
+                            counters: Optional[OperationCounters] = None,
+                            workers: int = 4) -> EventTrace:
+        """Parallel merge sort - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            data, AlgorithmCore.iter_parallel_merge_sort(data, policy, counters, workers),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_parallel_merge_sort(data: List[int],
+                                 policy: Optional[EmissionPolicy] = None,
+                                 counters: Optional[OperationCounters] = None,
+                                 workers: int = 4) -> Iterator[AlgorithmEvent]:
+        """
+        Parallel merge sort - yields events lazily
+        Splits the array into one chunk per worker and merge sorts the
+        chunks in a process pool (each worker traces its own chunk), then
+        k-way merges the sorted chunks through a heap of chunk heads.
+        Chunk events carry the worker's lane and are interleaved round-robin
+        so playback shows the workers side by side.
+        """
+        n = len(data)
+        bounds = AlgorithmCore._chunk_bounds(n, workers)
+        
+        # Workers share the event budget with the merge phase (each also
+        # emits its chunk-sorted highlight); a budget smaller than the lane
+        # count has no room for the highlights, so no lane events are shown
+        show_lanes = (policy is None or policy.max_events is None
+                      or policy.max_events >= len(bounds))
+        chunk_policy = policy
+        if policy is not None and policy.max_events is not None:
+            chunk_policy = replace(policy, max_events=max(
+                0, (policy.max_events - len(bounds)) // (len(bounds) + 1)
+            ))
+        
+        results = WorkerPool.map(
+            _merge_sort_chunk,
+            [(data[lo:hi], chunk_policy) for lo, hi in bounds],
+            workers
+        )
+        
+        counters = counters or OperationCounters()
+        lanes = []
+        for lane, ((lo, hi), (events, chunk_counters)) in enumerate(zip(bounds, results)):
+            counters.comparisons += chunk_counters.comparisons
+            counters.swaps += chunk_counters.swaps
+            counters.writes += chunk_counters.writes
+            counters.allocations += chunk_counters.allocations
+            counters.observe_depth(chunk_counters.max_depth)
+            
+            # The worker's closing event becomes a lane highlight
+            done = events.pop()
+            events.append(AlgorithmEvent(
+                event_type=EventType.HIGHLIGHT,
+                indices=range(hi - lo),
+                template="Chunk [{}:{}] sorted",
+                args=(lo, hi - 1),
+                writes=done.writes
+            ))
+            lanes.append([AlgorithmCore._lane_event(event, lo, lane) for event in events])
+        
+        # Round-robin over the lanes, as if the workers ran in step
+        state = list(data)
+        for step in zip_longest(*lanes):
+            for event in step:
+                if event is not None:
+                    for index, value in event.writes or ():
+                        state[index] = value
+                    if show_lanes:
+                        yield event
+        
+        # The merge phase gets what the workers left of the budget
+        merge_policy = policy
+        if policy is not None and policy.max_events is not None:
+            spent = sum(len(events) for events in lanes) if show_lanes else 0
+            merge_policy = replace(policy, max_events=max(0, policy.max_events - spent))
+        
+        if show_lanes:
+            data_copy = TrackedArray(state)
+            carried = 0
+        else:
+            # Writes of the unshown lanes ride on the next event (already counted)
+            data_copy = TrackedArray(data)
+            for index in range(n):
+                if state[index] != data[index]:
+                    data_copy[index] = state[index]
+            carried = data_copy.write_count
+        emit = EmissionGate(merge_policy, data_copy)
+        
+        if len(bounds) > 1:
+            if emit.allows(EventType.MERGE):
+                yield AlgorithmEvent(
+                    event_type=EventType.MERGE,
+                    indices=range(n),
+                    template="K-way merge of {} chunks",
+                    args=(len(bounds),),
+                    writes=data_copy.drain_writes()
+                )
+            
+            buffer = list(data_copy)
+            counters.allocations += n
+            heads = [lo for lo, _ in bounds]
+            
+            def less(a: int, b: int) -> bool:
+                # Ties go to the lower lane, which keeps the merge stable
+                counters.comparisons += 1
+                return (buffer[heads[a]], a) < (buffer[heads[b]], b)
+            
+            def sift_down(heap: List[int], i: int):
+                size = len(heap)
+                while 2 * i + 1 < size:
+                    child = 2 * i + 1
+                    if child + 1 < size and less(heap[child + 1], heap[child]):
+                        child += 1
+                    if not less(heap[child], heap[i]):
+                        break
+                    heap[i], heap[child] = heap[child], heap[i]
+                    i = child
+            
+            # Heap of lanes ordered by their current head
+            heap = list(range(len(bounds)))
+            for i in range(len(heap) // 2 - 1, -1, -1):
+                sift_down(heap, i)
+            
+            for k in range(n):
+                lane = heap[0]
+                data_copy[k] = buffer[heads[lane]]
+                heads[lane] += 1
+                if heads[lane] == bounds[lane][1]:
+                    heap[0] = heap[-1]
+                    heap.pop()
+                if heap:
+                    sift_down(heap, 0)
+                
+                if emit.allows(EventType.SET):
+                    yield AlgorithmEvent(
+                        event_type=EventType.SET,
+                        indices=[k],
+                        values=[data_copy[k]],
+                        template="Took {} from worker {}",
+                        args=(data_copy[k], lane),
+                        writes=data_copy.drain_writes(),
+                        lane=lane
+                    )
+        
+        counters.writes += data_copy.write_count - carried
+        
+        # Final sorted event
+        yield AlgorithmEvent(
+            event_type=EventType.SORTED,
+            indices=range(n),
+            message="✓ Sorting Complete!",
+            writes=data_copy.drain_writes()
+        )
+
+
+    @staticmethod
+    def _bitonic_stages(n: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Compare-exchange pairs (low, high) of each bitonic network stage
+        Uses the all-ascending form (the first step of each merge compares
+        mirrored positions), so positions past n act as +inf padding that
+        never moves and their pairs can simply be dropped
+        """
+        size = 1 << max(0, (n - 1).bit_length())
+        positions = np.arange(n)
+        block = 2
+        while block <= size:
+            mask = block - 1
+            while mask:
+                partners = positions ^ mask
+                keep = (partners > positions) & (partners < n)
+                yield positions[keep], partners[keep]
+                mask = (block >> 1 if mask == block - 1 else mask) >> 1
+            block <<= 1
+    
+    @staticmethod
+    def _exchange(keys: np.ndarray, low: np.ndarray,
+                  high: np.ndarray) -> np.ndarray:
+        """One vectorized compare-exchange stage; returns the positions that changed"""
+        a, b = keys[low], keys[high]
+        swap = a > b
+        keys[low[swap]] = b[swap]
+        keys[high[swap]] = a[swap]
+        return np.concatenate((low[swap], high[swap]))
+    
+    @staticmethod
+    def bitonic_sort(data: List[int],
+                     policy: Optional[EmissionPolicy] = None,
+                     counters: Optional[OperationCounters] = None) -> EventTrace:
+        """Bitonic sort - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            data, AlgorithmCore.iter_bitonic_sort(data, policy, counters),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_bitonic_sort(data: List[int],
+                          policy: Optional[EmissionPolicy] = None,
+                          counters: Optional[OperationCounters] = None) -> Iterator[AlgorithmEvent]:
+        """
+        Bitonic sorting network - yields events lazily
+        Every stage is one vectorized compare-exchange over disjoint pairs
+        and one event, so the trace has O(log² n) events
+        """
+        data_copy = TrackedArray(data)
+        emit = EmissionGate(policy, data_copy)
+        counters = counters or OperationCounters()
+        n = len(data_copy)
+        keys = np.array(data_copy, dtype=np.int64)
+        counters.allocations += n
+        
+        for stage, (low, high) in enumerate(AlgorithmCore._bitonic_stages(n), 1):
+            changed = AlgorithmCore._exchange(keys, low, high)
+            counters.comparisons += len(low)
+            counters.swaps += len(changed) // 2
+            data_copy.assign(changed.tolist(), keys[changed].tolist())
+            
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=np.column_stack((low, high)).ravel().tolist(),
+                    template="Stage {}: {} compare-exchanges, {} swapped",
+                    args=(stage, len(low), len(changed) // 2),
+                    writes=data_copy.drain_writes()
+                )
+        
+        counters.writes += data_copy.write_count
+        
+        # Final sorted event
+        yield AlgorithmEvent(
+            event_type=EventType.SORTED,
+            indices=range(n),
+            message="✓ Sorting Complete!",
+            writes=data_copy.drain_writes()
+        )
+
+    @staticmethod
+    def odd_even_sort(data: List[int],
+                      policy: Optional[EmissionPolicy] = None,
+                      counters: Optional[OperationCounters] = None) -> EventTrace:
+        """Odd-even transposition sort - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            data, AlgorithmCore.iter_odd_even_sort(data, policy, counters),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_odd_even_sort(data: List[int],
+                           policy: Optional[EmissionPolicy] = None,
+                           counters: Optional[OperationCounters] = None) -> Iterator[AlgorithmEvent]:
+        """
+        Odd-even transposition sort - yields events lazily
+        Alternates compare-exchanges of all (even, even+1) and all
+        (odd, odd+1) neighbours, one vectorized stage and one event each;
+        stops after an even and an odd stage in a row swap nothing
+        """
+        data_copy = TrackedArray(data)
+        emit = EmissionGate(policy, data_copy)
+        counters = counters or OperationCounters()
+        n = len(data_copy)
+        keys = np.array(data_copy, dtype=np.int64)
+        counters.allocations += n
+        
+        phases = (np.arange(0, n - 1, 2), np.arange(1, n - 1, 2))
+        quiet = 0
+        stage = 0
+        while quiet < 2 and n > 1:
+            low = phases[stage % 2]
+            stage += 1
+            changed = AlgorithmCore._exchange(keys, low, low + 1)
+            counters.comparisons += len(low)
+            counters.swaps += len(changed) // 2
+            quiet = 0 if len(changed) else quiet + 1
+            data_copy.assign(changed.tolist(), keys[changed].tolist())
+            
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=range(int(low[0]), int(low[-1]) + 2) if len(low) else [],
+                    template=("Stage {} (even pairs): {} swapped" if stage % 2
+                              else "Stage {} (odd pairs): {} swapped"),
+                    args=(stage, len(changed) // 2),
+                    writes=data_copy.drain_writes()
+                )
+        
+        counters.writes += data_copy.write_count
+        
+        # Final sorted event
+        yield AlgorithmEvent(
+            event_type=EventType.SORTED,
+            indices=range(n),
+            message="✓ Sorting Complete!",
+            writes=data_copy.drain_writes()
+        )
+
+
+    # Bare execution paths: same algorithms with no event emission,
+    # used to time the sort itself rather than trace generation
+
+    @staticmethod
+    def bare_bubble_sort(data: List[int]) -> List[int]:
+        """Bubble sort without events - returns sorted copy"""
+        arr = list(data)
+        n = len(arr)
+        
+        for i in range(n):
+            for j in range(0, n - i - 1):
+                if arr[j] > arr[j + 1]:
+                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
+        
+        return arr
+
+    @staticmethod
+    def bare_selection_sort(data: List[int]) -> List[int]:
+        """Selection sort without events - returns sorted copy"""
+        arr = list(data)
+        n = len(arr)
+        
+        for i in range(n):
+            min_idx = i
+            for j in range(i + 1, n):
+                if arr[j] < arr[min_idx]:
+                    min_idx = j
+            arr[i], arr[min_idx] = arr[min_idx], arr[i]
+        
+        return arr
+
+    @staticmethod
+    def bare_insertion_sort(data: List[int]) -> List[int]:
+        """Insertion sort without events - returns sorted copy"""
+        arr = list(data)
+        
+        for i in range(1, len(arr)):
+            key = arr[i]
+            j = i - 1
+            while j >= 0 and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+        
+        return arr
+
+    @staticmethod
+    def bare_merge_sort(data: List[int]) -> List[int]:
+        """
+        Bottom-up merge sort without events - returns sorted copy
+        Passes alternate between two preallocated lists (ping-pong),
+        so nothing is copied back after a merge
+        """
+        src = list(data)
+        n = len(src)
+        dst = [0] * n
+        
+        width = 1
+        while width < n:
+            for lo in range(0, n, 2 * width):
+                mid = lo + width
+                hi = mid + width
+                if hi > n:
+                    hi = n
+                    if mid >= n:
+                        # Lone run at the end moves over unchanged
+                        dst[lo:] = src[lo:]
+                        continue
+                
+                if src[mid - 1] <= src[mid]:
+                    # Runs already in order
+                    dst[lo:hi] = src[lo:hi]
+                    continue
+                
+                # Merge, keeping the head of each run in a local
+                i, j, k = lo, mid, lo
+                a, b = src[i], src[j]
+                while True:
+                    if a <= b:
+                        dst[k] = a
+                        i += 1
+                        k += 1
+                        if i == mid:
+                            dst[k:hi] = src[j:hi]
+                            break
+                        a = src[i]
+                    else:
+                        dst[k] = b
+                        j += 1
+                        k += 1
+                        if j == hi:
+                            dst[k:hi] = src[i:mid]
+                            break
+                        b = src[j]
+            
+            src, dst = dst, src
+            width *= 2
+        
+        return src
+
+    @staticmethod
+    def bare_quick_sort(data: List[int], pivot: str = "median3") -> List[int]:
+        """Quick sort (introsort, as iter_quick_sort) without events - returns sorted copy"""
+        if pivot not in AlgorithmCore.PIVOT_STRATEGIES:
+            raise ValueError(f"Unknown pivot strategy: {pivot}")
+        
+        arr = list(data)
+        n = len(arr)
+        rng = random.Random(n)
+        depth_limit = 2 * int(math.log2(n)) if n > 1 else 0
+        unused = OperationCounters()  # pivot selection counts, discarded here
+        
+        def sift_down(low: int, root: int, end: int):
+            while True:
+                child = low + 2 * (root - low) + 1
+                if child > end:
+                    return
+                if child + 1 <= end and arr[child] < arr[child + 1]:
+                    child += 1
+                if not arr[root] < arr[child]:
+                    return
+                arr[root], arr[child] = arr[child], arr[root]
+                root = child
+        
+        stack = [(0, n - 1, 0)]
+        while stack:
+            low, high, depth = stack.pop()
+            if low >= high:
+                continue
+            
+            if depth > depth_limit:
+                for start in range(low + (high - low - 1) // 2, low - 1, -1):
+                    sift_down(low, start, high)
+                for end in range(high, low, -1):
+                    arr[low], arr[end] = arr[end], arr[low]
+                    sift_down(low, low, end - 1)
+                continue
+            
+            p = AlgorithmCore._pivot_index(arr, low, high, pivot, rng, unused)
+            arr[low], arr[p] = arr[p], arr[low]
+            v = arr[low]
+            
+            i, j = low, high + 1
+            eq_left, eq_right = low, high + 1
+            while True:
+                i += 1
+                while arr[i] < v and i != high:
+                    i += 1
+                j -= 1
+                while v < arr[j] and j != low:
+                    j -= 1
+                if i == j and arr[i] == v:
+                    eq_left += 1
+                    arr[eq_left], arr[i] = arr[i], arr[eq_left]
+                if i >= j:
+                    break
+                arr[i], arr[j] = arr[j], arr[i]
+                if arr[i] == v:
+                    eq_left += 1
+                    arr[eq_left], arr[i] = arr[i], arr[eq_left]
+                if arr[j] == v:
+                    eq_right -= 1
+                    arr[eq_right], arr[j] = arr[j], arr[eq_right]
+            
+            i = j + 1
+            for k in range(low, eq_left + 1):
+                arr[k], arr[j] = arr[j], arr[k]
+                j -= 1
+            for k in range(high, eq_right - 1, -1):
+                arr[k], arr[i] = arr[i], arr[k]
+                i += 1
+            
+            left, right = (low, j, depth + 1), (i, high, depth + 1)
+            if j - low > high - i:
+                stack.append(left)
+                stack.append(right)
+            else:
+                stack.append(right)
+                stack.append(left)
+        
+        return arr
+
+    @staticmethod
+    def bare_heap_sort(data: List[int]) -> List[int]:
+        """Heap sort (bounce sift-down, as iter_heap_sort) without events - returns sorted copy"""
+        arr = list(data)
+        n = len(arr)
+        
+        def sift_down(root: int, size: int):
+            x = arr[root]
+            leaf = root
+            child = 2 * leaf + 1
+            while child < size:
+                if child + 1 < size and arr[child] < arr[child + 1]:
+                    child += 1
+                leaf = child
+                child = 2 * leaf + 1
+            while leaf > root and arr[leaf] < x:
+                leaf = (leaf - 1) // 2
+            carry, arr[leaf] = arr[leaf], x
+            while leaf > root:
+                leaf = (leaf - 1) // 2
+                carry, arr[leaf] = arr[leaf], carry
+        
+        for i in range(n // 2 - 1, -1, -1):
+            sift_down(i, n)
+        
+        for end in range(n - 1, 0, -1):
+            arr[end], arr[0] = arr[0], arr[end]
+            sift_down(0, end)
+        
+        return arr
+
+    @staticmethod
+    def bare_radix_sort(data: List[int], base: int = 10) -> List[int]:
+        """Radix sort (vectorized, as iter_radix_sort) without events - returns sorted copy"""
+        return AlgorithmCore.radix_sort_array(np.asarray(data, dtype=np.int64), base).tolist()
+
+    @staticmethod
+    def bare_binary_insertion_sort(data: List[int]) -> List[int]:
+        """Binary insertion sort without events - returns sorted copy"""
+        arr = list(data)
+        for i in range(1, len(arr)):
+            key = arr[i]
+            slot = bisect.bisect_right(arr, key, 0, i)
+            if slot < i:
+                arr[slot + 1:i + 1] = arr[slot:i]
+                arr[slot] = key
+        return arr
+
+    @staticmethod
+    def bare_shell_sort(data: List[int]) -> List[int]:
+        """Shell sort (Ciura gaps) without events - returns sorted copy"""
+        arr = list(data)
+        n = len(arr)
+        for gap in AlgorithmCore._shell_gaps(n):
+            for i in range(gap, n):
+                key = arr[i]
+                j = i
+                while j >= gap and arr[j - gap] > key:
+                    arr[j] = arr[j - gap]
+                    j -= gap
+                arr[j] = key
+        return arr
+
+    @staticmethod
+    def bare_tim_sort(data: List[int]) -> List[int]:
+        """TimSort-style natural merge sort (as iter_tim_sort) without events - returns sorted copy"""
+        arr = list(data)
+        n = len(arr)
+        min_gallop = AlgorithmCore.TIM_MIN_GALLOP
+        
+        def gallop(key: int, seq: List[int], lo: int, hi: int, right: bool) -> int:
+            last, ofs = lo, 1
+            if right:
+                while lo + ofs - 1 < hi and seq[lo + ofs - 1] <= key:
+                    last = lo + ofs
+                    ofs *= 2
+                return bisect.bisect_right(seq, key, last, min(lo + ofs - 1, hi))
+            while lo + ofs - 1 < hi and seq[lo + ofs - 1] < key:
+                last = lo + ofs
+                ofs *= 2
+            return bisect.bisect_left(seq, key, last, min(lo + ofs - 1, hi))
+        
+        def count_run(lo: int, hi: int) -> int:
+            run_hi = lo + 1
+            if run_hi == hi:
+                return 1
+            if arr[run_hi] < arr[lo]:
+                run_hi += 1
+                while run_hi < hi and arr[run_hi] < arr[run_hi - 1]:
+                    run_hi += 1
+                arr[lo:run_hi] = arr[lo:run_hi][::-1]
+            else:
+                run_hi += 1
+                while run_hi < hi and not arr[run_hi] < arr[run_hi - 1]:
+                    run_hi += 1
+            return run_hi - lo
+        
+        def binary_insertion(lo: int, hi: int, start: int):
+            for i in range(start, hi):
+                key = arr[i]
+                slot = bisect.bisect_right(arr, key, lo, i)
+                if slot < i:
+                    arr[slot + 1:i + 1] = arr[slot:i]
+                    arr[slot] = key
+        
+        def merge_lo(base1: int, len1: int, base2: int, len2: int):
+            temp = arr[base1:base1 + len1]
+            i, j, k = 0, base2, base1
+            end2 = base2 + len2
+            while i < len1 and j < end2:
+                wins1 = wins2 = 0
+                while i < len1 and j < end2:
+                    if arr[j] < temp[i]:
+                        arr[k] = arr[j]
+                        j += 1
+                        wins1, wins2 = 0, wins2 + 1
+                    else:
+                        arr[k] = temp[i]
+                        i += 1
+                        wins1, wins2 = wins1 + 1, 0
+                    k += 1
+                    if wins1 >= min_gallop or wins2 >= min_gallop:
+                        break
+                while i < len1 and j < end2:
+                    count1 = gallop(arr[j], temp, i, len1, True) - i
+                    if count1:
+                        arr[k:k + count1] = temp[i:i + count1]
+                        i += count1
+                        k += count1
+                        if i == len1:
+                            break
+                    count2 = gallop(temp[i], arr, j, end2, False) - j
+                    if count2:
+                        arr[k:k + count2] = arr[j:j + count2]
+                        j += count2
+                        k += count2
+                    if count1 < min_gallop and count2 < min_gallop:
+                        break
+            if i < len1:
+                arr[k:k + len1 - i] = temp[i:]
+        
+        def merge_at(runs: List[Tuple[int, int]], at: int):
+            base1, len1 = runs[at]
+            base2, len2 = runs[at + 1]
+            runs[at] = (base1, len1 + len2)
+            del runs[at + 1]
+            skip = gallop(arr[base2], arr, base1, base1 + len1, True) - base1
+            base1 += skip
+            len1 -= skip
+            if len1:
+                len2 = gallop(arr[base1 + len1 - 1], arr, base2, base2 + len2, False) - base2
+                if len2:
+                    merge_lo(base1, len1, base2, len2)
+        
+        if n < 2:
+            return arr
+        if n < AlgorithmCore.TIM_MIN_MERGE:
+            binary_insertion(0, n, count_run(0, n))
+            return arr
+        
+        min_run = AlgorithmCore._min_run_length(n)
+        runs: List[Tuple[int, int]] = []
+        lo = 0
+        while lo < n:
+            run_len = count_run(lo, n)
+            if run_len < min_run:
+                forced = min(n - lo, min_run)
+                binary_insertion(lo, lo + forced, lo + run_len)
+                run_len = forced
+            runs.append((lo, run_len))
+            while len(runs) > 1:
+                at = len(runs) - 2
+                if ((at > 0 and runs[at - 1][1] <= runs[at][1] + runs[at + 1][1]) or
+                        (at > 1 and runs[at - 2][1] <= runs[at - 1][1] + runs[at][1])):
+                    if runs[at - 1][1] < runs[at + 1][1]:
+                        at -= 1
+                elif runs[at][1] > runs[at + 1][1]:
+                    break
+                merge_at(runs, at)
+            lo += run_len
+        
+        while len(runs) > 1:
+            at = len(runs) - 2
+            if at > 0 and runs[at - 1][1] < runs[at + 1][1]:
+                at -= 1
+            merge_at(runs, at)
+        
+        return arr
+
+    @staticmethod
+    def bare_parallel_merge_sort(data: List[int], workers: int = 4) -> List[int]:
+        """Parallel merge sort (process pool chunks, k-way merge) without events - returns sorted copy"""
+        bounds = AlgorithmCore._chunk_bounds(len(data), workers)
+        if len(bounds) == 1:
+            return AlgorithmCore.bare_merge_sort(data)
+        chunks = WorkerPool.map(
+            AlgorithmCore.bare_merge_sort, [data[lo:hi] for lo, hi in bounds], workers
+        )
+        return list(heapq.merge(*chunks))
+
+    @staticmethod
+    def bare_bitonic_sort(data: List[int]) -> List[int]:
+        """Bitonic sorting network (NumPy stages) without events - returns sorted copy"""
+        keys = np.array(data, dtype=np.int64)
+        for low, high in AlgorithmCore._bitonic_stages(len(keys)):
+            AlgorithmCore._exchange(keys, low, high)
+        return keys.tolist()
+
+    @staticmethod
+    def bare_odd_even_sort(data: List[int]) -> List[int]:
+        """Odd-even transposition sort (NumPy stages) without events - returns sorted copy"""
+        keys = np.array(data, dtype=np.int64)
+        n = len(keys)
+        phases = (np.arange(0, n - 1, 2), np.arange(1, n - 1, 2))
+        quiet = 0
+        stage = 0
+        while quiet < 2 and n > 1:
+            low = phases[stage % 2]
+            stage += 1
+            changed = AlgorithmCore._exchange(keys, low, low + 1)
+            quiet = 0 if len(changed) else quiet + 1
+        return keys.tolist()
+
+
+@dataclass
+class SearchLayout:
+    """
+    Sorted keys rearranged for locality, with the original index of
+    each slot so events and results refer to the sorted array
+    """
+    kind: str             # "eytzinger" or "btree"
+    keys: List[Any]       # layout order (padding slots hold math.inf)
+    origin: List[int]     # original index per slot (-1 for padding)
+    size: int             # number of real keys
 
 
 class SearchCore:
     """Core search algorithm implementations"""
     
     @staticmethod
-    def linear_search(arr: List[int], target: int) -> List[AlgorithmEvent]:
+    def linear_search(arr: List[int], target: int,
+                      policy: Optional[EmissionPolicy] = None,
+                      counters: Optional[OperationCounters] = None,
+                      mode: str = "first") -> EventTrace:
         """Linear search - returns event sequence"""
-        events = []
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            arr, SearchCore.iter_linear_search(arr, target, policy, counters, mode),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_linear_search(arr: List[int], target: int,
+                           policy: Optional[EmissionPolicy] = None,
+                           counters: Optional[OperationCounters] = None,
+                           mode: str = "first") -> Iterator[AlgorithmEvent]:
+        """Linear search - yields events lazily"""
+        if mode != "first":
+            return (yield from SearchCore.iter_bounds(arr, target, policy, counters,
+                                                      "linear", mode))
+        emit = EmissionGate(policy)
+        counters = counters or OperationCounters()
         
         for i in range(len(arr)):
-            events.append(AlgorithmEvent(
-                event_type=EventType.COMPARE,
-                indices=[i],
-                values=[arr[i]],
-                message=f"Checking index {i}: {arr[i]}",
-                data_snapshot=arr.copy()
-            ))
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=[i],
+                    values=[arr[i]],
+                    template="Checking index {}: {}",
+                    args=(i, arr[i])
+                )
+            
+            counters.comparisons += 1
+            if arr[i] == target:
+                yield AlgorithmEvent(
+                    event_type=EventType.FOUND,
+                    indices=[i],
+                    values=[target],
+                    template="✓ FOUND {} at index {}!",
+                    args=(target, i)
+                )
+                return
+        
+        yield AlgorithmEvent(
+            event_type=EventType.NOT_FOUND,
+            indices=[],
+            values=[target],
+            template="✗ {} not found",
+            args=(target,)
+        )
+
+    @staticmethod
+    def binary_search(arr: List[int], target: int,
+                      policy: Optional[EmissionPolicy] = None,
+                      counters: Optional[OperationCounters] = None,
+                      mode: str = "first") -> EventTrace:
+        """Binary search - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            arr, SearchCore.iter_binary_search(arr, target, policy, counters, mode),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_binary_search(arr: List[int], target: int,
+                           policy: Optional[EmissionPolicy] = None,
+                           counters: Optional[OperationCounters] = None,
+                           mode: str = "first") -> Iterator[AlgorithmEvent]:
+        """Binary search - yields events lazily"""
+        if mode != "first":
+            return (yield from SearchCore.iter_bounds(arr, target, policy, counters,
+                                                      "binary", mode))
+        emit = EmissionGate(policy)
+        counters = counters or OperationCounters()
+        left, right = 0, len(arr) - 1
+        
+        while left <= right:
+            mid = (left + right) // 2
+            
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=[left, mid, right],
+                    values=[arr[left], arr[mid], arr[right]],
+                    template="Searching range [{}:{}], mid={}",
+                    args=(left, right, mid)
+                )
+            
+            counters.comparisons += 1
+            if arr[mid] == target:
+                yield AlgorithmEvent(
+                    event_type=EventType.FOUND,
+                    indices=[mid],
+                    values=[target],
+                    template="✓ FOUND {} at index {}!",
+                    args=(target, mid)
+                )
+                return
+            
+            counters.comparisons += 1
+            if arr[mid] < target:
+                if emit.allows(EventType.HIGHLIGHT):
+                    yield AlgorithmEvent(
+                        event_type=EventType.HIGHLIGHT,
+                        indices=[mid],
+                        template="Target > {}, search right",
+                        args=(arr[mid],)
+                    )
+                left = mid + 1
+            else:
+                if emit.allows(EventType.HIGHLIGHT):
+                    yield AlgorithmEvent(
+                        event_type=EventType.HIGHLIGHT,
+                        indices=[mid],
+                        template="Target < {}, search left",
+                        args=(arr[mid],)
+                    )
+                right = mid - 1
+        
+        yield AlgorithmEvent(
+            event_type=EventType.NOT_FOUND,
+            indices=[],
+            values=[target],
+            template="✗ {} not found",
+            args=(target,)
+        )
+
+    @staticmethod
+    def jump_search(arr: List[int], target: int,
+                    policy: Optional[EmissionPolicy] = None,
+                    counters: Optional[OperationCounters] = None,
+                    mode: str = "first") -> EventTrace:
+        """Jump search - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            arr, SearchCore.iter_jump_search(arr, target, policy, counters, mode),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_jump_search(arr: List[int], target: int,
+                         policy: Optional[EmissionPolicy] = None,
+                         counters: Optional[OperationCounters] = None,
+                         mode: str = "first") -> Iterator[AlgorithmEvent]:
+        """Jump search - yields events lazily"""
+        if mode != "first":
+            return (yield from SearchCore.iter_bounds(arr, target, policy, counters,
+                                                      "jump", mode))
+        emit = EmissionGate(policy)
+        counters = counters or OperationCounters()
+        n = len(arr)
+        step = int(math.sqrt(n))
+        prev = 0
+        
+        # Jump through array
+        while arr[min(step, n) - 1] < target:
+            counters.comparisons += 1
+            if emit.allows(EventType.HIGHLIGHT):
+                yield AlgorithmEvent(
+                    event_type=EventType.HIGHLIGHT,
+                    indices=range(prev, min(step, n)),
+                    template="Jumping: block [{}:{}]",
+                    args=(prev, min(step, n))
+                )
+            
+            prev = step
+            step += int(math.sqrt(n))
+            
+            if prev >= n:
+                yield AlgorithmEvent(
+                    event_type=EventType.NOT_FOUND,
+                    indices=[],
+                    values=[target],
+                    template="✗ {} not found",
+                    args=(target,)
+                )
+                return
+        counters.comparisons += 1  # the jump that overshot the target
+        
+        # Linear search in block
+        while arr[prev] < target:
+            counters.comparisons += 1
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=[prev],
+                    values=[arr[prev]],
+                    template="Linear search at index {}",
+                    args=(prev,)
+                )
+            
+            prev += 1
+            
+            if prev == min(step, n):
+                yield AlgorithmEvent(
+                    event_type=EventType.NOT_FOUND,
+                    indices=[],
+                    values=[target],
+                    template="✗ {} not found",
+                    args=(target,)
+                )
+                return
+        counters.comparisons += 2  # the check that ended the scan, then equality
+        
+        if arr[prev] == target:
+            yield AlgorithmEvent(
+                event_type=EventType.FOUND,
+                indices=[prev],
+                values=[target],
+                template="✓ FOUND {} at index {}!",
+                args=(target, prev)
+            )
+            return
+        
+        yield AlgorithmEvent(
+            event_type=EventType.NOT_FOUND,
+            indices=[],
+            values=[target],
+            template="✗ {} not found",
+            args=(target,)
+        )
+
+    @staticmethod
+    def interpolation_search(arr: List[int], target: int,
+                             policy: Optional[EmissionPolicy] = None,
+                             counters: Optional[OperationCounters] = None,
+                             mode: str = "first") -> EventTrace:
+        """Interpolation search - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            arr, SearchCore.iter_interpolation_search(arr, target, policy, counters, mode),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_interpolation_search(arr: List[int], target: int,
+                                  policy: Optional[EmissionPolicy] = None,
+                                  counters: Optional[OperationCounters] = None,
+                                  mode: str = "first") -> Iterator[AlgorithmEvent]:
+        """Interpolation search - yields events lazily"""
+        if mode != "first":
+            return (yield from SearchCore.iter_bounds(arr, target, policy, counters,
+                                                      "interpolation", mode))
+        emit = EmissionGate(policy)
+        counters = counters or OperationCounters()
+        left, right = 0, len(arr) - 1
+        
+        while left <= right:
+            # Target must lie inside the current value range
+            counters.comparisons += 1
+            if arr[left] > target:
+                break
+            counters.comparisons += 1
+            if target > arr[right]:
+                break
+            
+            if left == right:
+                counters.comparisons += 1
+                if arr[left] == target:
+                    yield AlgorithmEvent(
+                        event_type=EventType.FOUND,
+                        indices=[left],
+                        values=[target],
+                        template="✓ FOUND {} at index {}!",
+                        args=(target, left)
+                    )
+                else:
+                    yield AlgorithmEvent(
+                        event_type=EventType.NOT_FOUND,
+                        indices=[],
+                        values=[target],
+                        template="✗ {} not found",
+                        args=(target,)
+                    )
+                return
+            
+            # Calculate position using interpolation (integer arithmetic keeps
+            # it exact and inside [left, right]; equal keys all match target)
+            span = arr[right] - arr[left]
+            pos = left + (target - arr[left]) * (right - left) // span if span else left
+            
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=[left, pos, right],
+                    values=[arr[left], arr[pos], arr[right]],
+                    template="Interpolating: checking position {}",
+                    args=(pos,)
+                )
+            
+            counters.comparisons += 1
+            if arr[pos] == target:
+                yield AlgorithmEvent(
+                    event_type=EventType.FOUND,
+                    indices=[pos],
+                    values=[target],
+                    template="✓ FOUND {} at index {}!",
+                    args=(target, pos)
+                )
+                return
+            
+            counters.comparisons += 1
+            if arr[pos] < target:
+                left = pos + 1
+            else:
+                right = pos - 1
+        
+        yield AlgorithmEvent(
+            event_type=EventType.NOT_FOUND,
+            indices=[],
+            values=[target],
+            template="✗ {} not found",
+            args=(target,)
+        )
+
+    # Interpolation is O(log log n) on evenly spread keys but O(n) on skewed
+    # ones; the robust variant caps its interpolation probes, falls back to
+    # binary search and scans short ranges sequentially
+    
+    INTERP_SEQUENTIAL = 8  # ranges this short are scanned
+    
+    @staticmethod
+    def _interpolation_budget(n: int) -> int:
+        """Interpolation probes allowed before falling back: about log2(log2(n)) + 1"""
+        return max(1, n.bit_length().bit_length())
+
+    @staticmethod
+    def robust_interpolation_search(arr: List[int], target: int,
+                                    policy: Optional[EmissionPolicy] = None,
+                                    counters: Optional[OperationCounters] = None,
+                                    mode: str = "first") -> EventTrace:
+        """Robust interpolation search - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            arr, SearchCore.iter_robust_interpolation_search(arr, target, policy,
+                                                             counters, mode),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_robust_interpolation_search(arr: List[int], target: int,
+                                         policy: Optional[EmissionPolicy] = None,
+                                         counters: Optional[OperationCounters] = None,
+                                         mode: str = "first") -> Iterator[AlgorithmEvent]:
+        """
+        Robust interpolation search - yields events lazily
+        Integer interpolation (always inside the range, exact for large
+        keys and safe on repeated values) for a limited number of probes,
+        then binary search; ranges of INTERP_SEQUENTIAL keys or fewer are
+        scanned. Worst case O(log n).
+        """
+        if mode != "first":
+            return (yield from SearchCore.iter_bounds(arr, target, policy, counters,
+                                                      "robust_interpolation", mode))
+        emit = EmissionGate(policy)
+        counters = counters or OperationCounters()
+        left, right = 0, len(arr) - 1
+        budget = SearchCore._interpolation_budget(len(arr))
+        
+        while right - left >= SearchCore.INTERP_SEQUENTIAL:
+            # Target must lie inside the current value range
+            counters.comparisons += 2
+            if target < arr[left] or target > arr[right]:
+                yield AlgorithmEvent(
+                    event_type=EventType.NOT_FOUND,
+                    indices=[],
+                    values=[target],
+                    template="✗ {} not found",
+                    args=(target,)
+                )
+                return
+            
+            # Interpolate while the budget lasts and the keys are not all equal
+            span = arr[right] - arr[left]
+            if budget and span:
+                budget -= 1
+                pos = left + (target - arr[left]) * (right - left) // span
+                template = "Interpolating: checking position {}"
+            else:
+                pos = (left + right) // 2
+                template = "Binary fallback: checking position {}"
+            
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=[left, pos, right],
+                    values=[arr[left], arr[pos], arr[right]],
+                    template=template,
+                    args=(pos,)
+                )
+            
+            counters.comparisons += 1
+            if arr[pos] == target:
+                yield AlgorithmEvent(
+                    event_type=EventType.FOUND,
+                    indices=[pos],
+                    values=[target],
+                    template="✓ FOUND {} at index {}!",
+                    args=(target, pos)
+                )
+                return
+            
+            counters.comparisons += 1
+            if arr[pos] < target:
+                left = pos + 1
+            else:
+                right = pos - 1
+        
+        # Short range: sequential scan, stopping at the first larger key
+        for i in range(left, right + 1):
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=[i],
+                    values=[arr[i]],
+                    template="Scanning position {}",
+                    args=(i,)
+                )
+            
+            counters.comparisons += 1
+            if arr[i] == target:
+                yield AlgorithmEvent(
+                    event_type=EventType.FOUND,
+                    indices=[i],
+                    values=[target],
+                    template="✓ FOUND {} at index {}!",
+                    args=(target, i)
+                )
+                return
+            
+            counters.comparisons += 1
+            if arr[i] > target:
+                break
+        
+        yield AlgorithmEvent(
+            event_type=EventType.NOT_FOUND,
+            indices=[],
+            values=[target],
+            template="✗ {} not found",
+            args=(target,)
+        )
+
+    # Auto search: pick a strategy per array from a sample of its keys
+    
+    AUTO_SAMPLE = 32     # keys sampled to estimate uniformity
+    AUTO_LINEAR = 8      # arrays this short are scanned
+    AUTO_UNIFORM = 0.9   # uniformity needed to interpolate
+    
+    @staticmethod
+    def uniformity(arr: List[int], sample: int = AUTO_SAMPLE) -> float:
+        """
+        How evenly the keys are spread, from a sample of evenly spaced positions
+        
+        1.0 when every sampled key sits where a straight line from the
+        first to the last key puts it (so interpolation lands on it),
+        falling towards 0.0 as the keys bunch up. All-equal keys give 0.0.
+        """
+        n = len(arr)
+        if n < 2:
+            return 1.0
+        span, last = arr[-1] - arr[0], n - 1
+        if span == 0:
+            return 0.0
+        
+        # Mean distance between each sampled position and the position
+        # interpolation predicts for its key, as a fraction of the array
+        k = max(2, min(n, sample))
+        error = 0.0
+        for j in range(k):
+            i = j * last // (k - 1)
+            error += abs((arr[i] - arr[0]) * last / span - i)
+        return 1.0 - error / (k * last)
+
+    @staticmethod
+    def choose_search(arr: List[int]) -> Tuple[str, float]:
+        """Search method for this array and the uniformity it was chosen on"""
+        score = SearchCore.uniformity(arr)
+        if len(arr) <= SearchCore.AUTO_LINEAR:
+            return "linear", score
+        if score >= SearchCore.AUTO_UNIFORM:
+            return "robust_interpolation", score
+        return "binary", score
+
+    @staticmethod
+    def auto_search(arr: List[int], target: int,
+                    policy: Optional[EmissionPolicy] = None,
+                    counters: Optional[OperationCounters] = None,
+                    mode: str = "first") -> EventTrace:
+        """Auto search - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            arr, SearchCore.iter_auto_search(arr, target, policy, counters, mode),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_auto_search(arr: List[int], target: int,
+                         policy: Optional[EmissionPolicy] = None,
+                         counters: Optional[OperationCounters] = None,
+                         mode: str = "first") -> Iterator[AlgorithmEvent]:
+        """Auto search - samples the array, then runs the chosen search"""
+        emit = EmissionGate(policy)
+        method, score = SearchCore.choose_search(arr)
+        
+        if emit.allows(EventType.HIGHLIGHT):
+            yield AlgorithmEvent(
+                event_type=EventType.HIGHLIGHT,
+                indices=[],
+                template=f"Auto: {method.replace('_', ' ')} search (uniformity {{}}%)",
+                args=(round(score * 100),)
+            )
+        
+        search = getattr(SearchCore, f"iter_{method}_search")
+        return (yield from search(arr, target, policy, counters, mode))
+
+    # Cache-friendly layouts: built once per array, then searched many times
+    
+    BTREE_BLOCK = 16  # keys per B-tree node
+    
+    @staticmethod
+    def build_eytzinger(arr: List[int],
+                        counters: Optional[OperationCounters] = None) -> SearchLayout:
+        """
+        Eytzinger (BFS order) layout: slot k has children 2k and 2k+1,
+        slot 0 is unused; filled by an in-order walk of the implicit tree
+        """
+        n = len(arr)
+        keys: List[Any] = [math.inf] * (n + 1)
+        origin = [-1] * (n + 1)
+        
+        stack: List[int] = []
+        k, i = 1, 0
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            keys[k], origin[k] = arr[i], i
+            i += 1
+            k = 2 * k + 1
+        
+        if counters is not None:
+            counters.writes += n
+            counters.allocations += 2 * (n + 1)
+        return SearchLayout("eytzinger", keys, origin, n)
+    
+    @staticmethod
+    def build_btree(arr: List[int],
+                    counters: Optional[OperationCounters] = None) -> SearchLayout:
+        """
+        Static B-tree layout: nodes of BTREE_BLOCK keys stored in BFS
+        order, node k's children at k*(B+1)+1 .. k*(B+1)+B+1; filled by an
+        in-order walk, so the math.inf padding lands at the in-order end
+        """
+        n = len(arr)
+        block = SearchCore.BTREE_BLOCK
+        nodes = -(-n // block)
+        keys: List[Any] = [math.inf] * (nodes * block)
+        origin = [-1] * (nodes * block)
+        
+        # In-order walk; (node, slot) = output key slot-1, then descend into child slot
+        stack = [(0, 0)]
+        i = 0
+        while stack:
+            node, slot = stack.pop()
+            if node >= nodes:
+                continue
+            if slot > 0 and i < n:
+                keys[node * block + slot - 1], origin[node * block + slot - 1] = arr[i], i
+                i += 1
+            if slot < block:
+                stack.append((node, slot + 1))
+            stack.append((node * (block + 1) + slot + 1, 0))
+        
+        if counters is not None:
+            counters.writes += n
+            counters.allocations += 2 * nodes * block
+        return SearchLayout("btree", keys, origin, n)
+    
+    @staticmethod
+    def eytzinger_search(arr: List[int], target: int,
+                         policy: Optional[EmissionPolicy] = None,
+                         counters: Optional[OperationCounters] = None,
+                         layout: Optional[SearchLayout] = None,
+                         mode: str = "first") -> EventTrace:
+        """Eytzinger layout search - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            arr, SearchCore.iter_eytzinger_search(arr, target, policy, counters,
+                                                  layout, mode),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_eytzinger_search(arr: List[int], target: int,
+                              policy: Optional[EmissionPolicy] = None,
+                              counters: Optional[OperationCounters] = None,
+                              layout: Optional[SearchLayout] = None,
+                              mode: str = "first") -> Iterator[AlgorithmEvent]:
+        """
+        Eytzinger layout search - yields events lazily
+        Branchless-style descent k = 2k + (key < target) to the bottom of
+        the tree, then the trailing right turns are undone to land on the
+        lower bound. Builds the layout (counted) unless one is given;
+        events show the sorted array positions of the probed keys.
+        """
+        if mode != "first":
+            return (yield from SearchCore.iter_bounds(arr, target, policy, counters,
+                                                      "eytzinger", mode, layout))
+        emit = EmissionGate(policy)
+        counters = counters or OperationCounters()
+        layout = layout or SearchCore.build_eytzinger(arr, counters)
+        keys, origin, n = layout.keys, layout.origin, layout.size
+        
+        k = 1
+        while k <= n:
+            counters.comparisons += 1
+            go_right = keys[k] < target
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=[origin[k]],
+                    values=[keys[k]],
+                    template=("Node {}: {} < target, go right" if go_right
+                              else "Node {}: {} >= target, go left"),
+                    args=(k, keys[k])
+                )
+            k = 2 * k + go_right
+        
+        # Drop the right turns taken after the last left turn
+        k >>= ((~k) & (k + 1)).bit_length()
+        
+        if k:
+            counters.comparisons += 1
+            if keys[k] == target:
+                yield AlgorithmEvent(
+                    event_type=EventType.FOUND,
+                    indices=[origin[k]],
+                    values=[target],
+                    template="✓ FOUND {} at index {}!",
+                    args=(target, origin[k])
+                )
+                return
+        
+        yield AlgorithmEvent(
+            event_type=EventType.NOT_FOUND,
+            indices=[],
+            values=[target],
+            template="✗ {} not found",
+            args=(target,)
+        )
+
+    @staticmethod
+    def btree_search(arr: List[int], target: int,
+                     policy: Optional[EmissionPolicy] = None,
+                     counters: Optional[OperationCounters] = None,
+                     layout: Optional[SearchLayout] = None,
+                     mode: str = "first") -> EventTrace:
+        """B-tree layout search - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            arr, SearchCore.iter_btree_search(arr, target, policy, counters,
+                                              layout, mode),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_btree_search(arr: List[int], target: int,
+                          policy: Optional[EmissionPolicy] = None,
+                          counters: Optional[OperationCounters] = None,
+                          layout: Optional[SearchLayout] = None,
+                          mode: str = "first") -> Iterator[AlgorithmEvent]:
+        """
+        B-tree layout search - yields events lazily
+        Each node is one contiguous block of keys; the branch taken is the
+        count of keys below the target (all BTREE_BLOCK compared, as a
+        branchless search does), and the first key >= target seen on the
+        way down is the lower bound. Builds the layout (counted) unless
+        one is given; events show sorted array positions.
+        """
+        if mode != "first":
+            return (yield from SearchCore.iter_bounds(arr, target, policy, counters,
+                                                      "btree", mode, layout))
+        emit = EmissionGate(policy)
+        counters = counters or OperationCounters()
+        layout = layout or SearchCore.build_btree(arr, counters)
+        keys, origin = layout.keys, layout.origin
+        block = SearchCore.BTREE_BLOCK
+        nodes = len(keys) // block
+        
+        node, best = 0, -1
+        while node < nodes:
+            base = node * block
+            below = 0
+            for slot in range(base, base + block):
+                below += keys[slot] < target
+            counters.comparisons += block
+            
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=[i for i in origin[base:base + block] if i >= 0],
+                    template="Block {}: {} keys < target",
+                    args=(node, below)
+                )
+            
+            if below < block:
+                best = base + below
+            node = node * (block + 1) + below + 1
+        
+        if best >= 0:
+            counters.comparisons += 1
+            if keys[best] == target:
+                yield AlgorithmEvent(
+                    event_type=EventType.FOUND,
+                    indices=[origin[best]],
+                    values=[target],
+                    template="✓ FOUND {} at index {}!",
+                    args=(target, origin[best])
+                )
+                return
+        
+        yield AlgorithmEvent(
+            event_type=EventType.NOT_FOUND,
+            indices=[],
+            values=[target],
+            template="✗ {} not found",
+            args=(target,)
+        )
+
+    @staticmethod
+    def find_layout_builder(search_func: Callable) -> Optional[Callable]:
+        """Layout builder of a layout search (iter_x_search / x_search -> build_x), or None"""
+        name = search_func.__name__
+        if name.startswith("iter_"):
+            name = name[len("iter_"):]
+        return getattr(SearchCore, "build_" + name[:-len("_search")], None)
+
+    @staticmethod
+    def exponential_search(arr: List[int], target: int,
+                           policy: Optional[EmissionPolicy] = None,
+                           counters: Optional[OperationCounters] = None,
+                           mode: str = "first") -> EventTrace:
+        """Exponential search - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            arr, SearchCore.iter_exponential_search(arr, target, policy, counters, mode),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_exponential_search(arr: List[int], target: int,
+                                policy: Optional[EmissionPolicy] = None,
+                                counters: Optional[OperationCounters] = None,
+                                mode: str = "first") -> Iterator[AlgorithmEvent]:
+        """
+        Exponential (galloping) search - yields events lazily
+        Doubles a bound until it passes the target, then binary searches
+        the last doubling; O(log i) for a target at index i
+        """
+        if mode != "first":
+            return (yield from SearchCore.iter_bounds(arr, target, policy, counters,
+                                                      "exponential", mode))
+        emit = EmissionGate(policy)
+        counters = counters or OperationCounters()
+        n = len(arr)
+        
+        bound = 1
+        while bound < n:
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=[bound],
+                    values=[arr[bound]],
+                    template="Galloping: bound {} holds {}",
+                    args=(bound, arr[bound])
+                )
+            counters.comparisons += 1
+            if not arr[bound] < target:
+                break
+            bound *= 2
+        
+        left, right = bound // 2, min(bound, n - 1)
+        if emit.allows(EventType.HIGHLIGHT) and n:
+            yield AlgorithmEvent(
+                event_type=EventType.HIGHLIGHT,
+                indices=range(left, right + 1),
+                template="Binary search in [{}:{}]",
+                args=(left, right)
+            )
+        
+        while left <= right:
+            mid = (left + right) // 2
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=[left, mid, right],
+                    values=[arr[left], arr[mid], arr[right]],
+                    template="Searching range [{}:{}], mid={}",
+                    args=(left, right, mid)
+                )
+            
+            counters.comparisons += 1
+            if arr[mid] == target:
+                yield AlgorithmEvent(
+                    event_type=EventType.FOUND,
+                    indices=[mid],
+                    values=[target],
+                    template="✓ FOUND {} at index {}!",
+                    args=(target, mid)
+                )
+                return
+            
+            counters.comparisons += 1
+            if arr[mid] < target:
+                left = mid + 1
+            else:
+                right = mid - 1
+        
+        yield AlgorithmEvent(
+            event_type=EventType.NOT_FOUND,
+            indices=[],
+            values=[target],
+            template="✗ {} not found",
+            args=(target,)
+        )
+
+    @staticmethod
+    def fibonacci_search(arr: List[int], target: int,
+                         policy: Optional[EmissionPolicy] = None,
+                         counters: Optional[OperationCounters] = None,
+                         mode: str = "first") -> EventTrace:
+        """Fibonacci search - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            arr, SearchCore.iter_fibonacci_search(arr, target, policy, counters, mode),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_fibonacci_search(arr: List[int], target: int,
+                              policy: Optional[EmissionPolicy] = None,
+                              counters: Optional[OperationCounters] = None,
+                              mode: str = "first") -> Iterator[AlgorithmEvent]:
+        """
+        Fibonacci search - yields events lazily
+        Splits the range at Fibonacci offsets, so probe positions come
+        from additions and subtractions only
+        """
+        if mode != "first":
+            return (yield from SearchCore.iter_bounds(arr, target, policy, counters,
+                                                      "fibonacci", mode))
+        emit = EmissionGate(policy)
+        counters = counters or OperationCounters()
+        n = len(arr)
+        
+        # Smallest Fibonacci number >= n, with its two predecessors
+        fib2, fib1 = 0, 1
+        fib = fib1 + fib2
+        while fib < n:
+            fib2, fib1 = fib1, fib
+            fib = fib1 + fib2
+        
+        offset = -1
+        while fib > 1:
+            i = min(offset + fib2, n - 1)
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=[i],
+                    values=[arr[i]],
+                    template="Fibonacci split at {}: {}",
+                    args=(i, arr[i])
+                )
             
+            counters.comparisons += 1
             if arr[i] == target:
-                events.append(AlgorithmEvent(
+                yield AlgorithmEvent(
                     event_type=EventType.FOUND,
                     indices=[i],
                     values=[target],
-                    message=f"✓ FOUND {target} at index {i}!",
-                    data_snapshot=arr.copy()
-                ))
-                return events
+                    template="✓ FOUND {} at index {}!",
+                    args=(target, i)
+                )
+                return
+            
+            counters.comparisons += 1
+            if arr[i] < target:
+                # Drop the front fib2 keys
+                fib, fib1 = fib1, fib2
+                fib2 = fib - fib1
+                offset = i
+            else:
+                # Keep only the front fib2 keys
+                fib, fib1 = fib2, fib1 - fib2
+                fib2 = fib - fib1
+        
+        if fib1 and offset + 1 < n:
+            counters.comparisons += 1
+            if arr[offset + 1] == target:
+                yield AlgorithmEvent(
+                    event_type=EventType.FOUND,
+                    indices=[offset + 1],
+                    values=[target],
+                    template="✓ FOUND {} at index {}!",
+                    args=(target, offset + 1)
+                )
+                return
         
-        events.append(AlgorithmEvent(
+        yield AlgorithmEvent(
             event_type=EventType.NOT_FOUND,
             indices=[],
             values=[target],
-            message=f"✗ {target} not found",
-            data_snapshot=arr.copy()
-        ))
-        
-        return events
+            template="✗ {} not found",
+            args=(target,)
+        )
 
     @staticmethod
-    def binary_search(arr: List[int], target: int) -> List[AlgorithmEvent]:
-        """Binary search - returns event sequence"""
-        events = []
+    def ternary_search(arr: List[int], target: int,
+                       policy: Optional[EmissionPolicy] = None,
+                       counters: Optional[OperationCounters] = None,
+                       mode: str = "first") -> EventTrace:
+        """Ternary search - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            arr, SearchCore.iter_ternary_search(arr, target, policy, counters, mode),
+            policy=policy, counters=counters
+        )
+
+    @staticmethod
+    def iter_ternary_search(arr: List[int], target: int,
+                            policy: Optional[EmissionPolicy] = None,
+                            counters: Optional[OperationCounters] = None,
+                            mode: str = "first") -> Iterator[AlgorithmEvent]:
+        """
+        Ternary search - yields events lazily
+        Two probes split the range in thirds; more comparisons than binary
+        search (2 log3 n > log2 n), kept for comparison
+        """
+        if mode != "first":
+            return (yield from SearchCore.iter_bounds(arr, target, policy, counters,
+                                                      "ternary", mode))
+        emit = EmissionGate(policy)
+        counters = counters or OperationCounters()
         left, right = 0, len(arr) - 1
         
         while left <= right:
-            mid = (left + right) // 2
-            
-            events.append(AlgorithmEvent(
-                event_type=EventType.COMPARE,
-                indices=[left, mid, right],
-                values=[arr[left], arr[mid], arr[right]],
-                message=f"Searching range [{left}:{right}], mid={mid}",
-                data_snapshot=arr.copy()
-            ))
+            third = (right - left) // 3
+            mid1, mid2 = left + third, right - third
+            if emit.allows(EventType.COMPARE):
+                yield AlgorithmEvent(
+                    event_type=EventType.COMPARE,
+                    indices=[left, mid1, mid2, right],
+                    values=[arr[mid1], arr[mid2]],
+                    template="Searching range [{}:{}], thirds at {} and {}",
+                    args=(left, right, mid1, mid2)
+                )
             
-            if arr[mid] == target:
-                events.append(AlgorithmEvent(
+            counters.comparisons += 1
+            if arr[mid1] == target:
+                yield AlgorithmEvent(
                     event_type=EventType.FOUND,
-                    indices=[mid],
+                    indices=[mid1],
                     values=[target],
-                    message=f"✓ FOUND {target} at index {mid}!",
-                    data_snapshot=arr.copy()
-                ))
-                return events
-            elif arr[mid] < target:
-                events.append(AlgorithmEvent(
-                    event_type=EventType.HIGHLIGHT,
-                    indices=[mid],
-                    message=f"Target > {arr[mid]}, search right",
-                    data_snapshot=arr.copy()
-                ))
-                left = mid + 1
+                    template="✓ FOUND {} at index {}!",
+                    args=(target, mid1)
+                )
+                return
+            counters.comparisons += 1
+            if arr[mid2] == target:
+                yield AlgorithmEvent(
+                    event_type=EventType.FOUND,
+                    indices=[mid2],
+                    values=[target],
+                    template="✓ FOUND {} at index {}!",
+                    args=(target, mid2)
+                )
+                return
+            
+            counters.comparisons += 1
+            if target < arr[mid1]:
+                right = mid1 - 1
+                continue
+            counters.comparisons += 1
+            if target > arr[mid2]:
+                left = mid2 + 1
             else:
-                events.append(AlgorithmEvent(
-                    event_type=EventType.HIGHLIGHT,
-                    indices=[mid],
-                    message=f"Target < {arr[mid]}, search left",
-                    data_snapshot=arr.copy()
-                ))
-                right = mid - 1
+                left, right = mid1 + 1, mid2 - 1
+        
+        yield AlgorithmEvent(
+            event_type=EventType.NOT_FOUND,
+            indices=[],
+            values=[target],
+            template="✗ {} not found",
+            args=(target,)
+        )
+
+    # Bound searches: every method also finds the boundary where
+    # `before(key)` stops holding (key < target for the lower bound,
+    # key <= target for the upper bound). Each core yields COMPARE events
+    # through `probe` and returns the boundary index.
+    
+    SEARCH_MODES = ("first", "lower", "upper", "range")
+    
+    @staticmethod
+    def _bound_linear(arr: List[int], probe: Callable, layout=None):
+        i = 0
+        while i < len(arr) and (yield from probe(i, arr[i], "Scan index {}: {}")):
+            i += 1
+        return i
+    
+    @staticmethod
+    def _bound_binary(arr: List[int], probe: Callable, layout=None):
+        low, high = 0, len(arr)
+        while low < high:
+            mid = (low + high) // 2
+            if (yield from probe(mid, arr[mid], "Bisect at {}: {}")):
+                low = mid + 1
+            else:
+                high = mid
+        return low
+    
+    @staticmethod
+    def _bound_jump(arr: List[int], probe: Callable, layout=None):
+        n = len(arr)
+        step = max(1, int(math.sqrt(n)))
+        low = 0
+        while low + step <= n and (yield from probe(low + step - 1, arr[low + step - 1],
+                                                    "Jump to block end {}: {}")):
+            low += step
+        # The block end (if inside the array) is known to fail already
+        end = low + step - 1 if low + step <= n else n
+        while low < end and (yield from probe(low, arr[low], "Scan index {}: {}")):
+            low += 1
+        return low
+    
+    @staticmethod
+    def _bound_interpolation(arr: List[int], probe: Callable, layout=None, target: int = 0):
+        low, high = 0, len(arr)
+        while low < high:
+            span = arr[high - 1] - arr[low]
+            pos = low + (target - arr[low]) * (high - 1 - low) // span if span else low
+            pos = max(low, min(pos, high - 1))
+            if (yield from probe(pos, arr[pos], "Interpolated {}: {}")):
+                low = pos + 1
+            else:
+                high = pos
+        return low
+    
+    @staticmethod
+    def _bound_robust_interpolation(arr: List[int], probe: Callable, layout=None,
+                                    target: int = 0):
+        low, high = 0, len(arr)
+        budget = SearchCore._interpolation_budget(len(arr))
+        while high - low > SearchCore.INTERP_SEQUENTIAL:
+            span = arr[high - 1] - arr[low]
+            if budget and span:
+                budget -= 1
+                pos = low + (target - arr[low]) * (high - 1 - low) // span
+                pos = max(low, min(pos, high - 1))
+            else:
+                pos = (low + high) // 2
+            if (yield from probe(pos, arr[pos], "Interpolated {}: {}")):
+                low = pos + 1
+            else:
+                high = pos
+        while low < high and (yield from probe(low, arr[low], "Scan index {}: {}")):
+            low += 1
+        return low
+    
+    @staticmethod
+    def _bound_exponential(arr: List[int], probe: Callable, layout=None):
+        n = len(arr)
+        bound = 1
+        while bound <= n and (yield from probe(bound - 1, arr[bound - 1], "Gallop to {}: {}")):
+            bound *= 2
+        low, high = bound // 2, min(bound - 1, n)
+        while low < high:
+            mid = (low + high) // 2
+            if (yield from probe(mid, arr[mid], "Bisect at {}: {}")):
+                low = mid + 1
+            else:
+                high = mid
+        return low
+    
+    @staticmethod
+    def _bound_fibonacci(arr: List[int], probe: Callable, layout=None):
+        # Boundary lies in (offset, offset + fib]; positions past the end
+        # count as failing without a probe
+        n = len(arr)
+        fib2, fib1 = 0, 1
+        fib = fib1 + fib2
+        while fib < n + 1:
+            fib2, fib1 = fib1, fib
+            fib = fib1 + fib2
+        
+        offset = -1
+        while fib > 1:
+            i = offset + fib2
+            if i < n and (yield from probe(i, arr[i], "Fibonacci split at {}: {}")):
+                fib, fib1 = fib1, fib2
+                fib2 = fib - fib1
+                offset = i
+            else:
+                fib, fib1 = fib2, fib1 - fib2
+                fib2 = fib - fib1
+        return offset + 1
+    
+    @staticmethod
+    def _bound_ternary(arr: List[int], probe: Callable, layout=None):
+        low, high = 0, len(arr)
+        while low < high:
+            third = (high - low) // 3
+            mid1, mid2 = low + third, high - 1 - third
+            if not (yield from probe(mid1, arr[mid1], "First third at {}: {}")):
+                high = mid1
+            elif mid2 <= mid1:
+                low = mid1 + 1
+            elif (yield from probe(mid2, arr[mid2], "Second third at {}: {}")):
+                low = mid2 + 1
+            else:
+                low, high = mid1 + 1, mid2
+        return low
+    
+    @staticmethod
+    def _bound_eytzinger(arr: List[int], probe: Callable, layout: SearchLayout):
+        keys, origin, n = layout.keys, layout.origin, layout.size
+        k = 1
+        while k <= n:
+            k = 2 * k + (yield from probe(origin[k], keys[k], "Eytzinger probe {}: {}"))
+        k >>= ((~k) & (k + 1)).bit_length()
+        return origin[k] if k else n
+    
+    @staticmethod
+    def _bound_btree(arr: List[int], probe: Callable, layout: SearchLayout):
+        keys, origin = layout.keys, layout.origin
+        block = SearchCore.BTREE_BLOCK
+        nodes = len(keys) // block
+        node, best = 0, -1
+        while node < nodes:
+            base = node * block
+            below = 0
+            for slot in range(base, base + block):
+                # Padding is +inf and never before the target
+                if origin[slot] >= 0:
+                    below += yield from probe(origin[slot], keys[slot], "Block key {}: {}")
+            if below < block:
+                best = base + below
+            node = node * (block + 1) + below + 1
+        return origin[best] if best >= 0 and origin[best] >= 0 else len(arr)
+    
+    @staticmethod
+    def bounds(arr: List[int], target: int,
+               policy: Optional[EmissionPolicy] = None,
+               counters: Optional[OperationCounters] = None,
+               method: str = "binary", mode: str = "range",
+               layout: Optional[SearchLayout] = None) -> EventTrace:
+        """Bound search - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            arr, SearchCore.iter_bounds(arr, target, policy, counters, method, mode, layout),
+            policy=policy, counters=counters
+        )
+    
+    @staticmethod
+    def iter_bounds(arr: List[int], target: int,
+                    policy: Optional[EmissionPolicy] = None,
+                    counters: Optional[OperationCounters] = None,
+                    method: str = "binary", mode: str = "range",
+                    layout: Optional[SearchLayout] = None) -> Iterator[AlgorithmEvent]:
+        """
+        Lower bound, upper bound or equal range with any search method -
+        yields events lazily
+        lower: first index of target, upper: last index of target,
+        range: all indices of target (count = stop - start)
+        """
+        if mode not in SearchCore.SEARCH_MODES[1:]:
+            raise ValueError(f"Unknown search mode: {mode!r}")
+        emit = EmissionGate(policy)
+        counters = counters or OperationCounters()
+        core = getattr(SearchCore, f"_bound_{method}")
+        if method in ("eytzinger", "btree"):
+            layout = layout or getattr(SearchCore, f"build_{method}")(arr, counters)
+        elif method.endswith("interpolation"):
+            core = partial(core, target=target)
+        n = len(arr)
+        
+        def probe_with(strict: bool):
+            def probe(index: int, key: int, template: str):
+                if emit.allows(EventType.COMPARE):
+                    yield AlgorithmEvent(
+                        event_type=EventType.COMPARE,
+                        indices=[index],
+                        values=[key],
+                        template=template,
+                        args=(index, key)
+                    )
+                counters.comparisons += 1
+                return key < target if strict else key <= target
+            return probe
+        
+        lower = upper = None
+        if mode in ("lower", "range"):
+            lower = yield from core(arr, probe_with(True), layout=layout)
+        if mode in ("upper", "range"):
+            upper = yield from core(arr, probe_with(False), layout=layout)
+        
+        if mode == "range":
+            if upper > lower:
+                yield AlgorithmEvent(
+                    event_type=EventType.FOUND,
+                    indices=range(lower, upper),
+                    values=[target],
+                    template="✓ {} occurs {} times at [{}:{}]",
+                    args=(target, upper - lower, lower, upper)
+                )
+                return
+            yield AlgorithmEvent(
+                event_type=EventType.NOT_FOUND,
+                indices=[],
+                values=[target],
+                template="✗ {} not found, would insert at {}",
+                args=(target, lower)
+            )
+            return
+        
+        # One equality check on the key next to the boundary
+        index = lower if mode == "lower" else upper - 1
+        if 0 <= index < n:
+            counters.comparisons += 1
+            if arr[index] == target:
+                yield AlgorithmEvent(
+                    event_type=EventType.FOUND,
+                    indices=[index],
+                    values=[target],
+                    template=("✓ FOUND {} first at index {}!" if mode == "lower"
+                              else "✓ FOUND {} last at index {}!"),
+                    args=(target, index)
+                )
+                return
         
-        events.append(AlgorithmEvent(
+        yield AlgorithmEvent(
             event_type=EventType.NOT_FOUND,
             indices=[],
             values=[target],
-            message=f"✗ {target} not found",
-            data_snapshot=arr.copy()
-        ))
+            template="✗ {} not found, would insert at {}",
+            args=(target, lower if mode == "lower" else upper)
+        )
+
+
+    # Bare execution paths: same searches with no event emission,
+    # each returns the index the traced version reports (or -1)
+
+    @staticmethod
+    def bare_linear_search(arr: List[int], target: int, mode: str = "first"):
+        """Linear search without events - returns index or -1"""
+        if mode != "first":
+            return SearchCore.bare_bounds(arr, target, "linear", mode)
+        for i in range(len(arr)):
+            if arr[i] == target:
+                return i
+        return -1
+
+    @staticmethod
+    def bare_binary_search(arr: List[int], target: int, mode: str = "first"):
+        """Binary search without events - returns index or -1"""
+        if mode != "first":
+            return SearchCore.bare_bounds(arr, target, "binary", mode)
+        left, right = 0, len(arr) - 1
+        
+        while left <= right:
+            mid = (left + right) // 2
+            if arr[mid] == target:
+                return mid
+            elif arr[mid] < target:
+                left = mid + 1
+            else:
+                right = mid - 1
         
-        return events
+        return -1
 
     @staticmethod
-    def jump_search(arr: List[int], target: int) -> List[AlgorithmEvent]:
-        """Jump search - returns event sequence"""
-        events = []
+    def bare_jump_search(arr: List[int], target: int, mode: str = "first"):
+        """Jump search without events - returns index or -1"""
+        if mode != "first":
+            return SearchCore.bare_bounds(arr, target, "jump", mode)
         n = len(arr)
         step = int(math.sqrt(n))
         prev = 0
         
-        # Jump through array
         while arr[min(step, n) - 1] < target:
-            events.append(AlgorithmEvent(
-                event_type=EventType.HIGHLIGHT,
-                indices=list(range(prev, min(step, n))),
-                message=f"Jumping: block [{prev}:{min(step, n)}]",
-                data_snapshot=arr.copy()
-            ))
-            
             prev = step
             step += int(math.sqrt(n))
-            
             if prev >= n:
-                events.append(AlgorithmEvent(
-                    event_type=EventType.NOT_FOUND,
-                    indices=[],
-                    values=[target],
-                    message=f"✗ {target} not found",
-                    data_snapshot=arr.copy()
-                ))
-                return events
+                return -1
         
-        # Linear search in block
         while arr[prev] < target:
-            events.append(AlgorithmEvent(
-                event_type=EventType.COMPARE,
-                indices=[prev],
-                values=[arr[prev]],
-                message=f"Linear search at index {prev}",
-                data_snapshot=arr.copy()
-            ))
-            
             prev += 1
-            
             if prev == min(step, n):
-                events.append(AlgorithmEvent(
-                    event_type=EventType.NOT_FOUND,
-                    indices=[],
-                    values=[target],
-                    message=f"✗ {target} not found",
-                    data_snapshot=arr.copy()
-                ))
-                return events
-        
-        if arr[prev] == target:
-            events.append(AlgorithmEvent(
-                event_type=EventType.FOUND,
-                indices=[prev],
-                values=[target],
-                message=f"✓ FOUND {target} at index {prev}!",
-                data_snapshot=arr.copy()
-            ))
-            return events
+                return -1
         
-        events.append(AlgorithmEvent(
-            event_type=EventType.NOT_FOUND,
-            indices=[],
-            values=[target],
-            message=f"✗ {target} not found",
-            data_snapshot=arr.copy()
-        ))
-        
-        return events
+        return prev if arr[prev] == target else -1
 
     @staticmethod
-    def interpolation_search(arr: List[int], target: int) -> List[AlgorithmEvent]:
-        """Interpolation search - returns event sequence"""
-        events = []
+    def bare_interpolation_search(arr: List[int], target: int, mode: str = "first"):
+        """Interpolation search without events - returns index or -1"""
+        if mode != "first":
+            return SearchCore.bare_bounds(arr, target, "interpolation", mode)
         left, right = 0, len(arr) - 1
         
         while left <= right and arr[left] <= target <= arr[right]:
             if left == right:
-                if arr[left] == target:
-                    events.append(AlgorithmEvent(
-                        event_type=EventType.FOUND,
-                        indices=[left],
-                        values=[target],
-                        message=f"✓ FOUND {target} at index {left}!",
-                        data_snapshot=arr.copy()
-                    ))
-                else:
-                    events.append(AlgorithmEvent(
-                        event_type=EventType.NOT_FOUND,
-                        indices=[],
-                        values=[target],
-                        message=f"✗ {target} not found",
-                        data_snapshot=arr.copy()
-                    ))
-                return events
+                return left if arr[left] == target else -1
             
-            # Calculate position using interpolation
-            pos = left + int(((target - arr[left]) / (arr[right] - arr[left])) * (right - left))
+            span = arr[right] - arr[left]
+            pos = left + (target - arr[left]) * (right - left) // span if span else left
             
-            events.append(AlgorithmEvent(
-                event_type=EventType.COMPARE,
-                indices=[left, pos, right],
-                values=[arr[left], arr[pos], arr[right]],
-                message=f"Interpolating: checking position {pos}",
-                data_snapshot=arr.copy()
-            ))
+            if arr[pos] == target:
+                return pos
+            elif arr[pos] < target:
+                left = pos + 1
+            else:
+                right = pos - 1
+        
+        return -1
+
+    @staticmethod
+    def bare_robust_interpolation_search(arr: List[int], target: int, mode: str = "first"):
+        """Robust interpolation search without events - returns index or -1"""
+        if mode != "first":
+            return SearchCore.bare_bounds(arr, target, "robust_interpolation", mode)
+        left, right = 0, len(arr) - 1
+        budget = SearchCore._interpolation_budget(len(arr))
+        
+        while right - left >= SearchCore.INTERP_SEQUENTIAL:
+            if target < arr[left] or target > arr[right]:
+                return -1
+            span = arr[right] - arr[left]
+            if budget and span:
+                budget -= 1
+                pos = left + (target - arr[left]) * (right - left) // span
+            else:
+                pos = (left + right) // 2
             
             if arr[pos] == target:
-                events.append(AlgorithmEvent(
-                    event_type=EventType.FOUND,
-                    indices=[pos],
-                    values=[target],
-                    message=f"✓ FOUND {target} at index {pos}!",
-                    data_snapshot=arr.copy()
-                ))
-                return events
+                return pos
             elif arr[pos] < target:
                 left = pos + 1
             else:
                 right = pos - 1
         
-        events.append(AlgorithmEvent(
-            event_type=EventType.NOT_FOUND,
-            indices=[],
-            values=[target],
-            message=f"✗ {target} not found",
-            data_snapshot=arr.copy()
-        ))
+        for i in range(left, right + 1):
+            if arr[i] == target:
+                return i
+            if arr[i] > target:
+                break
+        return -1
+
+    @staticmethod
+    def bare_auto_search(arr: List[int], target: int, mode: str = "first"):
+        """Auto search without events - returns index or -1"""
+        method, _ = SearchCore.choose_search(arr)
+        return getattr(SearchCore, f"bare_{method}_search")(arr, target, mode)
+
+    @staticmethod
+    def bare_eytzinger_search(arr: List[int], target: int,
+                              layout: Optional[SearchLayout] = None,
+                              mode: str = "first"):
+        """Eytzinger layout search without events - returns index or -1"""
+        if mode != "first":
+            return SearchCore.bare_bounds(arr, target, "eytzinger", mode, layout)
+        layout = layout or SearchCore.build_eytzinger(arr)
+        keys, n = layout.keys, layout.size
+        
+        k = 1
+        while k <= n:
+            k = 2 * k + (keys[k] < target)
+        k >>= ((~k) & (k + 1)).bit_length()
+        
+        return layout.origin[k] if k and keys[k] == target else -1
+
+    @staticmethod
+    def bare_btree_search(arr: List[int], target: int,
+                          layout: Optional[SearchLayout] = None,
+                          mode: str = "first"):
+        """B-tree layout search without events - returns index or -1"""
+        if mode != "first":
+            return SearchCore.bare_bounds(arr, target, "btree", mode, layout)
+        layout = layout or SearchCore.build_btree(arr)
+        keys = layout.keys
+        block = SearchCore.BTREE_BLOCK
+        nodes = len(keys) // block
+        
+        # Keys within a node are sorted, so bisect gives the count below target
+        node, best = 0, -1
+        while node < nodes:
+            base = node * block
+            below = bisect.bisect_left(keys, target, base, base + block) - base
+            if below < block:
+                best = base + below
+            node = node * (block + 1) + below + 1
+        
+        return layout.origin[best] if best >= 0 and keys[best] == target else -1
+
+    @staticmethod
+    def bare_bounds(arr: List[int], target: int, method: str = "binary",
+                    mode: str = "range", layout: Optional[SearchLayout] = None):
+        """
+        Bound search without events (same cores, probes emit nothing)
+        
+        Returns:
+            first index (lower) or last index (upper) of target, or -1;
+            (start, stop) of all its indices for range
+        """
+        if mode not in SearchCore.SEARCH_MODES[1:]:
+            raise ValueError(f"Unknown search mode: {mode!r}")
+        core = getattr(SearchCore, f"_bound_{method}")
+        if method in ("eytzinger", "btree"):
+            layout = layout or getattr(SearchCore, f"build_{method}")(arr)
+        elif method.endswith("interpolation"):
+            core = partial(core, target=target)
+        
+        def run(strict: bool) -> int:
+            def probe(index: int, key: int, template: str):
+                return key < target if strict else key <= target
+                yield  # a generator that never emits
+            try:
+                next(core(arr, probe, layout=layout))
+            except StopIteration as done:
+                return done.value
+        
+        if mode == "range":
+            return run(True), run(False)
+        if mode == "lower":
+            index = run(True)
+        else:
+            index = run(False) - 1
+        return index if 0 <= index < len(arr) and arr[index] == target else -1
+
+    @staticmethod
+    def bare_exponential_search(arr: List[int], target: int, mode: str = "first"):
+        """Exponential search without events - returns index or -1"""
+        if mode != "first":
+            return SearchCore.bare_bounds(arr, target, "exponential", mode)
+        n = len(arr)
+        bound = 1
+        while bound < n and arr[bound] < target:
+            bound *= 2
+        
+        left, right = bound // 2, min(bound, n - 1)
+        while left <= right:
+            mid = (left + right) // 2
+            if arr[mid] == target:
+                return mid
+            elif arr[mid] < target:
+                left = mid + 1
+            else:
+                right = mid - 1
+        return -1
+
+    @staticmethod
+    def bare_fibonacci_search(arr: List[int], target: int, mode: str = "first"):
+        """Fibonacci search without events - returns index or -1"""
+        if mode != "first":
+            return SearchCore.bare_bounds(arr, target, "fibonacci", mode)
+        n = len(arr)
+        fib2, fib1 = 0, 1
+        fib = fib1 + fib2
+        while fib < n:
+            fib2, fib1 = fib1, fib
+            fib = fib1 + fib2
+        
+        offset = -1
+        while fib > 1:
+            i = min(offset + fib2, n - 1)
+            if arr[i] == target:
+                return i
+            elif arr[i] < target:
+                fib, fib1 = fib1, fib2
+                fib2 = fib - fib1
+                offset = i
+            else:
+                fib, fib1 = fib2, fib1 - fib2
+                fib2 = fib - fib1
+        
+        if fib1 and offset + 1 < n and arr[offset + 1] == target:
+            return offset + 1
+        return -1
+
+    @staticmethod
+    def bare_ternary_search(arr: List[int], target: int, mode: str = "first"):
+        """Ternary search without events - returns index or -1"""
+        if mode != "first":
+            return SearchCore.bare_bounds(arr, target, "ternary", mode)
+        left, right = 0, len(arr) - 1
+        while left <= right:
+            third = (right - left) // 3
+            mid1, mid2 = left + third, right - third
+            if arr[mid1] == target:
+                return mid1
+            if arr[mid2] == target:
+                return mid2
+            if target < arr[mid1]:
+                right = mid1 - 1
+            elif target > arr[mid2]:
+                left = mid2 + 1
+            else:
+                left, right = mid1 + 1, mid2 - 1
+        return -1
+
+
+    # Batch execution: many targets at once, vectorized with NumPy.
+    # Each kernel returns the index the scalar search reports for every
+    # target (or -1) and its probe count (the comparisons it counts)
+    
+    BATCH_METHODS = ("linear", "binary", "jump", "interpolation")
+    BATCH_SAMPLE = 8  # queries animated out of a batch
+    
+    @staticmethod
+    def _batch_linear(keys: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """First occurrence of each target, via a table of unique keys"""
+        values, first = np.unique(keys, return_index=True)
+        slot = np.minimum(np.searchsorted(values, targets), len(values) - 1)
+        hit = values[slot] == targets
+        result = np.where(hit, first[slot], -1)
+        return result, np.where(hit, result + 1, len(keys))
+    
+    @staticmethod
+    def _binary_depths(n: int) -> np.ndarray:
+        """Depth of every index in binary search's implicit tree (root mid = 0)"""
+        depths = np.empty(n, dtype=np.int64)
+        low, high = np.array([0]), np.array([n - 1])
+        level = 0
+        while len(low):
+            mid = (low + high) // 2
+            depths[mid] = level
+            low, high = np.concatenate((low, mid + 1)), np.concatenate((mid - 1, high))
+            keep = low <= high
+            low, high = low[keep], high[keep]
+            level += 1
+        return depths
+    
+    @staticmethod
+    def _batch_binary(keys: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        np.searchsorted for distinct keys: a hit costs two probes per level
+        above its node plus one, a miss two per node down to the deeper of
+        its neighbours. Duplicate keys bisect in lockstep instead, since the
+        index found depends on which equal key the path meets first.
+        """
+        n = len(keys)
+        if n < 2 or bool(np.all(keys[1:] > keys[:-1])):
+            depths = SearchCore._binary_depths(n)
+            slot = np.searchsorted(keys, targets)
+            inside = np.minimum(slot, n - 1)
+            hit = (slot < n) & (keys[inside] == targets)
+            gap_depth = np.maximum(depths[np.maximum(slot - 1, 0)], depths[inside])
+            probes = np.where(hit, 2 * depths[inside] + 1, 2 * gap_depth + 2)
+            return np.where(hit, slot, -1), probes
+        
+        m = len(targets)
+        left = np.zeros(m, dtype=np.int64)
+        right = np.full(m, len(keys) - 1, dtype=np.int64)
+        result = np.full(m, -1, dtype=np.int64)
+        probes = np.zeros(m, dtype=np.int64)
+        
+        active = np.flatnonzero(left <= right)
+        while len(active):
+            mid = (left[active] + right[active]) // 2
+            value, target = keys[mid], targets[active]
+            hit = value == target
+            result[active[hit]] = mid[hit]
+            probes[active] += 2 - hit  # equality, then direction unless hit
+            
+            go_right = ~hit & (value < target)
+            go_left = ~hit & (value > target)
+            left[active[go_right]] = mid[go_right] + 1
+            right[active[go_left]] = mid[go_left] - 1
+            
+            active = active[~hit]
+            active = active[left[active] <= right[active]]
+        return result, probes
+    
+    @staticmethod
+    def _batch_jump(keys: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Block lookup over the block-end keys, then the slot inside the block"""
+        n = len(keys)
+        step = int(math.sqrt(n))
+        block_ends = keys[np.minimum(np.arange(step, n + step, step), n) - 1]
+        
+        jumps = np.searchsorted(block_ends, targets)
+        start = jumps * step
+        inside = start < n
+        
+        # Inside the last block checked, the scan stops at the first key >= target
+        slot = np.minimum(np.searchsorted(keys, targets), n - 1)
+        hit = inside & (keys[slot] == targets)
+        result = np.where(hit, slot, -1)
+        probes = np.where(inside, jumps + 3 + slot - start, jumps)
+        return result, probes
+    
+    @staticmethod
+    def _batch_interpolation(keys: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """All targets interpolate in lockstep, one probe position per round"""
+        m = len(targets)
+        left = np.zeros(m, dtype=np.int64)
+        right = np.full(m, len(keys) - 1, dtype=np.int64)
+        result = np.full(m, -1, dtype=np.int64)
+        probes = np.zeros(m, dtype=np.int64)
+        
+        active = np.flatnonzero(left <= right)
+        while len(active):
+            lo, hi, target = left[active], right[active], targets[active]
+            low_key, high_key = keys[lo], keys[hi]
+            
+            # Target outside the current value range ends the search
+            below = low_key > target
+            above = ~below & (target > high_key)
+            probes[active] += np.where(below, 1, 2)
+            alive = ~below & ~above
+            
+            # A single candidate left: one equality check
+            single = alive & (lo == hi)
+            probes[active[single]] += 1
+            found = single & (low_key == target)
+            result[active[found]] = lo[found]
+            
+            probing = alive & ~single
+            
+            # Integer floor, as the scalar search computes it; equal end keys
+            # (a run of the target) probe lo
+            span = high_key - low_key
+            interpolate = probing & (span != 0)
+            offset = np.where(interpolate, target - low_key, 0)
+            width = hi - lo
+            divisor = np.where(interpolate, span, 1)
+            step = np.zeros(len(active), dtype=np.int64)
+            
+            # offset * width overflows int64 only for huge key gaps; those
+            # rows are computed with Python ints
+            exact = offset <= np.iinfo(np.int64).max // np.maximum(width, 1)
+            step[exact] = offset[exact] * width[exact] // divisor[exact]
+            if not exact.all():
+                step[~exact] = [o * w // d for o, w, d in zip(offset[~exact].tolist(),
+                                                              width[~exact].tolist(),
+                                                              divisor[~exact].tolist())]
+            pos = lo + step
+            pos_key = keys[pos]
+            hit = probing & (pos_key == target)
+            result[active[hit]] = pos[hit]
+            probes[active[probing]] += 2 - hit[probing]
+            
+            go_right = probing & ~hit & (pos_key < target)
+            go_left = probing & ~hit & (pos_key > target)
+            left[active[go_right]] = pos[go_right] + 1
+            right[active[go_left]] = pos[go_left] - 1
+            
+            active = active[go_right | go_left]
+            active = active[left[active] <= right[active]]
+        return result, probes
+    
+    @staticmethod
+    def batch_search(arr: List[int], targets: Sequence[int],
+                     method: str = "binary") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Answer many queries at once
+        
+        Args:
+            arr: sorted array to search
+            targets: query values
+            method: one of BATCH_METHODS
+        
+        Returns:
+            (result index per target or -1, probe count per target)
+        """
+        if method not in SearchCore.BATCH_METHODS:
+            raise ValueError(f"Unknown batch search method: {method!r}")
+        keys = np.asarray(arr, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if not len(keys):
+            return np.full(len(targets), -1, dtype=np.int64), np.zeros(len(targets), dtype=np.int64)
+        return getattr(SearchCore, f"_batch_{method}")(keys, targets)
+    
+    @staticmethod
+    def query_log(arr: List[int], count: int, hit_rate: float = 0.8,
+                  seed: Optional[int] = None) -> np.ndarray:
+        """
+        Synthetic query log: hits drawn with Zipf-like popularity over the
+        keys, the rest spread uniformly around the key range (mostly misses)
+        """
+        rng = np.random.default_rng(seed)
+        keys = np.asarray(arr, dtype=np.int64)
+        hits = int(round(count * hit_rate)) if len(keys) else 0
+        
+        popularity = 1.0 / np.arange(1, len(keys) + 1)
+        popular = rng.permutation(len(keys))
+        queries = keys[popular[rng.choice(len(keys), hits, p=popularity / popularity.sum())]] \
+            if hits else np.empty(0, dtype=np.int64)
+        
+        low, high = (int(keys[0]), int(keys[-1])) if len(keys) else (0, 100)
+        spread = max(1, (high - low) // 10)
+        others = rng.integers(low - spread, high + spread + 1, count - hits)
+        queries = np.concatenate((queries, others))
+        rng.shuffle(queries)
+        return queries
+    
+    @staticmethod
+    def batch(arr: List[int], targets: Sequence[int],
+              policy: Optional[EmissionPolicy] = None,
+              counters: Optional[OperationCounters] = None,
+              method: str = "binary", sample: int = BATCH_SAMPLE) -> EventTrace:
+        """Batch search with sampled animation - returns event sequence"""
+        counters = counters or OperationCounters()
+        return EventTrace.from_events(
+            arr, SearchCore.iter_batch(arr, targets, policy, counters, method, sample),
+            policy=policy, counters=counters
+        )
+    
+    @staticmethod
+    def iter_batch(arr: List[int], targets: Sequence[int],
+                   policy: Optional[EmissionPolicy] = None,
+                   counters: Optional[OperationCounters] = None,
+                   method: str = "binary",
+                   sample: int = BATCH_SAMPLE) -> Iterator[AlgorithmEvent]:
+        """
+        Batch search - yields events lazily
+        All targets are answered by the vectorized kernel (their probes go
+        into the counters); `sample` evenly spaced queries are replayed
+        through the scalar search for the animation
+        """
+        counters = counters or OperationCounters()
+        result, probes = SearchCore.batch_search(arr, targets, method)
+        counters.comparisons += int(probes.sum())
+        
+        targets = np.asarray(targets, dtype=np.int64)
+        picks = np.unique(np.linspace(0, len(targets) - 1, min(sample, len(targets))).astype(int)) \
+            if len(targets) and len(arr) else []
+        
+        # Sampled queries share the event budget
+        sample_policy = policy
+        if policy is not None and policy.max_events is not None and len(picks):
+            sample_policy = replace(policy, max_events=policy.max_events // len(picks))
+        
+        iter_search = getattr(SearchCore, f"iter_{method}_search")
+        for q, k in enumerate(picks, 1):
+            for event in iter_search(arr, int(targets[k]), sample_policy):
+                yield AlgorithmEvent(
+                    event_type=event.event_type,
+                    indices=event.indices,
+                    values=event.values,
+                    template=f"Query {q}/{len(picks)}: " + event.template,
+                    args=event.args
+                )
+        
+        found = int((result >= 0).sum())
+        yield AlgorithmEvent(
+            event_type=EventType.FOUND if found else EventType.NOT_FOUND,
+            indices=np.unique(result[result >= 0]).tolist(),
+            template="✓ Batch: {} of {} targets found, {} probes" if found
+            else "✗ Batch: none of {} targets found, {} probes",
+            args=(found, len(targets), int(probes.sum())) if found
+            else (len(targets), int(probes.sum()))
+        )
+
+
+class BareTimer:
+    """Times the bare (event-free) path of an algorithm with perf_counter"""
+    
+    DEFAULT_REPEATS = 5
+    MIN_RUN_TIME = 0.002  # seconds per repeat before loops stop growing
+    
+    @staticmethod
+    def find_bare(algorithm_func: Callable) -> Optional[Callable]:
+        """
+        Look up the bare counterpart of an AlgorithmCore/SearchCore function
+        (e.g. iter_bubble_sort or bubble_sort -> bare_bubble_sort)
+        """
+        owner_name, _, name = algorithm_func.__qualname__.rpartition('.')
+        owner = {"AlgorithmCore": AlgorithmCore, "SearchCore": SearchCore}.get(owner_name)
+        if owner is None:
+            return None
+        if name.startswith("iter_"):
+            name = name[len("iter_"):]
+        return getattr(owner, "bare_" + name, None)
+    
+    @staticmethod
+    def time_bare(bare_func: Callable, *args, 
+                  repeats: int = DEFAULT_REPEATS, **options) -> float:
+        """
+        Best-of-N seconds per call of a bare algorithm
+        Loops per repeat grow until one repeat lasts MIN_RUN_TIME, so
+        tiny inputs are not lost in timer resolution
+        
+        Args:
+            bare_func: bare algorithm function
+            *args: arguments for each call (the function must not mutate them)
+            repeats: number of timed repeats
+            **options: algorithm options (e.g. pivot) passed to each call
+        """
+        from time import perf_counter
+        
+        loops = 1
+        while True:
+            start = perf_counter()
+            for _ in range(loops):
+                bare_func(*args, **options)
+            elapsed = perf_counter() - start
+            if elapsed >= BareTimer.MIN_RUN_TIME:
+                break
+            loops *= 10
         
-        return events
\ No newline at end of file
+        best = elapsed / loops
+        for _ in range(repeats - 1):
+            start = perf_counter()
+            for _ in range(loops):
+                bare_func(*args, **options)
+            best = min(best, (perf_counter() - start) / loops)
+        
+        return best
+
+
+def _merge_sort_chunk(args: Tuple[List[int], Optional[EmissionPolicy]]):
+    """Process pool task: traced merge sort of one chunk"""
+    chunk, policy = args
+    counters = OperationCounters()
+    return list(AlgorithmCore.iter_merge_sort(chunk, policy, counters)), counters
+
+
+class WorkerPool:
+    """
+    Process pools for the parallel algorithms, one per worker count
+    Pools are created on first use and kept, so timings do not include
+    process startup; a single worker runs in-process
+    """
+    
+    _pools: Dict[int, ProcessPoolExecutor] = {}
+    
+    @staticmethod
+    def map(func: Callable, items: List[Any], workers: int) -> List[Any]:
+        """Apply func to each item on `workers` processes, results in order"""
+        if workers <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        pool = WorkerPool._pools.get(workers)
+        if pool is None:
+            pool = WorkerPool._pools[workers] = ProcessPoolExecutor(max_workers=workers)
+        return list(pool.map(func, items))
+    
+    @staticmethod
+    def shutdown():
+        """Stop all pool processes"""
+        for pool in WorkerPool._pools.values():
+            pool.shutdown(cancel_futures=True)
+        WorkerPool._pools.clear()
+
+
+atexit.register(WorkerPool.shutdown)
@@ -14,7 +14,7 @@ import warnings
 warnings.filterwarnings("ignore", message="findfont:")
 
 # Import core modules
-from core_algorithms import AlgorithmCore, SearchCore, EventType
+from core_algorithms import AlgorithmCore, SearchCore, EventType, EmissionPolicy
 from ui_rendering import (THEME, SortingVisualizer, SearchVisualizer, 
                           TreeVisualizer, AnimationPlayer)
 from tree_history import (TreeOperations, HistoryManager, DataManager, 
@@ -24,6 +24,15 @@ from tree_history import (TreeOperations, HistoryManager, DataManager,
 class AlgorithmVisualizer:
     """Main application class integrating all components"""
     
+    # Event filter presets offered in the sorting controls
+    EVENT_FILTERS = {
+        "ALL EVENTS": {},
+        "SWAPS ONLY": {"event_types": frozenset({EventType.SWAP})},
+        "STATE CHANGES": {"state_changes_only": True},
+        "NO COMPARES": {"event_types": frozenset(
+            t for t in EventType if t != EventType.COMPARE)},
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Algorithm Visualizer - Enhanced")
@@ -38,10 +47,13 @@ class AlgorithmVisualizer:
         # Initialize history managers
         self.sorting_history = HistoryManager("sorting_history.json")
         self.search_history = HistoryManager("search_history.json")
-        self.execution_times = {}
+        self.execution_times = {}  # bare (event-free) algorithm time
+        self.trace_times = {}      # time spent generating the event trace
+        self.operation_counts = {}  # OperationCounters.to_dict() per algorithm
         
         # Animation control
         self.current_player = None
+        self.last_trace = None  # (algorithm name, EventTrace) of the last sort
         
         # Create notebook for tabs
         self.notebook = ttk.Notebook(root)
@@ -142,6 +154,57 @@ class AlgorithmVisualizer:
                                   bg=THEME["bg"], fg=THEME["fg"])
         self.speed_scale.grid(row=1, column=1, columnspan=2, padx=5, pady=5)
         
+        # Event emission policy (applied inside the algorithms)
+        tk.Label(input_section, text="Events:", bg=THEME["bg"], fg=THEME["fg"], 
+                font=("Courier", 9)).grid(row=2, column=0, sticky="w", padx=5, pady=5)
+        self.event_filter = tk.StringVar(value="ALL EVENTS")
+        ttk.Combobox(input_section, textvariable=self.event_filter,
+                     values=list(self.EVENT_FILTERS), state="readonly",
+                     width=16, font=("Courier", 9)).grid(
+            row=2, column=1, sticky="w", padx=5, pady=5)
+        
+        policy_frame = tk.Frame(input_section, bg=THEME["bg"])
+        policy_frame.grid(row=2, column=2, padx=5, pady=5)
+        tk.Label(policy_frame, text="1/", bg=THEME["bg"], fg=THEME["fg"], 
+                font=("Courier", 9)).pack(side=tk.LEFT)
+        self.event_stride = tk.Spinbox(policy_frame, from_=1, to=10000, width=5,
+                                       bg=THEME["bg"], fg=THEME["fg"],
+                                       font=("Courier", 9), relief=tk.SOLID, bd=2)
+        self.event_stride.pack(side=tk.LEFT)
+        tk.Label(policy_frame, text="MAX", bg=THEME["bg"], fg=THEME["fg"], 
+                font=("Courier", 9)).pack(side=tk.LEFT, padx=(5, 0))
+        self.event_budget = tk.Entry(policy_frame, width=7, bg=THEME["bg"], 
+                                     fg=THEME["fg"], font=("Courier", 9), 
+                                     relief=tk.SOLID, bd=2)
+        self.event_budget.pack(side=tk.LEFT)
+        
+        # Quick sort pivot strategy
+        tk.Label(input_section, text="Pivot:", bg=THEME["bg"], fg=THEME["fg"], 
+                font=("Courier", 9)).grid(row=3, column=0, sticky="w", padx=5, pady=5)
+        self.pivot_strategy = tk.StringVar(value=AlgorithmCore.PIVOT_STRATEGIES[0])
+        ttk.Combobox(input_section, textvariable=self.pivot_strategy,
+                     values=list(AlgorithmCore.PIVOT_STRATEGIES), state="readonly",
+                     width=16, font=("Courier", 9)).grid(
+            row=3, column=1, sticky="w", padx=5, pady=5)
+        
+        # Radix sort digit base
+        base_frame = tk.Frame(input_section, bg=THEME["bg"])
+        base_frame.grid(row=3, column=2, padx=5, pady=5)
+        tk.Label(base_frame, text="BASE", bg=THEME["bg"], fg=THEME["fg"], 
+                font=("Courier", 9)).pack(side=tk.LEFT)
+        self.radix_base = tk.StringVar(value=str(AlgorithmCore.RADIX_BASES[0]))
+        ttk.Combobox(base_frame, textvariable=self.radix_base,
+                     values=[str(b) for b in AlgorithmCore.RADIX_BASES],
+                     state="readonly", width=5, font=("Courier", 9)).pack(side=tk.LEFT)
+        
+        # Parallel merge sort worker count
+        tk.Label(base_frame, text="WORKERS", bg=THEME["bg"], fg=THEME["fg"], 
+                font=("Courier", 9)).pack(side=tk.LEFT, padx=(5, 0))
+        self.worker_count = tk.StringVar(value="4")
+        ttk.Combobox(base_frame, textvariable=self.worker_count,
+                     values=[str(w) for w in AlgorithmCore.WORKER_COUNTS],
+                     state="readonly", width=3, font=("Courier", 9)).pack(side=tk.LEFT)
+        
         # Algorithm buttons
         algo_section = tk.LabelFrame(controls_frame, text="ALGORITHMS", 
                                    bg=THEME["bg"], fg=THEME["fg"], 
@@ -150,13 +213,24 @@ class AlgorithmVisualizer:
         algo_section.pack(side=tk.LEFT, padx=10, fill=tk.Y)
         
         algorithms = [
-            ("BUBBLE", lambda: self.run_sorting("Bubble Sort", AlgorithmCore.bubble_sort)),
-            ("SELECTION", lambda: self.run_sorting("Selection Sort", AlgorithmCore.selection_sort)),
-            ("INSERTION", lambda: self.run_sorting("Insertion Sort", AlgorithmCore.insertion_sort)),
-            ("MERGE", lambda: self.run_sorting("Merge Sort", AlgorithmCore.merge_sort)),
-            ("QUICK", lambda: self.run_sorting("Quick Sort", AlgorithmCore.quick_sort)),
-            ("HEAP", lambda: self.run_sorting("Heap Sort", AlgorithmCore.heap_sort)),
-            ("RADIX", lambda: self.run_sorting("Radix Sort", AlgorithmCore.radix_sort))
+            ("BUBBLE", lambda: self.run_sorting("Bubble Sort", AlgorithmCore.iter_bubble_sort)),
+            ("SELECTION", lambda: self.run_sorting("Selection Sort", AlgorithmCore.iter_selection_sort)),
+            ("INSERTION", lambda: self.run_sorting("Insertion Sort", AlgorithmCore.iter_insertion_sort)),
+            ("MERGE", lambda: self.run_sorting("Merge Sort", AlgorithmCore.iter_merge_sort)),
+            ("QUICK", lambda: self.run_sorting("Quick Sort", AlgorithmCore.iter_quick_sort,
+                                               pivot=self.pivot_strategy.get())),
+            ("HEAP", lambda: self.run_sorting("Heap Sort", AlgorithmCore.iter_heap_sort)),
+            ("RADIX", lambda: self.run_sorting("Radix Sort", AlgorithmCore.iter_radix_sort,
+                                               base=int(self.radix_base.get()))),
+            ("TIM", lambda: self.run_sorting("Tim Sort", AlgorithmCore.iter_tim_sort)),
+            ("SHELL", lambda: self.run_sorting("Shell Sort", AlgorithmCore.iter_shell_sort)),
+            ("BIN INSERT", lambda: self.run_sorting("Binary Insertion Sort",
+                                                    AlgorithmCore.iter_binary_insertion_sort)),
+            ("PAR MERGE", lambda: self.run_sorting("Parallel Merge Sort",
+                                                   AlgorithmCore.iter_parallel_merge_sort,
+                                                   workers=int(self.worker_count.get()))),
+            ("BITONIC", lambda: self.run_sorting("Bitonic Sort", AlgorithmCore.iter_bitonic_sort)),
+            ("ODD-EVEN", lambda: self.run_sorting("Odd-Even Sort", AlgorithmCore.iter_odd_even_sort))
         ]
         
         for i, (text, command) in enumerate(algorithms):
@@ -174,6 +248,9 @@ class AlgorithmVisualizer:
         control_buttons = [
             ("SAVE", self.save_sorted_data),
             ("LOAD", self.load_data_from_file),
+            ("EXPORT", self.export_trace),
+            ("IMPORT", self.import_trace),
+            ("STOP", self.stop_animation),
             ("RESET", self.reset_sort_visualization)
         ]
         
@@ -244,6 +321,26 @@ class AlgorithmVisualizer:
                           self.generate_search_data, 12).grid(
             row=0, column=2, padx=5, pady=5)
         
+        # Batch search: comma-separated targets or a generated query log
+        batch_frame = tk.Frame(input_section, bg=THEME["bg"])
+        batch_frame.grid(row=1, column=2, padx=5, pady=5)
+        self.batch_method = tk.StringVar(value="binary")
+        ttk.Combobox(batch_frame, textvariable=self.batch_method,
+                     values=list(SearchCore.BATCH_METHODS), state="readonly",
+                     width=13, font=("Courier", 9)).pack(side=tk.LEFT)
+        self.create_button(batch_frame, "BATCH", 
+                          lambda: self.run_batch_search(self.batch_method.get()), 7).pack(
+            side=tk.LEFT, padx=(3, 0))
+        
+        # Search mode: first hit, or lower/upper bound and equal range
+        tk.Label(input_section, text="Mode:", bg=THEME["bg"], fg=THEME["fg"], 
+                font=("Courier", 9)).grid(row=2, column=0, sticky="w", padx=5, pady=5)
+        self.search_mode = tk.StringVar(value="first")
+        ttk.Combobox(input_section, textvariable=self.search_mode,
+                     values=list(SearchCore.SEARCH_MODES), state="readonly",
+                     width=8, font=("Courier", 9)).grid(
+            row=2, column=1, sticky="w", padx=5, pady=5)
+        
         # Search algorithms
         search_section = tk.LabelFrame(controls_frame, text="SEARCH ALGORITHMS", 
                                      bg=THEME["bg"], fg=THEME["fg"], 
@@ -252,11 +349,24 @@ class AlgorithmVisualizer:
         search_section.pack(side=tk.LEFT, padx=10, fill=tk.Y)
         
         search_algorithms = [
-            ("LINEAR", lambda: self.run_search("Linear Search", SearchCore.linear_search)),
-            ("BINARY", lambda: self.run_search("Binary Search", SearchCore.binary_search)),
-            ("JUMP", lambda: self.run_search("Jump Search", SearchCore.jump_search)),
+            ("LINEAR", lambda: self.run_search("Linear Search", SearchCore.iter_linear_search)),
+            ("BINARY", lambda: self.run_search("Binary Search", SearchCore.iter_binary_search)),
+            ("JUMP", lambda: self.run_search("Jump Search", SearchCore.iter_jump_search)),
             ("INTERPOLATION", lambda: self.run_search("Interpolation Search", 
-                                                     SearchCore.interpolation_search))
+                                                     SearchCore.iter_interpolation_search)),
+            ("EYTZINGER", lambda: self.run_search("Eytzinger Search",
+                                                 SearchCore.iter_eytzinger_search)),
+            ("B-TREE", lambda: self.run_search("B-Tree Search", SearchCore.iter_btree_search)),
+            ("EXPONENTIAL", lambda: self.run_search("Exponential Search",
+                                                   SearchCore.iter_exponential_search)),
+            ("FIBONACCI", lambda: self.run_search("Fibonacci Search",
+                                                 SearchCore.iter_fibonacci_search)),
+            ("TERNARY", lambda: self.run_search("Ternary Search",
+                                               SearchCore.iter_ternary_search)),
+            ("ROBUST INTERP", lambda: self.run_search("Robust Interpolation Search",
+                                                     SearchCore.iter_robust_interpolation_search)),
+            ("AUTO", lambda: self.run_search("Auto Search", SearchCore.iter_auto_search)),
+            ("STOP", self.stop_animation)
         ]
         
         for i, (text, command) in enumerate(search_algorithms):
@@ -401,6 +511,8 @@ class AlgorithmVisualizer:
         analysis_buttons = [
             ("COMPARE SORT", self.compare_sorting_algorithms),
             ("COMPARE SEARCH", self.compare_search_algorithms),
+            ("BENCHMARK", self.benchmark_sorting_algorithms),
+            ("SPEEDUP", self.show_parallel_speedup),
             ("BIG O", self.show_complexity_analysis),
             ("EXPORT", self.export_analysis)
         ]
@@ -447,6 +559,28 @@ class AlgorithmVisualizer:
         
         return btn
     
+    def get_emission_policy(self):
+        """
+        Build the EmissionPolicy selected in the sorting controls
+        
+        Returns:
+            EmissionPolicy, or None when every event should be emitted
+        """
+        try:
+            stride = max(1, int(self.event_stride.get()))
+        except ValueError:
+            stride = 1
+        
+        budget = self.event_budget.get().strip()
+        max_events = int(budget) if budget.isdigit() else None
+        
+        policy = EmissionPolicy(
+            stride=stride,
+            max_events=max_events,
+            **self.EVENT_FILTERS.get(self.event_filter.get(), {})
+        )
+        return None if policy.is_default() else policy
+    
     # Data generation methods
     def generate_sort_data(self):
         """Generate random data for sorting"""
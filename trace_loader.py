@@ -0,0 +1,129 @@
+"""
+Standalone Trace Loader
+Reads trace files exported by the visualizer (EventTrace.save) using only
+the standard library, so traces generated on one machine can be inspected
+or replayed anywhere without the algorithm modules
+"""
+
+import json
+import sys
+import zlib
+from array import array
+from typing import Any, Dict, Iterator, List
+
+FILE_MAGIC = b"AVTRACE\x00"
+COMPRESSED_MAGIC = b"AVTRACEZ"
+SUPPORTED_FORMATS = (1,)
+
+
+def read_trace(path: str) -> Dict[str, Any]:
+    """
+    Read a trace file (compressed or not) into memory
+    
+    Returns:
+        the file header with a "data" dict of columns (array.array) added
+    Raises:
+        ValueError: not a trace file, or an unsupported format version
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw.startswith(COMPRESSED_MAGIC):
+        raw = zlib.decompress(raw[len(COMPRESSED_MAGIC):])
+    if not raw.startswith(FILE_MAGIC):
+        raise ValueError(f"Not a trace file: {path}")
+    
+    position = len(FILE_MAGIC)
+    length = int.from_bytes(raw[position:position + 4], "little")
+    header = json.loads(raw[position + 4:position + 4 + length])
+    if header.get("format") not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported trace format: {header.get('format')}")
+    start = -(-(position + 4 + length) // 8) * 8
+    
+    # Columns sit at 8-byte aligned offsets after the header
+    header["data"] = {}
+    for name, typecode, itemsize, offset, count in header["columns"]:
+        column = array(typecode)
+        if column.itemsize != itemsize:
+            raise ValueError(f"Trace written with {itemsize}-byte '{typecode}' items")
+        column.frombytes(raw[start + offset:start + offset + itemsize * count])
+        header["data"][name] = column
+    return header
+
+
+def iter_events(trace: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Decode the events of a trace read by read_trace, in order"""
+    data, flags = trace["data"], trace["flags"]
+    event_types, templates = trace["event_types"], trace["templates"]
+    
+    for i in range(len(data["_types"])):
+        code = data["_types"][i]
+        
+        indices = data["_index_data"][data["_index_offsets"][i]:data["_index_offsets"][i + 1]]
+        if code & flags["index_range"]:
+            indices = list(range(indices[0], indices[1]))
+        else:
+            indices = indices.tolist()
+        
+        values = None
+        if code & flags["has_values"]:
+            values = data["_value_data"][
+                data["_value_offsets"][i]:data["_value_offsets"][i + 1]].tolist()
+        
+        message = templates[data["_template_ids"][i]]
+        if code & flags["formatted"]:
+            if code & flags["args_are_values"]:
+                args = values
+            else:
+                args = data["_arg_data"][data["_arg_offsets"][i]:data["_arg_offsets"][i + 1]]
+            message = message.format(*args)
+        
+        start, stop = data["_write_offsets"][i], data["_write_offsets"][i + 1]
+        flat = data["_write_data"][2 * start:2 * stop]
+        lane = data["_lanes"][i]
+        
+        yield {
+            "event_type": event_types[code & flags["type_mask"]],
+            "indices": indices,
+            "values": values,
+            "message": message,
+            "writes": list(zip(flat[0::2], flat[1::2])),
+            "lane": None if lane < 0 else lane,
+        }
+
+
+def initial_state(trace: Dict[str, Any]) -> List[int]:
+    """Array state before the first event"""
+    data = trace["data"]
+    size = len(data["final"])
+    if not data["keyframe_slots"]:
+        return data["final"].tolist()
+    start = data["keyframe_slots"][0] * size
+    return data["keyframe_blocks"][start:start + size].tolist()
+
+
+def iter_states(trace: Dict[str, Any]) -> Iterator[List[int]]:
+    """Array state after each event, replaying the writes (a new list per event)"""
+    state = initial_state(trace)
+    for event in iter_events(trace):
+        for index, value in event["writes"]:
+            state[index] = value
+        yield list(state)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python trace_loader.py <trace file>")
+        sys.exit(1)
+    
+    trace = read_trace(sys.argv[1])
+    meta = trace.get("meta", {})
+    print(f"Algorithm: {meta.get('algorithm', 'unknown')}")
+    print(f"Events:    {len(trace['data']['_types'])}")
+    print(f"Size:      {len(trace['data']['final'])}")
+    if trace.get("counters"):
+        print(f"Counters:  {trace['counters']}")
+    for number, event in enumerate(iter_events(trace)):
+        if number == 10:
+            print("...")
+            break
+        print(f"{number:>6}  {event['event_type']:<10} {event['message']}")
@@ -415,18 +415,22 @@ class DataManager:
     def export_analysis(sorting_history: HistoryManager,
                        search_history: HistoryManager,
                        execution_times: Dict[str, float],
-                       filename: str):
+                       filename: str,
+                       trace_times: Dict[str, float] = None):
         """
         Export complete analysis to file
         
         Args:
             sorting_history: sorting history manager
             search_history: search history manager
-            execution_times: current execution times
+            execution_times: current bare (event-free) execution times
             filename: output filename
+            trace_times: time spent generating each algorithm's event trace
         """
+        trace_times = trace_times or {}
         export_data = {
             "sorting_performance": execution_times,
+            "sorting_trace_times": trace_times,
             "sorting_history": sorting_history.get_all(),
             "search_history": search_history.get_all(),
             "sorting_statistics": sorting_history.get_statistics(),
@@ -444,9 +448,10 @@ class DataManager:
                 
                 # Sorting performance
                 writer.writerow(['SORTING PERFORMANCE'])
-                writer.writerow(['Algorithm', 'Time (s)'])
+                writer.writerow(['Algorithm', 'Time (s)', 'Trace Time (s)'])
                 for algo, time_val in execution_times.items():
-                    writer.writerow([algo, f"{time_val:.4f}"])
+                    writer.writerow([algo, f"{time_val:.6f}",
+                                     f"{trace_times.get(algo, 0.0):.4f}"])
                 
                 writer.writerow([])  # Blank line
                 
@@ -490,20 +495,20 @@ class ComplexityInfo:
             "description": "Efficient for small or nearly sorted data"
         },
         "Merge Sort": {
-            "time_best": "O(n log n)",
+            "time_best": "O(n)",
             "time_average": "O(n log n)",
             "time_worst": "O(n log n)",
             "space": "O(n)",
             "stable": True,
-            "description": "Divide and conquer algorithm, guaranteed O(n log n)"
+            "description": "Bottom-up run merging, skips runs already in order"
         },
         "Quick Sort": {
-            "time_best": "O(n log n)",
+            "time_best": "O(n)",
             "time_average": "O(n log n)",
-            "time_worst": "O(n²)",
+            "time_worst": "O(n log n)",
             "space": "O(log n)",
             "stable": False,
-            "description": "Fast in-place sorting, average case O(n log n)"
+            "description": "Introsort: three-way partitions, heap sort past depth 2·log n"
         },
         "Heap Sort": {
             "time_best": "O(n log n)",
@@ -511,7 +516,7 @@ class ComplexityInfo:
             "time_worst": "O(n log n)",
             "space": "O(1)",
             "stable": False,
-            "description": "Guaranteed O(n log n), uses heap data structure"
+            "description": "Floyd heap build, bounce sift-down (about n log n comparisons)"
         },
         "Radix Sort": {
             "time_best": "O(d(n+k))",
@@ -519,7 +524,55 @@ class ComplexityInfo:
             "time_worst": "O(d(n+k))",
             "space": "O(n+k)",
             "stable": True,
-            "description": "Non-comparison sort, sorts by individual digits"
+            "description": "Non-comparison sort, one vectorized pass per digit (base k)"
+        },
+        "Tim Sort": {
+            "time_best": "O(n)",
+            "time_average": "O(n log n)",
+            "time_worst": "O(n log n)",
+            "space": "O(n)",
+            "stable": True,
+            "description": "Natural-run merge sort with galloping, fast on partly sorted data"
+        },
+        "Shell Sort": {
+            "time_best": "O(n log n)",
+            "time_average": "~O(n^1.3)",
+            "time_worst": "O(n^1.5)",
+            "space": "O(1)",
+            "stable": False,
+            "description": "Gapped insertion sort over Ciura's gap sequence"
+        },
+        "Binary Insertion Sort": {
+            "time_best": "O(n log n)",
+            "time_average": "O(n²)",
+            "time_worst": "O(n²)",
+            "space": "O(1)",
+            "stable": True,
+            "description": "Insertion sort with binary slot search, O(n log n) comparisons"
+        },
+        "Parallel Merge Sort": {
+            "time_best": "O(n log n / p)",
+            "time_average": "O(n log n / p + n log p)",
+            "time_worst": "O(n log n / p + n log p)",
+            "space": "O(n)",
+            "stable": True,
+            "description": "Chunks merge sorted on p worker processes, then k-way merged"
+        },
+        "Bitonic Sort": {
+            "time_best": "O(n log² n)",
+            "time_average": "O(n log² n)",
+            "time_worst": "O(n log² n)",
+            "space": "O(n)",
+            "stable": False,
+            "description": "Sorting network, O(log² n) vectorized compare-exchange stages"
+        },
+        "Odd-Even Sort": {
+            "time_best": "O(n)",
+            "time_average": "O(n²)",
+            "time_worst": "O(n²)",
+            "space": "O(n)",
+            "stable": True,
+            "description": "Transposition network, up to n vectorized neighbour stages"
         }
     }
     
@@ -551,6 +604,55 @@ class ComplexityInfo:
             "time_worst": "O(n)",
             "space": "O(1)",
             "description": "Uses interpolation formula for uniformly distributed data"
+        },
+        "Eytzinger Search": {
+            "time_best": "O(log n)",
+            "time_average": "O(log n)",
+            "time_worst": "O(log n)",
+            "space": "O(n)",
+            "description": "Binary search over a BFS-ordered copy; children sit next to each other"
+        },
+        "B-Tree Search": {
+            "time_best": "O(log n)",
+            "time_average": "O(log n)",
+            "time_worst": "O(log n)",
+            "space": "O(n)",
+            "description": "Static B-tree of 16-key blocks, one block scan per level"
+        },
+        "Exponential Search": {
+            "time_best": "O(1)",
+            "time_average": "O(log i)",
+            "time_worst": "O(log n)",
+            "space": "O(1)",
+            "description": "Doubles a bound until it passes the target, then binary searches"
+        },
+        "Fibonacci Search": {
+            "time_best": "O(1)",
+            "time_average": "O(log n)",
+            "time_worst": "O(log n)",
+            "space": "O(1)",
+            "description": "Splits at Fibonacci offsets using only addition and subtraction"
+        },
+        "Ternary Search": {
+            "time_best": "O(1)",
+            "time_average": "O(log₃ n)",
+            "time_worst": "O(log₃ n)",
+            "space": "O(1)",
+            "description": "Two probes split the range into thirds each step"
+        },
+        "Robust Interpolation Search": {
+            "time_best": "O(1)",
+            "time_average": "O(log log n)",
+            "time_worst": "O(log n)",
+            "space": "O(1)",
+            "description": "Interpolation with a probe budget, binary fallback and short scans"
+        },
+        "Auto Search": {
+            "time_best": "O(1)",
+            "time_average": "O(log n)",
+            "time_worst": "O(log n)",
+            "space": "O(1)",
+            "description": "Samples key uniformity, then picks linear, interpolation or binary"
         }
     }
     
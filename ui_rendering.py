@@ -5,10 +5,15 @@ Separates rendering logic from algorithm execution
 
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle, Circle
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Iterator
+from collections import deque
+import time
+from itertools import islice
 import numpy as np
-from core_algorithms import AlgorithmEvent, EventType
+from core_algorithms import AlgorithmEvent, EventType, EventTrace
 
 
 # Enhanced color theme with animation colors
@@ -28,6 +33,18 @@ THEME = {
     "button_active": "#333333" # active button color
 }
 
+# Per-worker colors for events that carry a lane (parallel sorts)
+LANE_COLORS = [
+    "#4CAF50",  # green
+    "#1E88E5",  # blue
+    "#FB8C00",  # orange
+    "#8E24AA",  # purple
+    "#00ACC1",  # teal
+    "#E53935",  # red
+    "#FDD835",  # yellow
+    "#6D4C41"   # brown
+]
+
 
 class GraphPaperBackground:
     """Static graph paper background generator - larger grid cells for clarity"""
@@ -80,21 +97,342 @@ class GraphPaperBackground:
         GraphPaperBackground.create_background(ax)
 
 
+class ColorState:
+    """
+    Per-bar RGBA colors kept as one persistent NumPy array
+    
+    Each frame clears only what the previous frame painted and paints the
+    event's indices by slice assignment (index ranges) or one fancy-index
+    assignment (index lists), so no per-element Python loop runs.
+    """
+    
+    def __init__(self, neutral: str = THEME["bg"]):
+        self.neutral = np.array(to_rgba(neutral))
+        self.rgba = np.empty((0, 4))
+        self._painted = None  # slice or index array painted last frame
+    
+    def reset(self, n: int) -> np.ndarray:
+        """Return n neutral colors, reusing the array when the size is unchanged"""
+        if len(self.rgba) != n:
+            self.rgba = np.tile(self.neutral, (n, 1))
+        elif self._painted is not None:
+            self.rgba[self._painted] = self.neutral
+        self._painted = None
+        return self.rgba
+    
+    def paint(self, indices, color: str):
+        """Color the given indices (out-of-range indices are ignored)"""
+        key = self.index_key(indices, len(self.rgba))
+        self.rgba[key] = to_rgba(color)
+        self._painted = key
+    
+    @staticmethod
+    def index_key(indices, n: int):
+        """Slice for contiguous ranges, filtered index array otherwise"""
+        if isinstance(indices, range) and indices.step == 1:
+            return slice(max(indices.start, 0), max(min(indices.stop, n), 0))
+        idx = np.fromiter(indices, dtype=np.intp)
+        return idx[(idx >= 0) & (idx < n)]
+
+
 class LayeredRenderer:
     """
     Layered rendering system
     Layer order: background → grid → elements → highlights → text
+    
+    Bar charts are built once per array size (build_bar_layers) and then
+    updated in place per frame: bar heights and colors, highlight
+    visibility and overlay text are set on the existing artists, and only
+    the ones that changed are touched.
+    
+    In blit mode the static layers (graph paper, spines, title, labels)
+    are drawn once with the dynamic ones hidden and the axes region is
+    cached; each frame restores that region and draws only the bars,
+    lit highlights and overlay on top. The cache is dropped on resize and
+    whenever the axis limits change.
+    
+    Arrays with more elements than the axis has pixel columns are drawn
+    at a level of detail instead: elements are grouped into one bucket
+    per pixel column, each drawn as a min-max envelope with a mean bar in
+    two PolyCollections, and highlighted indices are exact vertical lines
+    on top.
     """
     
-    def __init__(self, ax):
+    def __init__(self, ax, blit: bool = True):
         self.ax = ax
+        self.blit = blit
         self.cached_background = None
+        ax.figure.canvas.mpl_connect('resize_event', self._on_resize)
+        self.bars = None             # persistent bar collection (LOD: mean bars)
+        self.highlight_layer = None  # highlight rectangles of the lit bars
+        self._highlight_quads = None # highlight rectangle of every bar
+        self._lit = 0                # number of highlighted bars
+        self.overlay = None          # persistent message text
+        self.lod = False             # level-of-detail layers in use
+        self.envelope = None         # LOD: min-max envelope per column
+        self.markers = None          # LOD: exact highlighted indices
+        self._bucket = 1             # LOD: elements per column
+        self._values = None          # current data as an array
+        self._n = None
+        self._heights = None         # bar heights last set on the collection
+        self._top = None
         
     def clear_layers(self):
         """Clear all drawing layers (except cached background)"""
         self.ax.clear()
         # Reapply background
         GraphPaperBackground.apply_to_axis(self.ax)
+        # Persistent artists (and the background drawn with them) went with the clear
+        self.bars = None
+        self.highlight_layer = None
+        self.overlay = None
+        self.lod = False
+        self.envelope = None
+        self.markers = None
+        self._n = None
+        self.cached_background = None
+    
+    def invalidate_background(self, event=None):
+        """Drop the cached static background (next render is a full draw)"""
+        self.cached_background = None
+    
+    def _on_resize(self, event=None):
+        """
+        A new size needs a new background; layers are rebuilt on the next
+        draw when the width changes the LOD choice or the LOD columns
+        """
+        self.invalidate_background()
+        if self._n is not None and (self.lod or self._n > self.lod_columns()):
+            self._n = None
+    
+    def lod_columns(self) -> int:
+        """Pixel columns of the axis (arrays longer than this use LOD)"""
+        return max(1, int(self.ax.bbox.width))
+    
+    def has_bar_layers(self, n: int) -> bool:
+        """True if persistent layers for n bars are in place"""
+        return self.bars is not None and self._n == n
+    
+    def build_bar_layers(self, n: int, title: str):
+        """
+        Create the persistent layers for n bars: bars (or LOD columns),
+        highlights, overlay text, title and labels
+        """
+        self.clear_layers()
+        self._n = n
+        self.ax.set_xlim(-0.5, n - 0.5)
+        self._top = None
+        
+        if n > self.lod_columns():
+            self._build_lod_layers(n)
+        else:
+            self._build_bar_artists(n)
+        
+        self.overlay = self.ax.text(0.5, 0.95, "",
+                                    transform=self.ax.transAxes,
+                                    ha='center', va='center',
+                                    fontsize=10, fontweight='bold',
+                                    color=THEME["fg"],
+                                    family='Courier',
+                                    bbox=dict(boxstyle='round,pad=0.5', 
+                                              facecolor=THEME["bg"], 
+                                              alpha=0.8),
+                                    visible=False,
+                                    zorder=4)  # Above everything
+        
+        self.set_title(title)
+        self.set_labels("INDEX", "VALUE")
+    
+    def _build_bar_artists(self, n: int):
+        """One bar collection and one hidden highlight rectangle per element"""
+        # Bars are one collection; update_bars sets heights and colors
+        self.bars = PolyCollection([],
+                                   facecolors=THEME["bg"],
+                                   edgecolors=THEME["border"],
+                                   linewidths=2,
+                                   zorder=2)  # Above grid, below highlights
+        self.ax.add_collection(self.bars)
+        
+        # 0.7 wide bars: 30% padding (0.15 on each side)
+        centers = np.arange(n)
+        self._column_x = (centers - 0.35, centers + 0.35)
+        self._heights = None
+        
+        # Highlights: one collection holding the full-height rectangles of
+        # the lit bars, sliced per frame from the rectangles of all bars
+        self._highlight_quads = self._column_quads(np.zeros(n), np.ones(n))
+        self.highlight_layer = PolyCollection(
+            [],
+            transform=self.ax.get_xaxis_transform(),
+            facecolors=THEME["highlight"],
+            edgecolors='none',
+            alpha=0.3,
+            zorder=3  # Above bars
+        )
+        self.ax.add_collection(self.highlight_layer, autolim=False)
+        self._lit = 0
+    
+    def _build_lod_layers(self, n: int):
+        """Column envelope, mean bars and highlight lines for a long array"""
+        self.lod = True
+        self._bucket = -(-n // self.lod_columns())
+        
+        # Column x extents: bucket j covers elements [j*bucket, (j+1)*bucket)
+        left = np.arange(0, n, self._bucket) - 0.5
+        self._column_x = (left, np.minimum(left + self._bucket, n - 0.5))
+        
+        self.envelope = PolyCollection([], facecolors=THEME["grid"],
+                                       edgecolors='none', zorder=2)
+        self.bars = PolyCollection([], facecolors=THEME["border"],
+                                   edgecolors='none', zorder=2)
+        self.markers = LineCollection([], colors=THEME["highlight"],
+                                      linewidths=2, zorder=3)
+        for collection in (self.envelope, self.bars, self.markers):
+            self.ax.add_collection(collection)
+    
+    def _column_quads(self, bottom: np.ndarray, top: np.ndarray) -> np.ndarray:
+        """(columns, 4, 2) rectangle vertices from bottom to top per column"""
+        left, right = self._column_x
+        return np.stack([
+            np.stack([left, bottom], axis=1),
+            np.stack([left, top], axis=1),
+            np.stack([right, top], axis=1),
+            np.stack([right, bottom], axis=1),
+        ], axis=1)
+    
+    def _update_lod(self, values: np.ndarray, colors: np.ndarray):
+        """Reduce the array to per-column min/max/mean and recolor columns"""
+        n, bucket = len(values), self._bucket
+        columns = len(self._column_x[0])
+        
+        # Pad the last column with NaN so every column reduces the same way
+        padded = np.full(columns * bucket, np.nan)
+        padded[:n] = values
+        grid = padded.reshape(columns, bucket)
+        low, high = np.nanmin(grid, axis=1), np.nanmax(grid, axis=1)
+        mean = np.nanmean(grid, axis=1)
+        
+        self.envelope.set_verts(self._column_quads(low, high))
+        self.bars.set_verts(self._column_quads(np.zeros(columns), mean))
+        
+        # A column takes the color of its first element in an active state
+        state = np.zeros(columns * bucket, dtype=bool)
+        state[:n] = (colors != to_rgba(THEME["bg"])).any(axis=1)
+        state = state.reshape(columns, bucket)
+        active = state.any(axis=1)
+        first = np.minimum(np.arange(columns) * bucket + state.argmax(axis=1), n - 1)
+        self.bars.set_facecolors(np.where(active[:, None], colors[first],
+                                          to_rgba(THEME["border"])))
+        
+        return high.max()
+    
+    def update_bars(self, data: List[int], colors: np.ndarray):
+        """
+        Set bar heights and colors in place
+        
+        Args:
+            data: current data array
+            colors: (n, 4) RGBA array, one row per bar (see ColorState)
+        """
+        values = np.asarray(data, dtype=float)
+        self._values = values
+        
+        if self.lod:
+            self._rescale(self._update_lod(values, colors))
+            return
+        
+        # Vertices only change on writes; colors are one array per frame
+        if self._heights is None or not np.array_equal(values, self._heights):
+            self.bars.set_verts(self._column_quads(np.zeros(len(values)), values))
+            self._heights = values
+        self.bars.set_facecolors(colors)
+        
+        self._rescale(values.max())
+    
+    def _rescale(self, top):
+        """Fit the y-axis to the tallest bar (only when it changes)"""
+        if top != self._top:
+            self.ax.set_ylim(0, top * 1.1)
+            self._top = top
+            self.invalidate_background()
+    
+    def set_highlights(self, indices, highlight_color: str = None):
+        """Show highlight rectangles over exactly these indices"""
+        color = highlight_color or THEME["highlight"]
+        
+        if self.lod:
+            # Exact lines for a few indices; wide ranges already color their columns
+            values = self._values
+            lit = np.arange(len(values))[ColorState.index_key(indices, len(values))]
+            if len(lit) > self.lod_columns():
+                lit = lit[:0]
+            segments = np.zeros((len(lit), 2, 2))
+            segments[:, :, 0] = lit[:, None]
+            segments[:, 1, 1] = values[lit]
+            self.markers.set_segments(segments)
+            self.markers.set_color(color)
+            return
+        
+        # Lit rectangles by the same slice or index array ColorState paints with
+        lit = self._highlight_quads[ColorState.index_key(indices, self._n)]
+        self.highlight_layer.set_verts(lit)
+        self.highlight_layer.set_facecolor(color)
+        self._lit = len(lit)
+    
+    def set_overlay(self, text: str):
+        """Show text in the persistent top overlay (hidden when empty)"""
+        if text != self.overlay.get_text():
+            self.overlay.set_text(text)
+        self.overlay.set_visible(bool(text))
+    
+    def _layer_artists(self) -> List[Any]:
+        """Every dynamic artist, visible or not"""
+        if self.lod:
+            return [self.envelope, self.bars, self.markers, self.overlay]
+        return [self.bars, self.highlight_layer, self.overlay]
+    
+    def _dynamic_artists(self) -> List[Any]:
+        """Visible dynamic artists in drawing order"""
+        if self.lod:
+            artists = [self.envelope, self.bars, self.markers]
+            if self.overlay.get_visible():
+                artists.append(self.overlay)
+            return artists
+        
+        artists = [self.bars]
+        if self._lit:
+            artists.append(self.highlight_layer)
+        if self.overlay.get_visible():
+            artists.append(self.overlay)
+        return artists
+    
+    def render(self, canvas):
+        """
+        Show the current frame: blit the dynamic layers over the cached
+        background, or request a normal redraw when blitting is off, not
+        supported, or there are no persistent layers
+        """
+        if not (self.blit and self.bars is not None
+                and getattr(canvas, "supports_blit", False)):
+            canvas.draw_idle()
+            return
+        
+        if self.cached_background is None:
+            # Full draw with the dynamic layers hidden, then cache it
+            hidden = self._layer_artists()
+            visible = [artist.get_visible() for artist in hidden]
+            for artist in hidden:
+                artist.set_visible(False)
+            canvas.draw()
+            self.cached_background = canvas.copy_from_bbox(self.ax.bbox)
+            for artist, was_visible in zip(hidden, visible):
+                artist.set_visible(was_visible)
+        else:
+            canvas.restore_region(self.cached_background)
+        
+        for artist in self._dynamic_artists():
+            self.ax.draw_artist(artist)
+        canvas.blit(self.ax.bbox)
     
     def draw_bars(self, data: List[int], colors: List[str], 
                   edgecolor: str = None, linewidth: int = 2):
@@ -215,6 +553,7 @@ class SortingVisualizer:
         self.ax = ax
         self.canvas = canvas
         self.renderer = LayeredRenderer(ax)
+        self.colors = ColorState()
         
         # Initialize with background
         self._setup_canvas()
@@ -230,66 +569,58 @@ class SortingVisualizer:
         
         Args:
             data: current data array
-            event: algorithm event describing what to visualize
+            event: AlgorithmEvent or TraceEvent view describing what to visualize
         """
         if not data:
             self._draw_empty_state("NO DATA")
             return
         
-        # Clear and reapply background
-        self.renderer.clear_layers()
+        # Persistent layers are rebuilt only when the array size changes
+        if not self.renderer.has_bar_layers(len(data)):
+            self.renderer.build_bar_layers(len(data), "SORTING VISUALIZATION")
         
         # Determine colors based on event
         colors = self._get_colors_for_event(data, event)
         
-        # Layer 1: Draw bars
-        self.renderer.draw_bars(data, colors)
-        
-        # Layer 2: Add highlights if event specifies
-        if event and event.indices:
-            self.renderer.add_highlights(event.indices, len(data))
+        # Layer 1: Update bars
+        self.renderer.update_bars(data, colors)
         
-        # Layer 3: Set title and labels
-        self.renderer.set_title("SORTING VISUALIZATION")
-        self.renderer.set_labels("INDEX", "VALUE")
+        # Layer 2: Highlights the event specifies
+        self.renderer.set_highlights(event.indices if event else ())
         
-        # Layer 4: Add message if present
-        if event and event.message:
-            self.renderer.add_text_overlay(event.message, 'top')
+        # Layer 3: Message, if present
+        self.renderer.set_overlay(event.message if event else "")
         
-        # Render
-        self.canvas.draw_idle()
+        # Render (blit over the cached background when possible)
+        self.renderer.render(self.canvas)
     
     def _get_colors_for_event(self, data: List[int], 
-                              event: AlgorithmEvent = None) -> List[str]:
+                              event: AlgorithmEvent = None) -> np.ndarray:
         """
-        Determine bar colors based on event type
+        Determine bar colors (RGBA rows) based on event type
         All active operations use GREEN
         """
-        n = len(data)
-        colors = [THEME["bg"]] * n  # Default: neutral
+        colors = self.colors.reset(len(data))  # Default: neutral
         
         if not event:
             return colors
         
+        # Events from a worker lane take the worker's color
+        lane = getattr(event, "lane", None)
+        if lane is not None:
+            self.colors.paint(event.indices, LANE_COLORS[lane % len(LANE_COLORS)])
+            return colors
+        
         # GREEN for all active operations
         if event.event_type in [EventType.COMPARE, EventType.SWAP, 
                                 EventType.HIGHLIGHT, EventType.DIVIDE,
-                                EventType.PIVOT]:
-            for idx in event.indices:
-                if 0 <= idx < n:
-                    colors[idx] = THEME["highlight"]  # GREEN
-        
-        elif event.event_type == EventType.MERGE:
-            for idx in event.indices:
-                if 0 <= idx < n:
-                    colors[idx] = THEME["highlight"]  # GREEN
+                                EventType.PIVOT, EventType.BUILD,
+                                EventType.EXTRACT, EventType.MERGE]:
+            self.colors.paint(event.indices, THEME["highlight"])  # GREEN
         
         elif event.event_type == EventType.SORTED:
             # Light green for sorted elements
-            for idx in event.indices:
-                if 0 <= idx < n:
-                    colors[idx] = THEME["sorted"]
+            self.colors.paint(event.indices, THEME["sorted"])
         
         return colors
     
@@ -309,6 +640,7 @@ class SearchVisualizer:
         self.ax = ax
         self.canvas = canvas
         self.renderer = LayeredRenderer(ax)
+        self.colors = ColorState()
         
         # Initialize with background
         self._setup_canvas()
@@ -324,69 +656,56 @@ class SearchVisualizer:
         
         Args:
             data: current data array
-            event: algorithm event describing what to visualize
+            event: AlgorithmEvent or TraceEvent view describing what to visualize
         """
         if not data:
             self._draw_empty_state("NO DATA")
             return
         
-        # Clear and reapply background
-        self.renderer.clear_layers()
+        # Persistent layers (and index labels) are rebuilt only when the
+        # array size changes
+        if not self.renderer.has_bar_layers(len(data)):
+            self.renderer.build_bar_layers(len(data), "SEARCH VISUALIZATION")
+            if not self.renderer.lod:
+                self.ax.set_xticks(range(len(data)))
+                self.ax.set_xticklabels(range(len(data)), 
+                                       family='Courier', 
+                                       fontsize=8,
+                                       color=THEME["fg"])
         
         # Determine colors based on event
         colors = self._get_colors_for_event(data, event)
         
-        # Layer 1: Draw bars
-        self.renderer.draw_bars(data, colors)
-        
-        # Layer 2: Add highlights
-        if event and event.indices:
-            if event.event_type == EventType.FOUND:
-                # Dark green for found element
-                self.renderer.add_highlights(event.indices, len(data), 
-                                            THEME["found"])
-            else:
-                # Regular green for searching
-                self.renderer.add_highlights(event.indices, len(data))
-        
-        # Layer 3: Set title and labels
-        self.renderer.set_title("SEARCH VISUALIZATION")
-        self.renderer.set_labels("INDEX", "VALUE")
+        # Layer 1: Update bars
+        self.renderer.update_bars(data, colors)
         
-        # Show index labels for search
-        self.ax.set_xticks(range(len(data)))
-        self.ax.set_xticklabels(range(len(data)), 
-                               family='Courier', 
-                               fontsize=8,
-                               color=THEME["fg"])
+        # Layer 2: Highlights - dark green for found, green for searching
+        if event and event.event_type == EventType.FOUND:
+            self.renderer.set_highlights(event.indices, THEME["found"])
+        else:
+            self.renderer.set_highlights(event.indices if event else ())
         
-        # Layer 4: Add message if present
-        if event and event.message:
-            self.renderer.add_text_overlay(event.message, 'top')
+        # Layer 3: Message, if present
+        self.renderer.set_overlay(event.message if event else "")
         
-        # Render
-        self.canvas.draw_idle()
+        # Render (blit over the cached background when possible)
+        self.renderer.render(self.canvas)
     
     def _get_colors_for_event(self, data: List[int], 
-                              event: AlgorithmEvent = None) -> List[str]:
-        """Determine bar colors based on event type"""
-        n = len(data)
-        colors = [THEME["bg"]] * n  # Default: neutral
+                              event: AlgorithmEvent = None) -> np.ndarray:
+        """Determine bar colors (RGBA rows) based on event type"""
+        colors = self.colors.reset(len(data))  # Default: neutral
         
         if not event:
             return colors
         
         # GREEN for searching
         if event.event_type in [EventType.COMPARE, EventType.HIGHLIGHT]:
-            for idx in event.indices:
-                if 0 <= idx < n:
-                    colors[idx] = THEME["searching"]  # GREEN
+            self.colors.paint(event.indices, THEME["searching"])  # GREEN
         
         # Dark green for found
         elif event.event_type == EventType.FOUND:
-            for idx in event.indices:
-                if 0 <= idx < n:
-                    colors[idx] = THEME["found"]
+            self.colors.paint(event.indices, THEME["found"])
         
         return colors
     
@@ -564,55 +883,215 @@ class TreeVisualizer:
 class AnimationPlayer:
     """
     Event-driven animation player
-    Plays back algorithm events with timing control
+    Plays back algorithm events on a fixed frame clock
+    
+    Event k is due `speed` * k seconds after playback starts. Each tick
+    draws only the newest due event: events that fell due while the
+    previous frame was drawing are coalesced into it (their writes are
+    still applied) instead of being drawn late, so a slow draw never makes
+    playback fall further behind. With a Tk root the clock runs on
+    root.after and the caller waits in the Tk event loop, which keeps the
+    UI responsive; without one it runs in a blocking loop.
     """
     
-    def __init__(self, visualizer, update_callback=None):
+    # Weight of the newest frame in the smoothed draw time
+    DRAW_TIME_SMOOTHING = 0.2
+    
+    def __init__(self, visualizer, update_callback=None, root=None):
         """
         Args:
             visualizer: SortingVisualizer or SearchVisualizer instance
-            update_callback: function called after each frame
+            update_callback: function called after each drawn frame
+            root: Tk root driving the frame clock (None: blocking loop)
         """
         self.visualizer = visualizer
         self.update_callback = update_callback
+        self.root = root
         self.is_playing = False
         self.current_event_index = 0
+        self.policy = None  # EmissionPolicy of the events being played
+        self.stopped = False     # playback ended by stop(), not by running out
+        self.frames_drawn = 0
+        self.frames_dropped = 0  # events coalesced into a later frame
+        self.draw_time = 0.0     # smoothed seconds per drawn frame
+        self._done = None        # Tk variable the caller waits on
+        self._after_id = None
+        self._error = None
         
-    def play_events(self, events: List[AlgorithmEvent], speed: float = 0.1):
+    def play_events(self, events: EventTrace, speed: float = 0.1):
         """
         Play algorithm events with animation
         
         Args:
-            events: list of AlgorithmEvent objects
-            speed: delay between frames in seconds
+            events: EventTrace (a frame is rebuilt from its keyframe only
+                when drawn) or list of AlgorithmEvent objects
+            speed: seconds per event on the frame clock
+        """
+        self.policy = getattr(events, "policy", None)
+        total = len(events)
+        
+        def advance(played: int, due: int):
+            # Jump straight to the newest due event; skipped ones cost nothing
+            index = min(due, total) - 1
+            if index < played:
+                return None
+            event = events[index]
+            if event.data_snapshot:
+                self.visualizer.draw_state(event.data_snapshot, event)
+            return index, event, total
+        
+        self._run(advance, speed)
+    
+    def play_stream(self, events: Iterator[AlgorithmEvent], initial: List[int],
+                    speed: float = 0.1, buffer_size: int = 64,
+                    trace: Optional[EventTrace] = None) -> List[int]:
+        """
+        Play events straight from an algorithm generator
+        The first frame is drawn as soon as the first event exists; the
+        rest are pulled on demand, never more than `buffer_size` ahead
+        
+        Args:
+            events: iterator of AlgorithmEvent carrying write deltas
+            initial: array state before the first event
+            speed: seconds per event on the frame clock
+            buffer_size: maximum number of events read ahead
+            trace: optional EventTrace that records every event pulled
+                (its policy is recorded as the player's policy)
+        
+        Returns:
+            array state after the last event that was played
+        """
+        self.policy = trace.policy if trace is not None else None
+        state = list(initial)
+        buffer = deque()
+        
+        def advance(played: int, due: int):
+            # Apply every due event's writes, draw only the last one
+            event, index = None, played
+            while index < due:
+                if not buffer:
+                    # Only one event is needed to show the first frame
+                    chunk = 1 if index == 0 else buffer_size
+                    for pulled in islice(events, chunk):
+                        if trace is not None:
+                            trace.append(pulled)
+                        buffer.append(pulled)
+                    if not buffer:
+                        break
+                
+                event = buffer.popleft()
+                if event.writes:
+                    for position, value in event.writes:
+                        state[position] = value
+                elif event.data_snapshot is not None:
+                    state[:] = event.data_snapshot
+                index += 1
+            
+            if event is None:
+                return None
+            self.visualizer.draw_state(state, event)
+            
+            # Total is unknown while the generator is still running
+            return index - 1, event, None
+        
+        self._run(advance, speed)
+        return state
+    
+    def _run(self, advance, speed: float):
+        """
+        Drive advance(played, due) on the frame clock until it returns None
+        or playback is stopped
+        
+        advance plays events [played, due) (drawing the last one) and
+        returns (index of the drawn event, event, total) or None when no
+        events are left.
         """
         self.is_playing = True
+        self.stopped = False
         self.current_event_index = 0
+        self.frames_drawn = 0
+        self.frames_dropped = 0
+        self._error = None
+        start = time.perf_counter()
+        played = 0
         
-        for i, event in enumerate(events):
+        def tick():
+            nonlocal played
+            self._after_id = None
             if not self.is_playing:
-                break
+                return
             
-            self.current_event_index = i
+            try:
+                # Events due by now; at least one so every tick makes progress
+                now = time.perf_counter()
+                due = played + 1
+                if speed > 0:
+                    due = max(due, int((now - start) / speed) + 1)
+                
+                result = advance(played, due)
+                if result is None:
+                    self._finish()
+                    return
+                
+                index, event, total = result
+                self.frames_dropped += index - played
+                played = index + 1
+                self.current_event_index = index
+                
+                # Callback for status updates
+                if self.update_callback:
+                    self.update_callback(event, index, total)
+                
+                elapsed = time.perf_counter() - now
+                self.draw_time += self.DRAW_TIME_SMOOTHING * (elapsed - self.draw_time)
+                self.frames_drawn += 1
+            except Exception as e:
+                self._error = e
+                self._finish()
+                return
             
-            # Draw current event state
-            if event.data_snapshot:
-                self.visualizer.draw_state(event.data_snapshot, event)
+            # Next event's slot on the fixed clock (immediately if already late)
+            return max(0.0, start + played * speed - time.perf_counter())
+        
+        if self.root is None:
+            while self.is_playing:
+                delay = tick()
+                if delay:
+                    time.sleep(delay)
+        else:
+            import tkinter as tk
+            self._done = tk.BooleanVar(master=self.root, value=False)
             
-            # Callback for status updates
-            if self.update_callback:
-                self.update_callback(event, i, len(events))
+            def scheduled():
+                delay = tick()
+                if delay is not None and self.is_playing:
+                    # At least 1 ms, so pending redraws run between frames
+                    self._after_id = self.root.after(max(1, int(delay * 1000)), scheduled)
             
-            # Timing delay
-            import time
-            time.sleep(speed)
+            self._after_id = self.root.after(0, scheduled)
+            self.root.wait_variable(self._done)
+            self._done = None
         
         self.is_playing = False
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+    
+    def _finish(self):
+        """End playback and release a caller waiting in the Tk event loop"""
+        self.is_playing = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        if self._done is not None:
+            self._done.set(True)
     
     def stop(self):
         """Stop animation playback"""
-        self.is_playing = False
+        if self.is_playing:
+            self.stopped = True
+        self._finish()
     
     def is_running(self) -> bool:
         """Check if animation is running"""
-        return self.is_playing
\ No newline at end of file
+        return self.is_playing